@@ -0,0 +1,210 @@
+import json
+from typing import Annotated
+
+import typer
+
+from mkcli.core import mappings
+from mkcli.core.enums import Format
+from mkcli.core.exceptions import AuthorizationError
+from mkcli.core.mk8s import MK8SClient
+from mkcli.core.models import Context
+from mkcli.core.session import get_auth_adapter, open_context_catalogue
+from mkcli.settings import APP_SETTINGS
+from mkcli.utils import cache as mapping_cache
+from mkcli.utils import console
+from mkcli.utils.concurrency import fan_out
+
+_HELP: dict = {
+    "general": "Manage the cache of regions, flavors and Kubernetes versions",
+    "warm": "Prefetch regions, flavors and Kubernetes versions into the cache",
+    "stats": "Show cache statistics per cached function",
+    "inspect": "Show a cached entry",
+    "purge": "Remove cached entries",
+    "all_contexts": "Warm the cache for every auth context, not only the current one",
+    "key": "Cache key (or its unique prefix) as listed by `mkcli cache inspect`",
+    "function": "Only purge entries of given cached function",
+    "format": "Output format, either 'table' or 'json'",
+}
+
+STATS_COLUMNS: list[str] = [
+    "Function",
+    "Entries",
+    "Size (KB)",
+    "Oldest (s)",
+    "Newest (s)",
+    "Hits",
+    "Stale Hits",
+    "Misses",
+    "Evictions",
+]
+
+app = typer.Typer(no_args_is_help=True, help=_HELP["general"])
+
+
+def _warm_context(ctx: Context) -> dict:
+    try:
+        client = MK8SClient(get_auth_adapter(ctx), ctx.mk8s_api_url)
+        return {"context": ctx.name, **mappings.warm_mappings(client)}
+    except (Exception, AuthorizationError) as err:
+        return {"context": ctx.name, "error": str(err)}
+
+
+@app.command(help=_HELP["warm"])
+def warm(
+    all_contexts: Annotated[
+        bool, typer.Option("--all-contexts", help=_HELP["all_contexts"])
+    ] = False,
+    format: Format = typer.Option(
+        default=APP_SETTINGS.default_format, help=_HELP["format"]
+    ),
+):
+    """Prefetch catalogue mappings into the cache"""
+    with open_context_catalogue() as cat:
+        contexts = cat.list_all() if all_contexts else [cat.current_context]
+        results = fan_out(_warm_context, contexts)
+
+    match format:
+        case Format.TABLE:
+            table = console.ResourceTable(
+                title="Warmed Cache",
+                columns=["Context", "Regions", "Kubernetes Versions", "Flavors"],
+            )
+            for result in results:
+                if "error" in result:
+                    table.add_row([result["context"], f"Error: {result['error']}"])
+                    continue
+                table.add_row(
+                    [
+                        result["context"],
+                        result["regions"],
+                        result["kubernetes_versions"],
+                        result["machine_specs"],
+                    ]
+                )
+            table.display()
+        case Format.JSON:
+            console.display(json.dumps({"contexts": results}, indent=2))
+
+    if not APP_SETTINGS.resource_mappings_cache:
+        console.display_diagnostic(
+            "[bold yellow]The cache is disabled, set MKCLI_RESOURCE_MAPPINGS_CACHE=true "
+            "to use the warmed entries.[/bold yellow]"
+        )
+
+
+def _collect_stats() -> dict[str, dict]:
+    backend = mapping_cache.get_backend()
+    stats: dict[str, dict] = {}
+    for func, counters in backend.stats().items():
+        stats.setdefault(func, {"entries": 0, "size": 0, "ages": []}).update(counters)
+    for info in backend.info():
+        func_stats = stats.setdefault(info.func, {"entries": 0, "size": 0, "ages": []})
+        func_stats["entries"] += 1
+        func_stats["size"] += info.size
+        func_stats["ages"].append(mapping_cache.now() - info.stored_at)
+    for func_stats in stats.values():
+        ages = func_stats.pop("ages")
+        func_stats["oldest"] = round(max(ages), 1) if ages else None
+        func_stats["newest"] = round(min(ages), 1) if ages else None
+    return stats
+
+
+@app.command(help=_HELP["stats"])
+def stats(
+    format: Format = typer.Option(
+        default=APP_SETTINGS.default_format, help=_HELP["format"]
+    ),
+):
+    """Show cache statistics"""
+    collected = _collect_stats()
+
+    match format:
+        case Format.TABLE:
+            table = console.ResourceTable(
+                title="Cache Statistics", columns=STATS_COLUMNS
+            )
+            for func, s in sorted(collected.items()):
+                table.add_row(
+                    [
+                        func,
+                        s["entries"],
+                        f"{s['size'] / 1024:.1f}",
+                        s["oldest"] if s["oldest"] is not None else "-",
+                        s["newest"] if s["newest"] is not None else "-",
+                        s.get("hits", 0),
+                        s.get("stale_hits", 0),
+                        s.get("misses", 0),
+                        s.get("evictions", 0),
+                    ]
+                )
+            table.display()
+            console.display(f"Cache backend: {mapping_cache.get_backend()}")
+        case Format.JSON:
+            console.display(json.dumps({"functions": collected}, indent=2))
+
+
+@app.command(help=_HELP["inspect"])
+def inspect(
+    key: Annotated[str | None, typer.Argument(help=_HELP["key"])] = None,
+):
+    """Show a cached entry, or list all cache keys when no key is given"""
+    backend = mapping_cache.get_backend()
+    infos = backend.info()
+
+    if key is None:
+        table = console.ResourceTable(
+            title="Cache Entries", columns=["Key", "Function", "Size (B)", "Age (s)"]
+        )
+        for info in sorted(infos, key=lambda i: (i.func, i.stored_at)):
+            age = round(mapping_cache.now() - info.stored_at, 1)
+            table.add_row([info.key, info.func, info.size, age])
+        table.display()
+        return
+
+    matches = [info for info in infos if info.key.startswith(key)]
+    if len(matches) != 1:
+        reason = "not found" if not matches else "is ambiguous"
+        console.display(f"[bold red]Cache key '{key}' {reason}.[/bold red]")
+        raise typer.Exit(code=1)
+
+    info = matches[0]
+    entry = backend.get(info.key)
+    console.display_json(
+        json.dumps(
+            {
+                "key": info.key,
+                "function": entry.func,
+                "size": info.size,
+                "stored_at": entry.stored_at,
+                "accessed_at": entry.accessed_at,
+                "age": round(mapping_cache.now() - entry.stored_at, 1),
+                "value": mapping_cache.normalize(entry.value),
+            }
+        )
+    )
+
+
+@app.command(help=_HELP["purge"])
+def purge(
+    function: Annotated[
+        str | None, typer.Option("--function", help=_HELP["function"])
+    ] = None,
+    auto_confirm: Annotated[bool, typer.Option("--confirm", "-y")] = False,
+):
+    """Remove cached entries"""
+    scope = f"cached '{function}' entries" if function else "all cached entries"
+    confirmed = auto_confirm or typer.confirm(
+        f"Are you sure you want to remove {scope}?"
+    )
+    if not confirmed:
+        console.display("Aborted.")
+        return
+
+    backend = mapping_cache.get_backend()
+    if function is None:
+        backend.clear()
+    else:
+        for info in backend.info():
+            if info.func == function:
+                backend.delete(info.key)
+    console.display(f"[bold green]Removed {scope}.[/bold green]")
@@ -8,8 +8,10 @@ from mkcli.core.enums import Format
 from mkcli.core.exceptions import FlavorNotFound, K8sVersionNotFound
 from mkcli.core.mk8s import MK8SClient
 from mkcli.core.models import ClusterPayload, Cluster
+from mkcli.core.models.node_pool import NodePool
 from mkcli.core.session import get_auth_adapter, open_context_catalogue
-from mkcli.utils import console
+from mkcli.utils import console, stopwatch
+from mkcli.utils.concurrency import fan_out
 from mkcli.settings import DefaultClusterSettings, APP_SETTINGS
 from mkcli.core import mappings
 
@@ -31,6 +33,8 @@ _HELP: dict = {
     "from_json": "Cluster payload in JSON format, if None, use provided options",
     "dry_run": "If True, do not perform any actions, just print the payload",
     "format": "Output format, either 'table' or 'json'",
+    "with_node_pools": "Fetch node pools of every listed cluster concurrently",
+    "workers": "Max number of concurrent node-pool requests (1 = serial)",
 }
 
 app = typer.Typer(no_args_is_help=True, help=_HELP["general"])
@@ -74,10 +78,9 @@ def create(
         with open_context_catalogue() as cat:
             ctx = cat.current_context
             client = MK8SClient(get_auth_adapter(ctx), ctx.mk8s_api_url)
-            k8sv_map = mappings.get_kubernetes_versions_mapping(client)
-            region_map = mappings.get_regions_mapping(client)
-            region = region_map[ctx.region]
-            flavor_map = mappings.get_machine_spec_mapping(client, region.id)
+            catalogue = mappings.prefetch_mappings(client, ctx.region)
+            k8sv_map = catalogue.kubernetes_versions
+            flavor_map = catalogue.machine_specs
             flavor = flavor_map.get(master_flavor)
 
         if flavor is None:
@@ -183,6 +186,12 @@ def _list(
     format: Format = typer.Option(
         default=APP_SETTINGS.default_format, help=_HELP["format"]
     ),
+    with_node_pools: Annotated[
+        bool, typer.Option("--with-node-pools", help=_HELP["with_node_pools"])
+    ] = False,
+    workers: Annotated[
+        int, typer.Option(min=1, help=_HELP["workers"])
+    ] = APP_SETTINGS.max_workers,
 ):
     """List all clusters"""
     with open_context_catalogue() as cat:
@@ -190,6 +199,19 @@ def _list(
         client = MK8SClient(get_auth_adapter(ctx), ctx.mk8s_api_url)
         clusters = client.get_clusters(region=ctx.region)
 
+        if with_node_pools:
+            with stopwatch() as watch:
+                node_pools = fan_out(
+                    lambda c: client.list_node_pools(c.id), clusters, workers
+                )
+            if APP_SETTINGS.verbose:
+                console.display_diagnostic(
+                    f"Fetched node pools of {len(clusters)} clusters "
+                    f"in {watch.elapsed:.3f}s ({workers} workers)"
+                )
+            _display_with_node_pools(clusters, node_pools, format)
+            return
+
         match format:
             case Format.TABLE:
                 table = console.ResourceTable(
@@ -209,6 +231,38 @@ def _list(
                 )
 
 
+def _display_with_node_pools(
+    clusters: list[Cluster], node_pools: list[list[NodePool]], format: Format
+) -> None:
+    match format:
+        case Format.TABLE:
+            table = console.ResourceTable(
+                title="Kubernetes Clusters and Node Pools",
+                columns=["Cluster", *NodePool.table_columns],
+            )
+            for cluster, pools in zip(clusters, node_pools):
+                if not pools:
+                    table.add_row([cluster.name, "-"])
+                for np in pools:
+                    table.add_row([cluster.name, *np.as_table_row()])
+            table.display()
+        case Format.JSON:
+            console.display(
+                json.dumps(
+                    {
+                        "clusters": [
+                            {
+                                **c.model_dump(),
+                                "node_pools": [np.model_dump() for np in pools],
+                            }
+                            for c, pools in zip(clusters, node_pools)
+                        ]
+                    },
+                    indent=2,
+                )
+            )
+
+
 @app.command(help=_HELP["show"])
 def show(
     cluster_id: Annotated[str, typer.Argument(help="Cluster ID")],
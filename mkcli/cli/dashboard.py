@@ -21,7 +21,8 @@ def dashboard():
     """Start the dashboard"""
     with open_context_catalogue() as cat:
         ctx = cat.current_context
-        client = MK8SClient(get_auth_adapter(ctx), ctx.mk8s_api_url)
+        auth = get_auth_adapter(ctx)
+        client = MK8SClient(auth, ctx.mk8s_api_url)
 
         console = get_console()
         dashboard_instance = Dashboard(
@@ -29,4 +30,8 @@ def dashboard():
             func_clusters_sync=lambda: client.get_clusters(),
             func_node_pools_sync=lambda x: client.list_node_pools(x),
         )
-        dashboard_instance.go_live()
+        auth.start_background_refresh()
+        try:
+            dashboard_instance.go_live()
+        finally:
+            auth.stop_background_refresh()
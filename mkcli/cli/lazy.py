@@ -0,0 +1,80 @@
+import importlib
+from dataclasses import dataclass
+from typing import ClassVar
+
+import click
+import typer
+import typer.core
+import typer.main
+
+from mkcli.utils.profiling import span
+
+
+@dataclass(frozen=True)
+class LazySubcommand:
+    """Typer app registered by import path, see LazyGroup."""
+
+    module: str  # module defining `app`
+    help: str
+    no_args_is_help: bool = True
+
+
+class LazyGroup(typer.core.TyperGroup):
+    """Typer Group subclass importing subcommand modules only when they are needed.
+
+    Subclasses list their subcommands in `lazy_subcommands`. The group's own help
+    and shell completion show placeholders built from the registered help, so
+    `mkcli --help` or `mkcli --version` do not import any command module.
+    """
+
+    lazy_subcommands: ClassVar[dict[str, LazySubcommand]] = {}
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._loaded: dict[str, click.Command] = {}
+        self._formatting_help = False
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return [*super().list_commands(ctx), *self.lazy_subcommands]
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        lazy = self.lazy_subcommands.get(cmd_name)
+        if lazy is None:
+            return super().get_command(ctx, cmd_name)
+        if self._formatting_help or ctx.resilient_parsing:  # listing or completion
+            return self._loaded.get(cmd_name) or typer.core.TyperGroup(
+                name=cmd_name, help=lazy.help
+            )
+        return self.load(cmd_name)
+
+    def resolve_command(
+        self, ctx: click.Context, args: list[str]
+    ) -> tuple[str | None, click.Command | None, list[str]]:
+        cmd_name, cmd, args = super().resolve_command(ctx, args)
+        if cmd_name in self.lazy_subcommands:
+            cmd = self.load(cmd_name)  # also when completing its subcommands
+        return cmd_name, cmd, args
+
+    def format_help(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
+        self._formatting_help = True
+        try:
+            super().format_help(ctx, formatter)
+        finally:
+            self._formatting_help = False
+
+    def load(self, cmd_name: str) -> click.Command:
+        """Import the subcommand's module and build its click group."""
+        if cmd_name not in self._loaded:
+            lazy = self.lazy_subcommands[cmd_name]
+            with span(f"import {lazy.module}", "import"):
+                app = importlib.import_module(lazy.module).app
+            # same as `cli.add_typer(app, ...)`, resolved through a single-use parent
+            parent = typer.Typer()
+            parent.add_typer(
+                app,
+                name=cmd_name,
+                help=lazy.help,
+                no_args_is_help=lazy.no_args_is_help,
+            )
+            self._loaded[cmd_name] = typer.main.get_group(parent).commands[cmd_name]
+        return self._loaded[cmd_name]
@@ -1,16 +1,20 @@
+import datetime
+import hashlib
 import os
-import webbrowser
-from typing import Dict, Optional, Protocol
+import threading
+from typing import TYPE_CHECKING, Dict, Optional, Protocol
 
-from keycloak import KeycloakOpenID
-from rich.progress import Progress, SpinnerColumn, TextColumn
 from loguru import logger
 
-from .callback import CallbackServer
 from .models import Context, Token
+from .token_cache import TokenCache
 from mkcli.utils import wait_until
+from mkcli.utils.profiling import profiled
 from mkcli.core.exceptions import AuthorizationError
 
+if TYPE_CHECKING:
+    from keycloak import KeycloakOpenID
+
 
 class AuthProtocol(Protocol):
     def initialize(self) -> None: ...
@@ -19,6 +23,32 @@ class AuthProtocol(Protocol):
 
     def validate(self) -> None: ...
 
+    @property
+    def identity(self) -> str:
+        """Stable, non-secret identifier of the credentials used by the adapter."""
+        ...
+
+    @property
+    def context_name(self) -> str: ...
+
+    @property
+    def rate_limits(self) -> Optional[dict]:
+        """Context overrides of AppSettings.rate_limits."""
+        ...
+
+    def reauthenticate(self) -> bool:
+        """Replace credentials rejected by the API, False if they cannot be replaced."""
+        ...
+
+    def start_background_refresh(self) -> None:
+        """Keep credentials fresh from a background thread (long-running commands)."""
+        ...
+
+    def stop_background_refresh(self) -> None: ...
+
+
+REFRESH_RETRY_DELAY: float = 30.0  # seconds, after a failed background refresh
+
 
 class APIKeyAdapter:
     def __init__(self, ctx: Context) -> None:
@@ -36,11 +66,36 @@ class APIKeyAdapter:
         if not self.ctx.api_key:
             raise AuthorizationError("API Key is not set")
 
+    @property
+    def identity(self) -> str:
+        digest = hashlib.sha256((self.ctx.api_key or "").encode()).hexdigest()
+        return f"api_key:{digest}"
+
+    @property
+    def context_name(self) -> str:
+        return self.ctx.name
+
+    @property
+    def rate_limits(self) -> Optional[dict]:
+        return self.ctx.rate_limits
+
+    def reauthenticate(self) -> bool:
+        return False  # a rejected API key stays rejected, fail fast
+
+    def start_background_refresh(self) -> None:
+        pass  # API keys do not expire
+
+    def stop_background_refresh(self) -> None:
+        pass
+
 
 class OpenIDAdapter:
     def __init__(self, ctx: Context):
         self._ctx = ctx  # Note(EA): I dont like that auth adapter changes smth in ctx (token attrs values)
-        self._keycloak_openid: Optional[KeycloakOpenID] = None
+        self._keycloak_openid: Optional["KeycloakOpenID"] = None
+        self._refresh_lock = threading.Lock()
+        self._refresher: Optional[threading.Timer] = None
+        self._refresh_in_background: bool = False
 
     def initialize(self) -> None:
         self.renew_token()
@@ -50,30 +105,127 @@ class OpenIDAdapter:
             raise AuthorizationError("Token is not set")
 
     def get_auth_header(self) -> Dict[str, str | None]:
-        if not self.token.access_token:
+        token = self._ctx.token
+        if self._refresh_in_background and token is not None and token.is_valid():
+            access_token = token.access_token  # kept fresh by the background refresher
+        else:
+            access_token = self.token.access_token
+        if not access_token:
             raise AuthorizationError("Token is not set")
         return {
-            "authorization": f"Bearer {self.token.access_token}",
+            "authorization": f"Bearer {access_token}",
         }
 
+    def reauthenticate(self) -> bool:
+        """Replace an access token rejected by the API, e.g. revoked before its expiry"""
+        with self._refresh_lock:
+            rejected = self._ctx.token.access_token if self._ctx.token else None
+            cached = self.token_cache.fresh()
+            if cached is not None and cached.access_token != rejected:
+                self._ctx.token = cached
+            elif (
+                self._ctx.token is not None and self._ctx.token.is_refresh_token_valid()
+            ):
+                self._renew_token_with_refresh_token()
+            else:
+                self.renew_token()
+        return True
+
+    def start_background_refresh(self) -> None:
+        """
+        Refresh the token from a daemon timer at its `renew_after`, so long-running
+        commands (dashboard) never wait for Keycloak while rendering.
+        The token object is swapped in a single assignment, readers see either one.
+        """
+        if not self._refresh_in_background:
+            self._refresh_in_background = True
+            self._schedule_refresh()
+
+    def stop_background_refresh(self) -> None:
+        self._refresh_in_background = False
+        if self._refresher is not None:
+            self._refresher.cancel()
+            self._refresher = None
+
+    def _schedule_refresh(self, delay: float | None = None) -> None:
+        token = self._ctx.token
+        if not self._refresh_in_background:
+            return
+        if delay is None:
+            if token is None or token.renew_after is None:
+                return
+            now = datetime.datetime.now(tz=datetime.timezone.utc)
+            delay = max(0.0, (token.renew_after - now).total_seconds())
+        self._refresher = threading.Timer(delay, self._background_refresh)
+        self._refresher.daemon = True
+        self._refresher.start()
+
+    def _background_refresh(self) -> None:
+        if not self._ctx.token.is_refresh_token_valid():
+            logger.warning(
+                "Refresh token expired for context {}, log in again.", self._ctx.name
+            )
+            self._refresh_in_background = False
+            return
+        try:
+            with self._refresh_lock:
+                self._renew_token_with_refresh_token()
+        except Exception as err:
+            logger.warning("Background token refresh failed: {}", err)
+            self._schedule_refresh(REFRESH_RETRY_DELAY)
+            return
+        self._schedule_refresh()
+
     def clear(self) -> None:
         self._ctx.token = Token()
+        self.token_cache.clear()
+
+    @property
+    def identity(self) -> str:
+        return (
+            f"openid:{self._ctx.identity_server_url}:{self._ctx.realm}:{self._ctx.name}"
+        )
+
+    @property
+    def context_name(self) -> str:
+        return self._ctx.name
 
     @property
+    def rate_limits(self) -> Optional[dict]:
+        return self._ctx.rate_limits
+
+    @property
+    def token_cache(self) -> TokenCache:
+        return TokenCache(self.identity)
+
+    @property
+    @profiled("OpenIDAdapter.token", "auth")
     def token(self) -> Token:
         if self._ctx.token is None:
             self._ctx.token = Token()
         if self._ctx.token.should_be_renew():
-            if self._ctx.token.is_refresh_token_valid():
-                self._renew_token_with_refresh_token()
-            else:
-                self.renew_token()
+            with self._refresh_lock:  # may race the background refresher
+                if self._ctx.token.should_be_renew():
+                    self._renew()
+        return self._ctx.token
+
+    def _renew(self) -> None:
+        cached = self.token_cache.fresh()
+        if cached is not None:  # already refreshed by another mkcli process
+            self._ctx.token = cached
+        elif self._ctx.token.is_refresh_token_valid():
+            self._renew_token_with_refresh_token()
+        else:
+            self.renew_token()
         return self._ctx.token
 
     @property
-    def keycloak_openid(self) -> KeycloakOpenID:
+    def keycloak_openid(self) -> "KeycloakOpenID":
         if self._keycloak_openid:
             return self._keycloak_openid
+        # keycloak (and requests) take ~200ms to import, only needed to talk to the IdP
+        from keycloak import KeycloakOpenID
+
         self._keycloak_openid = KeycloakOpenID(
             server_url=self._ctx.identity_server_url,
             client_id=self._ctx.client_id,
@@ -85,10 +237,23 @@ class OpenIDAdapter:
         logger.debug(
             "Renewing token with refresh token for context: {}", self._ctx.name
         )
-        response = self.keycloak_openid.refresh_token(self._ctx.token.refresh_token)  # type: ignore
-        self._ctx.token = Token.load_from_response(response)
+        refresh_token = self._ctx.token.refresh_token
+
+        def renew() -> Token:
+            response = self.keycloak_openid.refresh_token(refresh_token)  # type: ignore
+            return Token.load_from_response(response)
+
+        self._ctx.token = self.token_cache.refresh(
+            renew, rejected=self._ctx.token.access_token
+        )
 
     def renew_token(self) -> None:
+        import webbrowser
+
+        from rich.progress import Progress, SpinnerColumn, TextColumn
+
+        from .callback import CallbackServer
+
         logger.debug("Renewing token for context: {}", self._ctx.name)
         with CallbackServer() as s:
             if not wait_until(s.ready, 5, 0.02):
@@ -110,3 +275,4 @@ class OpenIDAdapter:
                     redirect_uri=f"{s.base_url}/callback",
                 )
             self._ctx.token = Token.load_from_response(resp)
+            self.token_cache.store(self._ctx.token)
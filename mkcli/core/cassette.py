@@ -0,0 +1,215 @@
+import asyncio
+import base64
+import gzip
+import json
+import re
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import IO, Any
+
+import httpx
+from loguru import logger
+
+# not replayable as recorded: the body is stored decoded, cookies are not stored
+SKIPPED_HEADERS: frozenset[str] = frozenset(
+    {"content-encoding", "content-length", "transfer-encoding", "set-cookie"}
+)
+
+# responses carrying credentials: new API keys and kubeconfig files
+SECRET_PATHS = re.compile(r"/token$|/cluster/[^/]+/(files|refresh-kubeconfig)$")
+REDACTED: str = "REDACTED"
+
+
+def redact(value: Any) -> Any:
+    """The JSON value with every string replaced, keeping its structure"""
+    if isinstance(value, dict):
+        return {key: redact(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [redact(item) for item in value]
+    return REDACTED if isinstance(value, str) else value
+
+
+class CassetteMiss(httpx.TransportError):
+    """No recorded response for the request."""
+
+
+@dataclass
+class Interaction:
+    """Recorded response to a request, matched by method and path (with query)"""
+
+    method: str
+    path: str
+    status: int
+    headers: list[tuple[str, str]]
+    body: str
+    base64: bool  # body is base64 encoded binary data
+    elapsed: float  # seconds the real API took to respond
+
+    @property
+    def key(self) -> tuple[str, str]:
+        return self.method, self.path
+
+    @classmethod
+    def from_exchange(
+        cls, request: httpx.Request, response: httpx.Response, elapsed: float
+    ) -> "Interaction":
+        try:
+            body, is_base64 = response.content.decode(), False
+        except UnicodeDecodeError:
+            body, is_base64 = base64.b64encode(response.content).decode(), True
+        if SECRET_PATHS.search(request.url.path):
+            try:
+                body = json.dumps(redact(json.loads(body)))
+            except ValueError:
+                body = REDACTED
+            is_base64 = False
+        return cls(
+            method=request.method,
+            path=request.url.raw_path.decode(),
+            status=response.status_code,
+            headers=[
+                (name, value)
+                for name, value in response.headers.items()
+                if name.lower() not in SKIPPED_HEADERS
+            ],
+            body=body,
+            base64=is_base64,
+            elapsed=round(elapsed, 4),
+        )
+
+    def to_response(self, request: httpx.Request) -> httpx.Response:
+        content = base64.b64decode(self.body) if self.base64 else self.body.encode()
+        return httpx.Response(
+            self.status, headers=self.headers, content=content, request=request
+        )
+
+
+class Cassette:
+    """
+    Request/response pairs stored as JSON lines (gzip compressed for *.gz paths).
+    Request headers and bodies are never stored. Responses carrying credentials
+    (API keys, kubeconfig files) are redacted, see SECRET_PATHS; all other
+    response bodies are stored as received, e.g. cluster names and addresses.
+
+    On replay, responses to the same method and path are served in recorded order;
+    the last one is repeated once they run out (e.g. for polling loops).
+    """
+
+    def __init__(self, path: Path | str) -> None:
+        self.path = Path(path).expanduser()
+        self._lock = threading.Lock()
+        self._recording: bool = False
+        self._tapes: dict[tuple[str, str], deque[Interaction]] | None = None
+
+    def _open(self, mode: str) -> IO[str]:
+        if self.path.suffix == ".gz":
+            return gzip.open(self.path, f"{mode}t", encoding="utf-8")
+        return self.path.open(mode, encoding="utf-8")
+
+    def record(self, interaction: Interaction) -> None:
+        """Append the interaction, the first one of a process replaces the old file"""
+        line = json.dumps(asdict(interaction), separators=(",", ":"))
+        with self._lock:
+            mode = "a" if self._recording else "w"
+            if not self._recording:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._recording = True
+            with self._open(mode) as file:
+                file.write(line + "\n")
+
+    def load(self) -> list[Interaction]:
+        with self._open("r") as file:
+            return [
+                Interaction(**{**data, "headers": [tuple(h) for h in data["headers"]]})
+                for data in map(json.loads, filter(str.strip, file))
+            ]
+
+    def play(self, request: httpx.Request) -> Interaction:
+        key = (request.method, request.url.raw_path.decode())
+        with self._lock:
+            if self._tapes is None:
+                self._tapes = {}
+                for interaction in self.load():
+                    self._tapes.setdefault(interaction.key, deque()).append(interaction)
+            tape = self._tapes.get(key)
+            if not tape:
+                raise CassetteMiss(
+                    f"No recorded response to {' '.join(key)} in {self.path}",
+                    request=request,
+                )
+            return tape.popleft() if len(tape) > 1 else tape[0]
+
+    def __repr__(self):
+        return f"Cassette(path={self.path})"
+
+
+class RecordTransport(httpx.BaseTransport):
+    """Saves every response of the wrapped transport to a cassette."""
+
+    def __init__(self, transport: httpx.BaseTransport, cassette: Cassette) -> None:
+        self.transport = transport
+        self.cassette = cassette
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        started = time.monotonic()
+        response = self.transport.handle_request(request)
+        response.read()
+        self.cassette.record(
+            Interaction.from_exchange(request, response, time.monotonic() - started)
+        )
+        return response
+
+    def close(self) -> None:
+        self.transport.close()
+
+
+class AsyncRecordTransport(httpx.AsyncBaseTransport):
+    """Asynchronous counterpart of RecordTransport."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, cassette: Cassette) -> None:
+        self.transport = transport
+        self.cassette = cassette
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        started = time.monotonic()
+        response = await self.transport.handle_async_request(request)
+        await response.aread()
+        self.cassette.record(
+            Interaction.from_exchange(request, response, time.monotonic() - started)
+        )
+        return response
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+class ReplayTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """
+    Serves responses from a cassette instead of the network (sync and async).
+
+    :param latency: seconds every response is delayed by,
+        None = as long as the recorded request took
+    """
+
+    def __init__(self, cassette: Cassette, latency: float | None = 0.0) -> None:
+        self.cassette = cassette
+        self.latency = latency
+
+    def _delay(self, interaction: Interaction) -> float:
+        return interaction.elapsed if self.latency is None else self.latency
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        interaction = self.cassette.play(request)
+        if delay := self._delay(interaction):
+            time.sleep(delay)
+        logger.debug(f"Replaying {request.method} {request.url} from {self.cassette}")
+        return interaction.to_response(request)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        interaction = self.cassette.play(request)
+        if delay := self._delay(interaction):
+            await asyncio.sleep(delay)
+        return interaction.to_response(request)
@@ -9,3 +9,9 @@ class Format(str, Enum):
 class SupportedAuthTypes(str, Enum):
     API_KEY = "api_key"
     OPENID = "openid"
+
+
+class ProfileFormat(str, Enum):
+    TABLE = "table"
+    JSON = "json"
+    CHROME = "chrome"  # trace-event file, for chrome://tracing or ui.perfetto.dev
@@ -64,3 +64,24 @@ class AuthorizationError(BaseException):
 
     def __init__(self, message: str | None = None):
         super().__init__(message or "You are not authorized.")
+
+
+class APICallError(Exception):
+    """Custom exception for API call errors."""
+
+    def __init__(self, status_code: int, message: str):
+        _msg = f"API call failed with status code {status_code}: {message}"
+        self.code = status_code
+        super().__init__(_msg)
+
+
+class APIResponseFormattingError(Exception):
+    """Custom exception for API response formatting errors."""
+
+    ...
+
+
+class WAFException(Exception):
+    """Web Application Firewall Exception."""
+
+    ...
@@ -1,9 +1,11 @@
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from mkcli.core.mk8s import MK8SClient
 from typing import Dict
 from mkcli.core.models import MachineSpec, KubernetesVersion, Region
+from mkcli.settings import APP_SETTINGS
 from mkcli.utils.cache import cache
-
-type seconds = int
+from mkcli.utils.concurrency import fan_out
 
 
 type KubernetesVersionMapping = Dict[str, KubernetesVersion]
@@ -11,7 +13,17 @@ type RegionNameIdMapping = Dict[str, Region]
 type MachineSpecMapping = Dict[str, MachineSpec]
 
 
-@cache()
+@dataclass(frozen=True)
+class CatalogueMappings:
+    """Catalogue lookups needed to build a cluster payload, resolved together."""
+
+    kubernetes_versions: KubernetesVersionMapping
+    regions: RegionNameIdMapping
+    region: Region
+    machine_specs: MachineSpecMapping
+
+
+@cache(ttl=APP_SETTINGS.kubernetes_versions_cache_ttl)
 def get_kubernetes_versions_mapping(client: MK8SClient) -> KubernetesVersionMapping:
     versions = client.list_kubernetes_versions()
     return {
@@ -26,13 +38,13 @@ def get_kubernetes_versions_mapping(client: MK8SClient) -> KubernetesVersionMapp
     }
 
 
-@cache()
+@cache(ttl=APP_SETTINGS.regions_cache_ttl)
 def get_regions_mapping(client: MK8SClient) -> RegionNameIdMapping:
     regions = client.list_regions()
     return {region.name: region for region in regions}
 
 
-@cache()
+@cache(ttl=APP_SETTINGS.machine_specs_cache_ttl)
 def get_machine_spec_mapping(client: MK8SClient, region_id: str) -> MachineSpecMapping:
     machine_specs = client.list_machine_specs(region_id)
     return {
@@ -50,3 +62,43 @@ def get_machine_spec_mapping(client: MK8SClient, region_id: str) -> MachineSpecM
         )
         for machine in machine_specs
     }
+
+
+def warm_mappings(client: MK8SClient) -> Dict[str, int]:
+    """
+    Refresh cached regions, Kubernetes versions and machine specs of every region.
+    Independent lookups run in parallel. Returns the number of cached items per mapping.
+    """
+    regions, versions = fan_out(
+        lambda get_mapping: get_mapping.refresh(client),
+        [get_regions_mapping, get_kubernetes_versions_mapping],
+    )
+    machine_specs = fan_out(
+        lambda region: get_machine_spec_mapping.refresh(client, region.id),
+        regions.values(),
+    )
+    return {
+        "regions": len(regions),
+        "kubernetes_versions": len(versions),
+        "machine_specs": sum(len(specs) for specs in machine_specs),
+    }
+
+
+def prefetch_mappings(client: MK8SClient, region_name: str) -> CatalogueMappings:
+    """
+    Resolve Kubernetes versions, regions and machine specs of given region concurrently.
+    Only the machine specs depend on the region ID, so they are requested as soon as
+    the regions arrive, while the Kubernetes versions are fetched alongside.
+    Lookup errors (e.g. KeyError for an unknown region) are propagated.
+    """
+    with ThreadPoolExecutor(max_workers=2, thread_name_prefix="mkcli") as pool:
+        versions = pool.submit(get_kubernetes_versions_mapping, client)
+        regions = get_regions_mapping(client)
+        region = regions[region_name]
+        machine_specs = get_machine_spec_mapping(client, region.id)
+        return CatalogueMappings(
+            kubernetes_versions=versions.result(),
+            regions=regions,
+            region=region,
+            machine_specs=machine_specs,
+        )
@@ -1,19 +1,178 @@
+import asyncio
+import atexit
+import threading
+from pathlib import Path
+from typing import Generator, Self
+
 import httpx
 import re
+from loguru import logger
 from json import JSONDecodeError
+from pydantic import BaseModel
 
+from mkcli.utils import cache
 from mkcli.utils.console import print_json
 from mkcli.settings import APP_SETTINGS
+from mkcli.utils.profiling import profile_methods, span
 from mkcli.core.models.node_pool import NodePool
 from mkcli.core.models.backup import Backup
 from mkcli.core.models.resource_usage import ResourceUsage
 from mkcli.core.models import Cluster, Region
+from mkcli.core.exceptions import (
+    APICallError,
+    APIResponseFormattingError,
+    WAFException,
+)
 from .adapters import AuthProtocol
+from .cassette import AsyncRecordTransport, Cassette, RecordTransport, ReplayTransport
+from .ratelimit import RateLimiter, resolve_limits
+from .tracing import ASYNC_EVENT_HOOKS, EVENT_HOOKS, response_timing
+from .transport import (
+    NO_RETRY_EXTENSION,
+    AsyncCacheTransport,
+    AsyncRateLimitTransport,
+    AsyncRetryTransport,
+    CacheTransport,
+    RateLimitTransport,
+    RetryTransport,
+)
 
 WAF_ERROR_MSG: str = (
     "The requested URL was rejected. Please consult with your administrator."
 )
 
+HTTP_LIMITS = httpx.Limits(
+    max_connections=20, max_keepalive_connections=10, keepalive_expiry=30.0
+)
+
+type ClientKey = tuple[str, str]  # (api_url, auth identity)
+
+_http_clients: dict[ClientKey, httpx.Client] = {}
+_http_clients_lock = threading.Lock()
+_cassette: Cassette | None = None
+
+
+def get_cassette() -> Cassette | None:
+    """Cassette of AppSettings.transport ("record:<path>" or "replay:<path>"), if set"""
+    global _cassette
+    mode, _, path = APP_SETTINGS.transport.partition(":")
+    if mode not in ("record", "replay") or not path:
+        if APP_SETTINGS.transport:
+            raise ValueError(
+                f"Invalid transport '{APP_SETTINGS.transport}', "
+                "expected 'record:<path>' or 'replay:<path>'"
+            )
+        return None
+    if _cassette is None or _cassette.path != Path(path).expanduser():
+        _cassette = Cassette(path)
+    return _cassette
+
+
+def network_transport(
+    transport: httpx.BaseTransport | httpx.AsyncBaseTransport,
+) -> httpx.BaseTransport | httpx.AsyncBaseTransport:
+    """The given network transport, recorded to or replaced by the cassette (if any)"""
+    cassette = get_cassette()
+    if cassette is None:
+        return transport
+    if APP_SETTINGS.transport.startswith("replay:"):
+        latency = APP_SETTINGS.transport_latency
+        return ReplayTransport(cassette, latency=None if latency < 0 else latency)
+    if isinstance(transport, httpx.AsyncBaseTransport):
+        return AsyncRecordTransport(transport, cassette)
+    return RecordTransport(transport, cassette)
+
+
+def http_cache_enabled() -> bool:
+    """
+    AppSettings.http_cache, except while recording: the cassette would only hold
+    the 304 replies to conditional requests, not replayable with a cold cache.
+    """
+    return APP_SETTINGS.http_cache and not APP_SETTINGS.transport.startswith("record:")
+
+
+def get_http_client(
+    api_url: str, identity: str, rate_limits: dict | None = None
+) -> httpx.Client:
+    """Return the process-wide pooled httpx client for given API URL and auth identity.
+
+    Every MK8SClient built for the same (api_url, identity) pair shares one connection
+    pool, so a command opening the context catalogue twice still reuses a single
+    keep-alive connection instead of paying for a second TLS handshake.
+    The pair also shares one rate limiter, configured by the first caller's
+    `rate_limits` (context overrides of AppSettings.rate_limits).
+    With AppSettings.http_cache, unchanged GET responses are served from the local
+    cache after a conditional request (see transport.ResponseCache).
+    Every request is timed by the tracing event hooks (shown with --verbose).
+    """
+    key = (api_url, identity)
+    with _http_clients_lock:
+        client = _http_clients.get(key)
+        if client is None or client.is_closed:
+            limiter = RateLimiter(resolve_limits(rate_limits), name=api_url)
+            transport = RetryTransport(
+                RateLimitTransport(
+                    network_transport(httpx.HTTPTransport(limits=HTTP_LIMITS)), limiter
+                )
+            )
+            if http_cache_enabled():
+                transport = CacheTransport(transport, identity)
+            client = httpx.Client(
+                base_url=api_url,
+                headers={"accept": "application/json"},
+                transport=transport,
+                event_hooks=EVENT_HOOKS,
+            )
+            _http_clients[key] = client
+        return client
+
+
+@atexit.register
+def close_http_clients() -> None:
+    """
+    Close all pooled httpx clients (registered to run once at interpreter exit).
+    Background cache refreshes may still be using them, so these finish first:
+    atexit hooks run in reverse registration order, which depends on import order.
+    """
+    cache.wait_for_revalidation()
+    with _http_clients_lock:
+        for client in _http_clients.values():
+            client.close()
+        _http_clients.clear()
+
+
+class AdapterAuth(httpx.Auth):
+    """Sets the auth header of every request from the adapter's current credentials,
+    so a token refreshed mid-session is used without rebuilding the httpx client.
+
+    On 401 the request is reissued once with replaced credentials (OpenID); API keys
+    cannot be replaced, so the 401 response is returned as is.
+    """
+
+    requires_request_body = True  # the body is resent on retry
+
+    def __init__(self, adapter: AuthProtocol) -> None:
+        self.adapter = adapter
+
+    def _authorization(self) -> str | None:
+        return httpx.Headers(self.adapter.get_auth_header()).get("authorization")
+
+    def auth_flow(
+        self, request: httpx.Request
+    ) -> Generator[httpx.Request, httpx.Response, None]:
+        request.headers.update(self.adapter.get_auth_header())
+        response = yield request
+        if response.status_code != httpx.codes.UNAUTHORIZED:
+            return
+
+        rejected = request.headers.get("authorization")
+        # credentials may have been replaced meanwhile (e.g. by the background refresh)
+        if self._authorization() == rejected and not self.adapter.reauthenticate():
+            return
+        logger.info("Request rejected with 401, retrying with new credentials.")
+        request.headers.update(self.adapter.get_auth_header())
+        yield request
+
 
 def remove_html_tags(text):
     """Remove html tags from a string"""
@@ -21,33 +180,22 @@ def remove_html_tags(text):
     return re.sub(clean, "", text)
 
 
-class APICallError(Exception):
-    """Custom exception for API call errors."""
+def validate[M: BaseModel](model: type[M], data: dict) -> M:
+    with span(f"{model.__name__}.model_validate", "validation"):
+        return model.model_validate(data)
 
-    def __init__(self, status_code: int, message: str):
-        _msg = f"API call failed with status code {status_code}: {message}"
-        self.code = status_code
-        super().__init__(_msg)
 
+def validate_items[M: BaseModel](model: type[M], response: dict) -> list[M]:
+    """Models of the "items" of a list response"""
+    with span(f"{model.__name__}.model_validate", "validation"):
+        return [model.model_validate(item) for item in response.get("items", [])]
 
-class APIResponseFormattingError(Exception):
-    """Custom exception for API response formatting errors."""
 
-    ...
+class BaseMK8SClient:
+    """Request-independent part of the MK8S clients: headers and response verification."""
 
-
-class WAFException(Exception):
-    """Web Application Firewall Exception."""
-
-    ...
-
-
-class MK8SClient:
-    def __init__(self, auth: AuthProtocol, api_url: str):
-        self._auth = auth
-        self.api_url = api_url
-        self.api = httpx.Client(base_url=self.api_url, headers=self.headers)
-        self.debug = APP_SETTINGS.debug
+    _auth: AuthProtocol
+    debug: bool
 
     @property
     def headers(self) -> dict:
@@ -67,6 +215,8 @@ class MK8SClient:
                 print_json(data=json_resp, indent=2)
                 print(f"API response: {response.status_code}")
                 print(f"For request: {response.request.method} {response.request.url}")
+                if timing := response_timing(response):
+                    print(f"Timing: {timing}")
             return json_resp
         except JSONDecodeError as e:
             msg: str = ""
@@ -84,6 +234,23 @@ class MK8SClient:
                 f"Failed to parse API JSON response: {e}"
             ) from e
 
+
+@profile_methods("api")
+class MK8SClient(BaseMK8SClient):
+    def __init__(self, auth: AuthProtocol, api_url: str):
+        self._auth = auth
+        self.api_url = api_url
+        self.api = get_http_client(self.api_url, auth.identity, auth.rate_limits)
+        self.api.auth = AdapterAuth(auth)  # same identity, so same credentials
+        self.debug = APP_SETTINGS.debug
+
+    def __cache_key__(self) -> dict:
+        """Identify cached lookups by API URL and context, not by client instance."""
+        return {
+            "api_url": self.api_url.rstrip("/").lower(),
+            "context": self._auth.context_name,
+        }
+
     def create_api_key(self) -> dict:
         resp = self.api.post("/token", headers=self.headers)
         self._verify(resp)
@@ -100,7 +267,7 @@ class MK8SClient:
         resp = self.api.get("/cluster", headers=self.headers, params=params)
         self._verify(resp)
         _dict = self._format_response(resp)
-        return [Cluster.model_validate(item) for item in _dict.get("items", [])]
+        return validate_items(Cluster, _dict)
 
     def create_cluster(self, cluster_data: dict | str, organisation_id=None) -> dict:
         params = {"organisationId": organisation_id}
@@ -112,7 +279,7 @@ class MK8SClient:
         resp = self.api.get(f"cluster/{cluster_id}")
         self._verify(resp)
         _dict = self._format_response(resp)
-        return Cluster.model_validate(_dict)
+        return validate(Cluster, _dict)
 
     def update_cluster(self, cluster_id: str, cluster_data: dict) -> dict:
         resp = self.api.put(f"/cluster/{cluster_id}", json=cluster_data)
@@ -137,7 +304,7 @@ class MK8SClient:
         resp = self.api.get(f"/cluster/{cluster_id}/node-pool")
         self._verify(resp)
         resp = self._format_response(resp)
-        return [NodePool.model_validate(item) for item in resp.get("items", [])]
+        return validate_items(NodePool, resp)
 
     def create_node_pool(self, cluster_id: str, node_pool_data: dict) -> dict:
         resp = self.api.post(f"/cluster/{cluster_id}/node-pool", json=node_pool_data)
@@ -147,7 +314,7 @@ class MK8SClient:
     def get_node_pool(self, cluster_id: str, node_pool_id: str) -> NodePool:
         resp = self.api.get(f"/cluster/{cluster_id}/node-pool/{node_pool_id}")
         self._verify(resp)
-        return NodePool.model_validate(self._format_response(resp))
+        return validate(NodePool, self._format_response(resp))
 
     def update_node_pool(
         self, cluster_id: str, node_pool_id: str, node_pool_data: dict
@@ -176,7 +343,7 @@ class MK8SClient:
         resp = self.api.get("/region", headers=self.headers)
         self._verify(resp)
         resp = self._format_response(resp)
-        return [Region.model_validate(item) for item in resp.get("items", [])]
+        return validate_items(Region, resp)
 
     def get_region(self, name) -> dict:
         params = {"name": name} if name else {}
@@ -189,22 +356,26 @@ class MK8SClient:
 
     def create_backup(self, cluster_id: str, backup_data: dict) -> Backup:
         """Create a new backup for a cluster"""
-        resp = self.api.put(f"/cluster/{cluster_id}/backup", json=backup_data)
+        resp = self.api.put(
+            f"/cluster/{cluster_id}/backup",
+            json=backup_data,
+            extensions={NO_RETRY_EXTENSION: True},  # a retry may create a second one
+        )
         self._verify(resp)
-        return Backup.model_validate(self._format_response(resp))
+        return validate(Backup, self._format_response(resp))
 
     def get_backup(self, cluster_id: str, backup_id: str) -> Backup:
         """Get details of a specific backup"""
         resp = self.api.get(f"/cluster/{cluster_id}/backup/{backup_id}")
         self._verify(resp)
-        return Backup.model_validate(self._format_response(resp))
+        return validate(Backup, self._format_response(resp))
 
     def list_backups(self, cluster_id: str) -> list[Backup]:
         """List all backups for a cluster"""
         resp = self.api.get(f"/cluster/{cluster_id}/backup")
         self._verify(resp)
         resp = self._format_response(resp)
-        return [Backup.model_validate(item) for item in resp.get("items", [])]
+        return validate_items(Backup, resp)
 
     def get_resource_usage(self, cluster_id: str) -> list[ResourceUsage]:
         """Get resource usage statistics for a cluster"""
@@ -218,3 +389,190 @@ class MK8SClient:
 
     def __str__(self):
         return f"MK8SClient({self.api.base_url})"
+
+
+@profile_methods("api")
+class AsyncMK8SClient(BaseMK8SClient):
+    """Asynchronous counterpart of MK8SClient built on httpx.AsyncClient.
+
+    At most `max_concurrency` requests are in flight at once, so callers can safely
+    `asyncio.gather` calls spanning hundreds of clusters:
+
+        async with AsyncMK8SClient(auth, api_url) as client:
+            clusters = await client.get_clusters()
+            pools = await asyncio.gather(
+                *(client.list_node_pools(c.id) for c in clusters)
+            )
+    """
+
+    def __init__(
+        self, auth: AuthProtocol, api_url: str, max_concurrency: int | None = None
+    ):
+        self._auth = auth
+        self.api_url = api_url
+        self.max_concurrency = max_concurrency or APP_SETTINGS.async_max_concurrency
+        transport = AsyncRetryTransport(
+            AsyncRateLimitTransport(
+                network_transport(
+                    httpx.AsyncHTTPTransport(
+                        limits=httpx.Limits(
+                            max_connections=self.max_concurrency,
+                            max_keepalive_connections=self.max_concurrency,
+                        )
+                    )
+                ),
+                RateLimiter(resolve_limits(auth.rate_limits), name=api_url),
+            )
+        )
+        if http_cache_enabled():
+            transport = AsyncCacheTransport(transport, auth.identity)
+        self.api = httpx.AsyncClient(
+            base_url=self.api_url,
+            headers={"accept": "application/json"},
+            auth=AdapterAuth(auth),
+            transport=transport,
+            event_hooks=ASYNC_EVENT_HOOKS,
+        )
+        self.debug = APP_SETTINGS.debug
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        await self.api.aclose()
+
+    async def _request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        async with self._semaphore:
+            resp = await self.api.request(method, url, **kwargs)
+        self._verify(resp)
+        return resp
+
+    async def create_api_key(self) -> dict:
+        resp = await self._request("POST", "/token")
+        return resp.json()
+
+    async def get_clusters(
+        self, organisation_id=None, order_by=None, region=None
+    ) -> list[Cluster]:
+        params = {
+            "organisationId": organisation_id,
+            "orderBy": order_by,
+            "region": region,
+        }
+        resp = await self._request("GET", "/cluster", params=params)
+        _dict = self._format_response(resp)
+        return validate_items(Cluster, _dict)
+
+    async def create_cluster(
+        self, cluster_data: dict | str, organisation_id=None
+    ) -> dict:
+        params = {"organisationId": organisation_id}
+        resp = await self._request("POST", "/cluster", json=cluster_data, params=params)
+        return self._format_response(resp)
+
+    async def get_cluster(self, cluster_id: str) -> Cluster:
+        resp = await self._request("GET", f"cluster/{cluster_id}")
+        return validate(Cluster, self._format_response(resp))
+
+    async def update_cluster(self, cluster_id: str, cluster_data: dict) -> dict:
+        resp = await self._request("PUT", f"/cluster/{cluster_id}", json=cluster_data)
+        return self._format_response(resp)
+
+    async def delete_cluster(self, cluster_id: str) -> None:
+        await self._request("DELETE", f"cluster/{cluster_id}")
+
+    async def refresh_kubeconfig(self, cluster_id: str) -> dict:
+        resp = await self._request("POST", f"cluster/{cluster_id}/refresh-kubeconfig")
+        return self._format_response(resp)
+
+    async def download_kubeconfig(self, cluster_id: str) -> str:
+        resp = await self._request("GET", f"cluster/{cluster_id}/files")
+        return self._format_response(resp)["kubeconfig"]
+
+    async def list_node_pools(self, cluster_id: str) -> list[NodePool]:
+        resp = await self._request("GET", f"/cluster/{cluster_id}/node-pool")
+        resp = self._format_response(resp)
+        return validate_items(NodePool, resp)
+
+    async def create_node_pool(self, cluster_id: str, node_pool_data: dict) -> dict:
+        resp = await self._request(
+            "POST", f"/cluster/{cluster_id}/node-pool", json=node_pool_data
+        )
+        return self._format_response(resp)
+
+    async def get_node_pool(self, cluster_id: str, node_pool_id: str) -> NodePool:
+        resp = await self._request(
+            "GET", f"/cluster/{cluster_id}/node-pool/{node_pool_id}"
+        )
+        return validate(NodePool, self._format_response(resp))
+
+    async def update_node_pool(
+        self, cluster_id: str, node_pool_id: str, node_pool_data: dict
+    ) -> dict:
+        resp = await self._request(
+            "PUT",
+            f"/cluster/{cluster_id}/node-pool/{node_pool_id}",
+            json=node_pool_data,
+        )
+        return self._format_response(resp)
+
+    async def delete_node_pool(self, cluster_id: str, node_pool_id: str) -> None:
+        await self._request("DELETE", f"/cluster/{cluster_id}/node-pool/{node_pool_id}")
+
+    async def list_kubernetes_versions(self) -> list:
+        resp = await self._request("GET", "/kubernetes-version")
+        return self._format_response(resp)["items"]
+
+    async def list_machine_specs(self, region_id: str | None) -> list:
+        resp = await self._request("GET", f"/region/{region_id}/machine-spec")
+        return self._format_response(resp)["items"]
+
+    async def list_regions(self) -> list[Region]:
+        resp = await self._request("GET", "/region")
+        resp = self._format_response(resp)
+        return validate_items(Region, resp)
+
+    async def get_region(self, name) -> dict:
+        params = {"name": name} if name else {}
+        resp = await self._request("GET", "/region", params=params)
+        resp = self._format_response(resp)
+        if not resp["items"]:
+            raise ValueError(f"Region '{name}' not found.")
+        return resp["items"].pop()
+
+    async def create_backup(self, cluster_id: str, backup_data: dict) -> Backup:
+        """Create a new backup for a cluster"""
+        resp = await self._request(
+            "PUT",
+            f"/cluster/{cluster_id}/backup",
+            json=backup_data,
+            extensions={NO_RETRY_EXTENSION: True},  # a retry may create a second one
+        )
+        return validate(Backup, self._format_response(resp))
+
+    async def get_backup(self, cluster_id: str, backup_id: str) -> Backup:
+        """Get details of a specific backup"""
+        resp = await self._request("GET", f"/cluster/{cluster_id}/backup/{backup_id}")
+        return validate(Backup, self._format_response(resp))
+
+    async def list_backups(self, cluster_id: str) -> list[Backup]:
+        """List all backups for a cluster"""
+        resp = await self._request("GET", f"/cluster/{cluster_id}/backup")
+        resp = self._format_response(resp)
+        return validate_items(Backup, resp)
+
+    async def get_resource_usage(self, cluster_id: str) -> list[ResourceUsage]:
+        """Get resource usage statistics for a cluster"""
+        resp = await self._request("GET", f"/cluster/{cluster_id}/resource-counts")
+        resp = self._format_response(resp)
+        return [
+            ResourceUsage(name=key, usage_count=value)
+            for key, value in resp.get("counts", {}).items()
+        ]
+
+    def __str__(self):
+        return f"AsyncMK8SClient({self.api.base_url})"
@@ -1,12 +1,38 @@
 import datetime
-from typing import ClassVar, Optional
-from pydantic import BaseModel, ConfigDict, field_serializer
+from typing import Any, ClassVar, Optional
+from pydantic import BaseModel, ConfigDict, PrivateAttr, field_serializer
 
 
 def keys_to_attrs(keys: list[str]) -> list[str]:
     return [k.replace(" ", "_").strip().lower() for k in keys]
 
 
+class TrackedModel(BaseModel):
+    """Model remembering whether any of its fields changed since it was loaded or saved"""
+
+    _dirty: bool = PrivateAttr(default=False)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in type(self).model_fields and getattr(self, name) != value:
+            self._dirty = True
+        super().__setattr__(name, value)
+
+    @property
+    def is_dirty(self) -> bool:
+        """True if a field, or a field of a nested tracked model, changed"""
+        return self._dirty or any(
+            isinstance(value, TrackedModel) and value.is_dirty
+            for value in self.__dict__.values()
+        )
+
+    def mark_clean(self) -> None:
+        """Forget changes, e.g. after the model was persisted"""
+        self._dirty = False
+        for value in self.__dict__.values():
+            if isinstance(value, TrackedModel):
+                value.mark_clean()
+
+
 class BaseResourceModel(BaseModel):
     """Mk8s Base Resource Model"""
 
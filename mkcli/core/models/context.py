@@ -1,17 +1,26 @@
 from __future__ import annotations
 import json
-from typing import Dict, Optional, Any, ClassVar, Protocol
+from collections.abc import Mapping
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, Optional, Any, ClassVar, Protocol
 from pathlib import Path
 from loguru import logger
-from pydantic import BaseModel
 from mkcli.core import exceptions as exc
 from mkcli.core.models import Token
+from mkcli.core.models.base import TrackedModel
 from mkcli.settings import APP_SETTINGS, DEFAULT_CTX_SETTINGS
+from mkcli.utils.filelock import atomic_write, file_lock
+
+try:
+    import sqlite3
+except ImportError:  # Python built without sqlite support
+    sqlite3 = None
 
 type key = str | None
 
 
-class Context(BaseModel):
+class Context(TrackedModel):
     """Represents a connection context for authentication with an identity server."""
 
     table_columns: ClassVar[list[str]] = [
@@ -33,6 +42,8 @@ class Context(BaseModel):
     auth_type: str = "api_key"  # type: ignore
     token: Optional[Token] = None  # used only for authtype = openid
     api_key: Optional[str] = None  # used only for authtype = api_key
+    # overrides of AppSettings.rate_limits, e.g. {"mutation": {"rate": 1}}
+    rate_limits: Optional[Dict[str, Dict[str, float]]] = None
 
     def as_table_row(self):
         """Return a list of values to be used in a table row"""
@@ -62,6 +73,32 @@ class Context(BaseModel):
 default_context = Context(**DEFAULT_CTX_SETTINGS.model_dump())
 
 
+@dataclass
+class CatalogueChanges:
+    """
+    Changes made to a ContextCatalogue since it was loaded. Storages apply them
+    to the latest stored catalogue, so concurrent mkcli processes do not
+    overwrite each other's contexts.
+    """
+
+    changed: dict[str, dict] = field(default_factory=dict)  # added or modified
+    deleted: set[str] = field(default_factory=set)
+    current: key = None
+    switched: bool = False  # `current` was set
+
+    def apply(self, data: dict) -> dict:
+        """Catalogue data (as returned by ContextStorage.load) with the changes"""
+        cat = {
+            name: self.changed.get(name, ctx)
+            for name, ctx in data.get("cat", {}).items()
+            if name not in self.deleted
+        }
+        return {
+            "current": self.current if self.switched else data.get("current"),
+            "cat": cat | self.changed,  # new contexts last
+        }
+
+
 class ContextStorage(Protocol):
     """Protocol for context storage, defines methods for saving and loading contexts."""
 
@@ -71,6 +108,8 @@ class ContextStorage(Protocol):
 
     def save(self, _dict: dict) -> None: ...
 
+    def update(self, changes: CatalogueChanges) -> None: ...
+
     def load(self) -> dict: ...
 
     def clear(self) -> None: ...
@@ -79,8 +118,26 @@ class ContextStorage(Protocol):
 class JsonStorage:
     PATH_PATTERN: Path = APP_SETTINGS.cached_context_path  # TODO(EA): rename
 
-    def __init__(self):
-        self.path: Path = self.PATH_PATTERN
+    def __init__(self, path: Path | None = None):
+        self.path: Path = path or self.PATH_PATTERN
+        self.lock_path: Path = self.path.with_name(f"{self.path.name}.lock")
+        self._locked: bool = False
+
+    @contextmanager
+    def locked(self) -> Iterator[None]:
+        """
+        Hold the exclusive storage lock, e.g. around a load-modify-save cycle,
+        so no concurrent mkcli process can write in between.
+        """
+        if self._locked:
+            yield
+            return
+        with file_lock(self.lock_path):
+            self._locked = True
+            try:
+                yield
+            finally:
+                self._locked = False
 
     def ensure_exists(self):
         if not self.path.is_file():
@@ -88,16 +145,27 @@ class JsonStorage:
 
     def init_storage(self, _data: dict) -> None:
         self.path.parent.mkdir(parents=True, exist_ok=True)
-        self.path.touch(exist_ok=True)
-        with open(self.path, "w") as f:
-            f.write(json.dumps(_data))
+        with self.locked():
+            if not self.path.is_file():  # unless a concurrent process did it first
+                atomic_write(self.path, json.dumps(_data))
 
     def save(self, _dict: dict) -> None:
-        with open(self.path, "w") as f:
-            f.write(json.dumps(_dict))
+        with self.locked():
+            atomic_write(self.path, json.dumps(_dict))
+        logger.info(f"Data saved to {self.path}")
+
+    def update(self, changes: CatalogueChanges) -> None:
+        """Apply the changes to the file as it is now, under the storage lock"""
+        with self.locked():
+            try:
+                data = self.load()
+            except FileNotFoundError:
+                data = {"current": None, "cat": {}}
+            atomic_write(self.path, json.dumps(changes.apply(data)))
         logger.info(f"Data saved to {self.path}")
 
     def load(self) -> dict:
+        # no lock needed, saves replace the file atomically
         with open(self.path, "r") as f:
             try:
                 logger.info(f"Data loaded from {self.path}")
@@ -118,12 +186,190 @@ class JsonStorage:
         return f"JsonStorage(path={self.path})"
 
 
+class ContextRows(Mapping):
+    """Read-only mapping of context name to context data, rows are fetched on access."""
+
+    def __init__(self, storage: SqliteStorage) -> None:
+        self.storage = storage
+
+    def __getitem__(self, name: str) -> dict:
+        return self.storage.load_context(name)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.storage.context_names())
+
+    def __len__(self) -> int:
+        return len(self.storage.context_names())
+
+
+class SqliteStorage:
+    """
+    Stores every context and its token as separate rows, so a command reads only
+    the contexts it touches and a save rewrites only the rows that changed.
+    """
+
+    SCHEMA: list[str] = [
+        "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)",
+        "CREATE TABLE IF NOT EXISTS contexts (name TEXT PRIMARY KEY, data TEXT NOT NULL)",
+        "CREATE TABLE IF NOT EXISTS tokens ("
+        "context TEXT PRIMARY KEY REFERENCES contexts (name) ON DELETE CASCADE, "
+        "data TEXT NOT NULL)",
+    ]
+
+    def __init__(self, path: Path | None = None):
+        if sqlite3 is None:
+            raise RuntimeError("SQLite context storage requires the sqlite3 module.")
+        self.path: Path = path or APP_SETTINGS.context_db_path
+        self._conn: sqlite3.Connection | None = None
+        # rows as last read or written, to detect which ones changed
+        self._rows: dict[str, tuple[str, str | None]] = {}
+        self._current: str | None = None
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, timeout=5.0, isolation_level=None)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA foreign_keys=ON")
+            for statement in self.SCHEMA:
+                self._conn.execute(statement)
+        return self._conn
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        conn = self.conn
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    @staticmethod
+    def _split(context: dict) -> tuple[str, str | None]:
+        """Serialize context data into its context and token rows"""
+        context = dict(context)
+        token = context.pop("token", None)
+        return (
+            json.dumps(context, sort_keys=True),
+            json.dumps(token, sort_keys=True) if token is not None else None,
+        )
+
+    def ensure_exists(self) -> None:
+        if not self.path.is_file():
+            raise FileNotFoundError(f"Context database {self.path} does not exist.")
+
+    def init_storage(self, _data: dict) -> None:
+        self.save(_data)
+
+    def context_names(self) -> list[str]:
+        return [name for (name,) in self.conn.execute("SELECT name FROM contexts")]
+
+    def load_context(self, name: str) -> dict:
+        """Load a single context (with its token) by name"""
+        row = self.conn.execute(
+            "SELECT c.data, t.data FROM contexts c "
+            "LEFT JOIN tokens t ON t.context = c.name WHERE c.name = ?",
+            (name,),
+        ).fetchone()
+        if row is None:
+            raise KeyError(name)
+        self._rows[name] = row
+        context = json.loads(row[0])
+        context["token"] = json.loads(row[1]) if row[1] is not None else None
+        return context
+
+    def load(self) -> dict:
+        row = self.conn.execute(
+            "SELECT value FROM meta WHERE key = 'current'"
+        ).fetchone()
+        self._current = row[0] if row else None
+        logger.info(f"Data loaded from {self.path}")
+        return {"current": self._current, "cat": ContextRows(self)}
+
+    def save(self, _dict: dict) -> None:
+        """Store the current context and every context of `_dict`"""
+        self.update(
+            CatalogueChanges(
+                changed=dict(_dict.get("cat", {})),
+                current=_dict.get("current"),
+                switched=True,
+            )
+        )
+
+    def update(self, changes: CatalogueChanges) -> None:
+        """Write the rows of changed contexts and delete the deleted ones"""
+        rows = {name: self._split(ctx) for name, ctx in changes.changed.items()}
+        with self._transaction() as conn:
+            if changes.switched:
+                conn.execute(
+                    "INSERT OR REPLACE INTO meta VALUES ('current', ?)",
+                    (changes.current,),
+                )
+            conn.executemany(
+                "DELETE FROM contexts WHERE name = ?",
+                [(name,) for name in changes.deleted],
+            )
+            for name, (context, token) in rows.items():
+                stored = self._rows.get(name)
+                if stored is None or stored[0] != context:
+                    conn.execute(
+                        "INSERT INTO contexts VALUES (?, ?) "
+                        "ON CONFLICT (name) DO UPDATE SET data = excluded.data",
+                        (name, context),
+                    )
+                if stored is not None and stored[1] == token:
+                    continue
+                if token is None:
+                    conn.execute("DELETE FROM tokens WHERE context = ?", (name,))
+                else:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO tokens VALUES (?, ?)", (name, token)
+                    )
+        if changes.switched:
+            self._current = changes.current
+        for name in changes.deleted:
+            self._rows.pop(name, None)
+        self._rows.update(rows)
+        logger.info(f"Data saved to {self.path}")
+
+    def clear(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+        self._rows.clear()
+        self._current = None
+        if self.path.is_file():
+            for suffix in ("", "-wal", "-shm"):
+                Path(f"{self.path}{suffix}").unlink(missing_ok=True)
+            logger.info(f"Context database {self.path} cleared.")
+        else:
+            logger.warning(
+                f"Context database {self.path} does not exist, nothing to clear."
+            )
+
+    def __repr__(self):
+        return f"SqliteStorage(path={self.path})"
+
+
 class ContextCatalogue:
-    """Catalogue of contexts, used to store and manage multiple connection contexts."""
+    """
+    Catalogue of contexts, used to store and manage multiple connection contexts.
+    Contexts are kept as raw data and validated on first access, so commands
+    touching only the current context do not pay for the whole catalogue.
+    """
 
     def __init__(self, storage: ContextStorage) -> None:
-        self.current: str | None = None
-        self.cat: Dict[key, Context] = {}
+        self._current: str | None = None
+        self.cat: Dict[key, Context] = {}  # contexts validated so far
+        self.raw: Mapping[str, dict] = {}  # context data as loaded from storage
+        self.names: list[str] = []
+        # catalogue level changes since load, see save
+        self._added: set[str] = set()
+        self._deleted: set[str] = set()
+        self._switched: bool = False
 
         self.storage: ContextStorage = storage
         self.ensure_storage()
@@ -140,14 +386,35 @@ class ContextCatalogue:
 
     def load(self):
         """Load the context catalogue from storage"""
-        # try:
         data = self.storage.load()
-        self.current = data.get("current")
-        self.cat = {name: Context(**ctx) for name, ctx in data.get("cat", {}).items()}
+        self._current = data.get("current")
+        self.raw = data.get("cat", {})
+        self.names = list(self.raw)
+        self.cat = {}
+        self._added, self._deleted, self._switched = set(), set(), False
+
+    def _context(self, name: key) -> Context:
+        """Return the context by name, validating its raw data on first access"""
+        if name not in self.cat:
+            if name not in self.names:
+                raise KeyError(name)
+            self.cat[name] = Context(**self.raw[name])
+        return self.cat[name]
+
+    @property
+    def current(self) -> str | None:
+        return self._current
+
+    @current.setter
+    def current(self, value: str | None) -> None:
+        """Set the current context name, saved by the next save"""
+        if self._current != value:
+            self._current = value
+            self._switched = True
 
     def switch(self, value: str):
         """Set the current context by name"""
-        if value not in self.cat:
+        if value not in self.names:
             raise exc.ContextNotFound(
                 context_name=value, available_contexts=self.list_available()
             )
@@ -158,56 +425,109 @@ class ContextCatalogue:
     @property
     def current_context(self) -> Context:
         try:
-            return self.cat[self.current]
+            return self._context(self.current)
         except KeyError:
             raise exc.NoActiveSession()
 
+    @property
+    def is_dirty(self) -> bool:
+        """True if the catalogue or any of its contexts changed since load or save"""
+        return (
+            self._switched
+            or bool(self._added or self._deleted)
+            or any(ctx.is_dirty for ctx in self.cat.values())
+        )
+
+    def changes(self) -> CatalogueChanges:
+        """Changes since load or save, untouched contexts are not serialized"""
+        return CatalogueChanges(
+            changed={
+                name: ctx.model_dump()
+                for name, ctx in self.cat.items()
+                if name in self._added or ctx.is_dirty
+            },
+            deleted=set(self._deleted),
+            current=self.current,
+            switched=self._switched,
+        )
+
     def save(self):
-        """Save the current context to the storage"""
-        self.storage.save(self.as_dict())
+        """
+        Save the changes made since load (or the last save) to the storage,
+        contexts changed by other mkcli processes meanwhile are kept.
+        """
+        if not self.is_dirty:
+            logger.debug("Context catalogue unchanged, skipping save.")
+            return
+        self.storage.update(self.changes())
+        self._added, self._deleted, self._switched = set(), set(), False
+        for ctx in self.cat.values():
+            ctx.mark_clean()
         logger.info("Context catalogue saved.")
 
     def add(self, item: Context):
         """Add a new context to the catalogue"""
+        if item.name not in self.names:
+            self.names.append(item.name)
         self.cat[item.name] = item
+        self._added.add(item.name)
+        self._deleted.discard(item.name)
         self.save()
         logger.info(f"Context '{item.name}' added to the catalogue.")
 
     def get(self, name: str) -> Context:
         """Returns the context deep copy"""
-        if name not in self.cat:
+        if name not in self.names:
             raise exc.ContextNotFound(
                 context_name=name, available_contexts=self.list_available()
             )
-        return self.cat[name].model_copy(deep=True)
+        return self._context(name).model_copy(deep=True)
 
     def delete(self, name: str):
         """Remove a context from the catalogue by name"""
-        del self.cat[name]
+        if name not in self.names:
+            raise KeyError(name)
+        self.names.remove(name)
+        self.cat.pop(name, None)
+        self._added.discard(name)
+        self._deleted.add(name)
         self.save()
         logger.info(f"Removed context '{name}' from the catalogue.")
 
     def purge(self):
         """Remove all contexts from the catalogue"""
+        self._deleted.update(self.names)
+        self._added.clear()
+        self.names.clear()
         self.cat.clear()
         self.current = None
+        self._switched = True  # clear it even if another process set one
         self.save()
         logger.info("All contexts removed from the catalogue.")
 
     def list_all(self) -> list[Context]:
         """List all contexts in the catalogue"""
-        return list(self.cat.values())
+        return [self._context(name) for name in self.names]
 
     def list_available(self) -> list[str]:
         """List all available context names in the catalogue"""
-        return list(self.cat.keys())  # type: ignore
+        return list(self.names)
 
     def as_dict(self) -> dict[str, Any]:
-        """Convert the context catalogue to a dictionary"""
+        """
+        Convert the context catalogue to a dictionary.
+        Only contexts accessed since load are serialized, the others are passed through.
+        """
         return {
             "current": self.current,
-            "cat": {name: context.model_dump() for name, context in self.cat.items()},
+            "cat": {
+                name: self.cat[name].model_dump()
+                if name in self.cat
+                else self.raw[name]
+                for name in self.names
+            },
         }
 
     def __repr__(self):
-        return f"Current context: {self.cat.get(self.current)}\nCatalogue: {self.list_available()}"
+        current = self.current_context if self.current in self.names else None
+        return f"Current context: {current}\nCatalogue: {self.list_available()}"
@@ -1,9 +1,11 @@
 import datetime
 
-from pydantic import BaseModel, field_serializer
+from pydantic import field_serializer
 
+from mkcli.core.models.base import TrackedModel
 
-class Token(BaseModel):
+
+class Token(TrackedModel):
     """Represents OPENID Connect token details"""
 
     access_token: str | None = None
@@ -0,0 +1,153 @@
+import asyncio
+import atexit
+import re
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Iterator
+
+import httpx
+
+from mkcli.settings import APP_SETTINGS
+from mkcli.utils import console
+
+ENDPOINT_CLASSES: tuple[str, ...] = ("catalogue", "read", "mutation")
+CATALOGUE_PATH = re.compile(r"/(region|kubernetes-version)(/|$)")
+READ_METHODS: frozenset[str] = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+def endpoint_class(request: httpx.Request) -> str:
+    """Classify the request: cheap catalogue lookups, other reads or mutations"""
+    if request.method not in READ_METHODS:
+        return "mutation"
+    if CATALOGUE_PATH.search(request.url.path):
+        return "catalogue"
+    return "read"
+
+
+@dataclass
+class Limit:
+    rate: float  # requests per second, 0 = unlimited
+    burst: int  # requests allowed at once before `rate` applies
+    max_in_flight: int
+
+
+def resolve_limits(overrides: dict | None = None) -> dict[str, Limit]:
+    """Limits per endpoint class, AppSettings.rate_limits updated by context overrides"""
+    overrides = overrides if isinstance(overrides, dict) else {}
+    return {
+        name: Limit(
+            **{**APP_SETTINGS.rate_limits.get(name, {}), **overrides.get(name, {})}
+        )
+        for name in ENDPOINT_CLASSES
+    }
+
+
+class TokenBucket:
+    """Thread-safe token bucket, callers reserve a token and wait the returned delay."""
+
+    def __init__(self, rate: float, burst: int) -> None:
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self.tokens: float = self.capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take a token, return the seconds to wait until it is actually available"""
+        if self.rate <= 0:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self.updated
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+
+@dataclass
+class ThrottleStats:
+    requests: int = 0
+    throttled: int = 0  # requests that had to wait
+    throttled_seconds: float = 0.0
+
+
+@dataclass
+class Governor:
+    """Rate and concurrency limits of a single endpoint class"""
+
+    limit: Limit
+    stats: ThrottleStats = field(default_factory=ThrottleStats)
+
+    def __post_init__(self) -> None:
+        self.bucket = TokenBucket(self.limit.rate, self.limit.burst)
+        self.semaphore = threading.BoundedSemaphore(max(1, self.limit.max_in_flight))
+        self._async_semaphore: asyncio.Semaphore | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def async_semaphore(self) -> asyncio.Semaphore:
+        if self._async_semaphore is None:
+            self._async_semaphore = asyncio.Semaphore(max(1, self.limit.max_in_flight))
+        return self._async_semaphore
+
+    def record(self, waited: float) -> None:
+        with self._lock:
+            self.stats.requests += 1
+            if waited > 0.001:
+                self.stats.throttled += 1
+                self.stats.throttled_seconds += waited
+
+
+_limiters: list["RateLimiter"] = []
+
+
+class RateLimiter:
+    """Token bucket plus max-in-flight governor per endpoint class."""
+
+    def __init__(self, limits: dict[str, Limit], name: str = "") -> None:
+        self.name = name
+        self.governors = {cls: Governor(limit) for cls, limit in limits.items()}
+        _limiters.append(self)
+
+    @contextmanager
+    def slot(self, request: httpx.Request) -> Iterator[None]:
+        governor = self.governors[endpoint_class(request)]
+        started = time.monotonic()
+        delay = governor.bucket.reserve()
+        if delay:
+            time.sleep(delay)
+        with governor.semaphore:
+            governor.record(time.monotonic() - started)
+            yield
+
+    @asynccontextmanager
+    async def aslot(self, request: httpx.Request) -> AsyncIterator[None]:
+        governor = self.governors[endpoint_class(request)]
+        started = time.monotonic()
+        delay = governor.bucket.reserve()
+        if delay:
+            await asyncio.sleep(delay)
+        async with governor.async_semaphore:
+            governor.record(time.monotonic() - started)
+            yield
+
+    def stats(self) -> dict[str, ThrottleStats]:
+        return {cls: governor.stats for cls, governor in self.governors.items()}
+
+
+@atexit.register
+def report_throttling() -> None:
+    """Show the time spent waiting for rate limits (in verbose mode)"""
+    if not APP_SETTINGS.verbose:
+        return
+    for limiter in _limiters:
+        for cls, stats in limiter.stats().items():
+            if stats.throttled:
+                console.display_diagnostic(
+                    f"[dim]Rate limit {limiter.name} {cls}: {stats.throttled}/"
+                    f"{stats.requests} requests throttled for "
+                    f"{stats.throttled_seconds:.2f}s[/dim]"
+                )
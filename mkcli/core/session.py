@@ -1,20 +1,46 @@
 from contextlib import contextmanager
 
-from mkcli.core.models.context import ContextCatalogue, JsonStorage, Context
+from mkcli.core.models.context import (
+    ContextCatalogue,
+    ContextStorage,
+    JsonStorage,
+    SqliteStorage,
+    Context,
+)
 from mkcli.core.adapters import AuthProtocol, OpenIDAdapter, APIKeyAdapter
 from mkcli.core.enums import SupportedAuthTypes
+from mkcli.settings import APP_SETTINGS
+from mkcli.utils.profiling import span
+
+
+def get_context_storage() -> ContextStorage:
+    """Context storage selected by AppSettings.context_storage."""
+    match APP_SETTINGS.context_storage:
+        case "sqlite":
+            storage = SqliteStorage()
+            try:
+                storage.ensure_exists()
+            except FileNotFoundError:
+                legacy = JsonStorage()
+                if legacy.path.is_file():  # first use, import the JSON catalogue
+                    storage.init_storage(legacy.load())
+            return storage
+
+    return JsonStorage()
 
 
 @contextmanager
 def open_context_catalogue():
     """Context manager to open a ContextCatalogue and ensure it is closed properly."""
-    storage = JsonStorage()
-    cat = ContextCatalogue(storage=storage)
+    with span("open_context_catalogue", "catalogue"):
+        storage = get_context_storage()
+        cat = ContextCatalogue(storage=storage)
 
     try:
         yield cat
     finally:
-        cat.save()
+        with span("ContextCatalogue.save", "catalogue"):
+            cat.save()
 
 
 def get_auth_adapter(ctx: Context) -> AuthProtocol:
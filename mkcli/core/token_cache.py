@@ -0,0 +1,64 @@
+import hashlib
+import json
+from pathlib import Path
+from typing import Callable
+
+from loguru import logger
+from pydantic import ValidationError
+
+from mkcli.core.models import Token
+from mkcli.settings import APP_SETTINGS
+from mkcli.utils.filelock import atomic_write, file_lock
+
+TOKEN_CACHE_DIR: Path = APP_SETTINGS.cache_dir / "tokens"
+
+
+class TokenCache:
+    """
+    Token shared by all mkcli processes using the same OpenID identity.
+    Files are written atomically with owner-only permissions.
+    """
+
+    def __init__(self, identity: str, directory: Path | None = None) -> None:
+        name = hashlib.sha256(identity.encode()).hexdigest()[:32]
+        directory = directory or TOKEN_CACHE_DIR
+        self.path: Path = directory / f"{name}.json"
+        self.lock_path: Path = directory / f"{name}.lock"
+
+    def load(self) -> Token | None:
+        try:
+            return Token.model_validate_json(self.path.read_text())
+        except FileNotFoundError:
+            return None
+        except (ValidationError, ValueError):
+            logger.warning(f"Ignoring unreadable token cache {self.path}")
+            return None
+
+    def store(self, token: Token) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write(self.path, json.dumps(token.model_dump()))
+
+    def clear(self) -> None:
+        self.path.unlink(missing_ok=True)
+
+    def fresh(self) -> Token | None:
+        """Cached token, if it is valid and not due for renewal"""
+        token = self.load()
+        if token is not None and token.is_valid() and not token.should_be_renew():
+            return token
+        return None
+
+    def refresh(self, renew: Callable[[], Token], rejected: str | None = None) -> Token:
+        """
+        Single-flight refresh: the first process to take the lock calls `renew`,
+        the ones waiting on the lock reuse the token it stored instead of
+        refreshing their own. A cached `rejected` access token is never reused.
+        """
+        with file_lock(self.lock_path):
+            cached = self.fresh()
+            if cached is not None and cached.access_token != rejected:
+                logger.debug("Reusing token refreshed by another mkcli process.")
+                return cached
+            token = renew()
+            self.store(token)
+            return token
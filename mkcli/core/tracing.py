@@ -0,0 +1,170 @@
+import time
+from dataclasses import asdict, dataclass
+
+import httpx
+from loguru import logger
+from rich.markup import escape
+
+from mkcli.settings import APP_SETTINGS
+from mkcli.utils import console
+
+# httpcore reports the progress of a request to the callable in this extension
+TRACE_EXTENSION: str = "trace"
+TRACE_STATE: str = "mkcli.trace"  # (started, {event name: perf_counter()})
+TIMING_EXTENSION: str = "mkcli.timing"  # RequestTiming of the response
+
+
+def _ms(seconds: float | None) -> float | None:
+    return None if seconds is None else round(seconds * 1000, 2)
+
+
+@dataclass
+class RequestTiming:
+    """
+    Where a request spent its time, from httpcore trace events (milliseconds).
+    DNS resolution is part of `connect`, httpcore does not report it separately.
+    """
+
+    method: str
+    url: str
+    status: int
+    total_ms: float  # whole exchange, with rate limit waits, retries and the body
+    connect_ms: float | None  # DNS + TCP connect, None on a reused connection
+    tls_ms: float | None
+    ttfb_ms: float | None  # request sent to response headers received: API time
+    download_ms: float | None  # response body
+    size: int  # body bytes, decoded
+    transferred: int  # body bytes on the wire
+    reused: bool | None  # connection reused, None without network (e.g. replay)
+
+    @classmethod
+    def from_events(
+        cls,
+        response: httpx.Response,
+        started: float,
+        events: dict[str, float],
+        finished: float,
+    ) -> "RequestTiming":
+        def between(start: str, end: str) -> float | None:
+            begin, until = _find(events, start), _find(events, end)
+            if begin is None or until is None:
+                return None
+            return _ms(until - begin)
+
+        request = response.request
+        networked = _find(events, "receive_response_headers.complete") is not None
+        return cls(
+            method=request.method,
+            url=str(request.url),
+            status=response.status_code,
+            total_ms=_ms(finished - started),
+            connect_ms=between("connect_tcp.started", "connect_tcp.complete"),
+            tls_ms=between("start_tls.started", "start_tls.complete"),
+            ttfb_ms=between(
+                "send_request_headers.started", "receive_response_headers.complete"
+            ),
+            download_ms=between(
+                "receive_response_body.started", "receive_response_body.complete"
+            ),
+            size=len(response.content),
+            transferred=response.num_bytes_downloaded,
+            reused=("connect_tcp.started" not in _names(events)) if networked else None,
+        )
+
+    def __str__(self) -> str:
+        phases = ", ".join(
+            f"{name} {value:.1f}ms"
+            for name, value in (
+                ("connect", self.connect_ms),
+                ("tls", self.tls_ms),
+                ("ttfb", self.ttfb_ms),
+                ("download", self.download_ms),
+            )
+            if value is not None
+        )
+        connection = {True: "reused", False: "new", None: "none"}[self.reused]
+        return (
+            f"{self.method} {self.url} {self.status} in {self.total_ms:.1f}ms"
+            f"{f' ({phases})' if phases else ''}, {self.size} bytes "
+            f"({self.transferred} transferred), connection: {connection}"
+        )
+
+
+def _names(events: dict[str, float]) -> set[str]:
+    """Event names without the protocol prefix (connection., http11., http2.)"""
+    return {name.split(".", 1)[1] for name in events}
+
+
+def _find(events: dict[str, float], suffix: str) -> float | None:
+    for name, at in events.items():
+        if name.endswith(f".{suffix}"):
+            return at
+    return None
+
+
+def _start(request: httpx.Request) -> dict[str, float]:
+    events: dict[str, float] = {}
+    request.extensions[TRACE_STATE] = (time.perf_counter(), events)
+    return events
+
+
+def _finish(response: httpx.Response) -> RequestTiming | None:
+    state = response.request.extensions.get(TRACE_STATE)
+    if state is None:
+        return None
+    started, events = state
+    timing = RequestTiming.from_events(response, started, events, time.perf_counter())
+    response.extensions[TIMING_EXTENSION] = timing
+    logger.bind(http=asdict(timing)).debug(f"HTTP {timing}")
+    if APP_SETTINGS.verbose:
+        console.display_diagnostic(f"[dim]{escape(str(timing))}[/dim]")
+    return timing
+
+
+def trace_request(request: httpx.Request) -> None:
+    """
+    httpx request hook: time the request with httpcore's trace extension.
+    Events of a retried request are overwritten by the last attempt.
+    """
+    events = _start(request)
+
+    def trace(name: str, info: dict) -> None:
+        events[name] = time.perf_counter()
+
+    request.extensions[TRACE_EXTENSION] = trace
+
+
+def trace_response(response: httpx.Response) -> None:
+    """httpx response hook: read the body and log the request's RequestTiming"""
+    response.read()
+    _finish(response)
+
+
+async def atrace_request(request: httpx.Request) -> None:
+    """Asynchronous counterpart of trace_request"""
+    events = _start(request)
+
+    async def trace(name: str, info: dict) -> None:
+        events[name] = time.perf_counter()
+
+    request.extensions[TRACE_EXTENSION] = trace
+
+
+async def atrace_response(response: httpx.Response) -> None:
+    """Asynchronous counterpart of trace_response"""
+    await response.aread()
+    _finish(response)
+
+
+EVENT_HOOKS: dict[str, list] = {
+    "request": [trace_request],
+    "response": [trace_response],
+}
+ASYNC_EVENT_HOOKS: dict[str, list] = {
+    "request": [atrace_request],
+    "response": [atrace_response],
+}
+
+
+def response_timing(response: httpx.Response) -> RequestTiming | None:
+    return response.extensions.get(TIMING_EXTENSION)
@@ -0,0 +1,350 @@
+import asyncio
+import email.utils
+import hashlib
+import random
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Callable
+
+import httpx
+from loguru import logger
+
+from mkcli.core.ratelimit import RateLimiter, endpoint_class
+from mkcli.settings import APP_SETTINGS
+from mkcli.utils import cache
+
+IDEMPOTENT_METHODS: frozenset[str] = frozenset(
+    {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+)
+# set on requests of idempotent methods that must not be repeated anyway,
+# e.g. creating a backup with PUT
+NO_RETRY_EXTENSION: str = "mkcli.no_retry"
+RETRY_STATUSES: frozenset[int] = frozenset({502, 503, 504})
+RETRY_ERRORS: tuple[type[Exception], ...] = (
+    httpx.ConnectError,
+    httpx.ConnectTimeout,
+    httpx.ReadError,
+    httpx.RemoteProtocolError,
+)
+# cluster list and show, node pool list and show; never kubeconfig files or backups
+CLUSTER_PATH = re.compile(r"/cluster(/[^/]+(/node-pool(/[^/]+)?)?)?/?$")
+
+
+@dataclass
+class RetryPolicy:
+    """
+    Exponential backoff with full jitter: the n-th retry waits a random time
+    from [0, min(backoff_max, backoff * 2**n)], or the server's Retry-After.
+    No retry starts once `budget` seconds have passed since the first attempt.
+    """
+
+    attempts: int = field(default_factory=lambda: APP_SETTINGS.retry_attempts)
+    backoff: float = field(default_factory=lambda: APP_SETTINGS.retry_backoff)
+    backoff_max: float = field(default_factory=lambda: APP_SETTINGS.retry_backoff_max)
+    budget: float = field(default_factory=lambda: APP_SETTINGS.retry_budget)
+
+    def delay(self, retry: int, response: httpx.Response | None = None) -> float:
+        retry_after = retry_after_seconds(response) if response is not None else None
+        if retry_after is not None:
+            return retry_after
+        return random.uniform(0, min(self.backoff_max, self.backoff * 2**retry))
+
+    def should_retry(
+        self,
+        request: httpx.Request,
+        retry: int,
+        response: httpx.Response | None = None,
+    ) -> bool:
+        if retry >= self.attempts or request.method not in IDEMPOTENT_METHODS:
+            return False
+        if request.extensions.get(NO_RETRY_EXTENSION):
+            return False
+        return response is None or response.status_code in RETRY_STATUSES
+
+
+def retry_after_seconds(response: httpx.Response) -> float | None:
+    """Seconds to wait according to the Retry-After header (delay or HTTP date)"""
+    value = response.headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+class RetryTransport(httpx.BaseTransport):
+    """Retries idempotent requests failing with a gateway error or a dropped connection."""
+
+    def __init__(
+        self,
+        transport: httpx.BaseTransport,
+        policy: RetryPolicy | None = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.transport = transport
+        self.policy = policy or RetryPolicy()
+        self.sleep = sleep
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        deadline = time.monotonic() + self.policy.budget
+        retry = 0
+        while True:
+            try:
+                response = self.transport.handle_request(request)
+            except RETRY_ERRORS as err:
+                if not self.policy.should_retry(request, retry):
+                    raise
+                delay, reason = self.policy.delay(retry), repr(err)
+                if time.monotonic() + delay > deadline:
+                    raise
+            else:
+                if not self.policy.should_retry(request, retry, response):
+                    return response
+                delay, reason = self.policy.delay(retry, response), response.status_code
+                if time.monotonic() + delay > deadline:
+                    return response
+                response.close()
+
+            retry += 1
+            logger.info(
+                f"{request.method} {request.url} failed ({reason}), "
+                f"retry {retry}/{self.policy.attempts} in {delay:.2f}s"
+            )
+            self.sleep(delay)
+
+    def close(self) -> None:
+        self.transport.close()
+
+
+class AsyncRetryTransport(httpx.AsyncBaseTransport):
+    """Asynchronous counterpart of RetryTransport."""
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        policy: RetryPolicy | None = None,
+        sleep: Callable[[float], asyncio.Future] = asyncio.sleep,
+    ) -> None:
+        self.transport = transport
+        self.policy = policy or RetryPolicy()
+        self.sleep = sleep
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        deadline = time.monotonic() + self.policy.budget
+        retry = 0
+        while True:
+            try:
+                response = await self.transport.handle_async_request(request)
+            except RETRY_ERRORS as err:
+                if not self.policy.should_retry(request, retry):
+                    raise
+                delay, reason = self.policy.delay(retry), repr(err)
+                if time.monotonic() + delay > deadline:
+                    raise
+            else:
+                if not self.policy.should_retry(request, retry, response):
+                    return response
+                delay, reason = self.policy.delay(retry, response), response.status_code
+                if time.monotonic() + delay > deadline:
+                    return response
+                await response.aclose()
+
+            retry += 1
+            logger.info(
+                f"{request.method} {request.url} failed ({reason}), "
+                f"retry {retry}/{self.policy.attempts} in {delay:.2f}s"
+            )
+            await self.sleep(delay)
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+class RateLimitTransport(httpx.BaseTransport):
+    """Waits for a rate limit token and an in-flight slot before every request."""
+
+    def __init__(self, transport: httpx.BaseTransport, limiter: RateLimiter) -> None:
+        self.transport = transport
+        self.limiter = limiter
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        with self.limiter.slot(request):
+            return self.transport.handle_request(request)
+
+    def close(self) -> None:
+        self.transport.close()
+
+
+class AsyncRateLimitTransport(httpx.AsyncBaseTransport):
+    """Asynchronous counterpart of RateLimitTransport."""
+
+    def __init__(
+        self, transport: httpx.AsyncBaseTransport, limiter: RateLimiter
+    ) -> None:
+        self.transport = transport
+        self.limiter = limiter
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        async with self.limiter.aslot(request):
+            return await self.transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+@dataclass
+class CachedResponse:
+    """Stored response body with the validators used to revalidate it."""
+
+    status_code: int
+    headers: list[tuple[str, str]]
+    content: bytes
+    etag: str | None
+    last_modified: str | None
+
+
+class ResponseCache:
+    """
+    Conditional GET: responses with an ETag or Last-Modified validator are stored in
+    the mkcli cache, later requests for the same URL send If-None-Match /
+    If-Modified-Since and reuse the stored body when the server answers 304.
+    Responses without validators are passed through and never stored.
+    """
+
+    FUNC: str = "http"  # name in `mkcli cache stats`
+
+    def __init__(self, identity: str) -> None:
+        self.identity = identity
+
+    @staticmethod
+    def cacheable(request: httpx.Request) -> bool:
+        if request.method != "GET":
+            return False
+        return endpoint_class(request) == "catalogue" or bool(
+            CLUSTER_PATH.search(request.url.path)
+        )
+
+    def key(self, request: httpx.Request) -> str:
+        payload = "\n".join(
+            (self.identity, request.headers.get("accept", ""), str(request.url))
+        )
+        return f"{self.FUNC}:{hashlib.sha256(payload.encode()).hexdigest()}"
+
+    def prepare(self, request: httpx.Request) -> CachedResponse | None:
+        """Add the validators of the stored response (if any) to the request."""
+        entry = cache.load(self.key(request))
+        if entry is None or not isinstance(entry.value, CachedResponse):
+            return None
+        stored = entry.value
+        if stored.etag:
+            request.headers["If-None-Match"] = stored.etag
+        if stored.last_modified:
+            request.headers["If-Modified-Since"] = stored.last_modified
+        return stored
+
+    def not_modified(
+        self, request: httpx.Request, response: httpx.Response, stored: CachedResponse
+    ) -> httpx.Response:
+        """Rebuild the stored response, updated with the headers of the 304 reply."""
+        logger.info(f"{request.method} {request.url} not modified, using cached body.")
+        cache.get_backend().record(self.FUNC, "hits")
+        headers = httpx.Headers(stored.headers)
+        for name, value in response.headers.items():
+            if name.lower() not in ("content-length", "content-encoding"):
+                headers[name] = value
+        return httpx.Response(
+            stored.status_code,
+            headers=headers,
+            content=stored.content,
+            request=request,
+            extensions=response.extensions,
+        )
+
+    @staticmethod
+    def has_validators(response: httpx.Response) -> bool:
+        if "no-store" in response.headers.get("cache-control", "").lower():
+            return False
+        return "etag" in response.headers or "last-modified" in response.headers
+
+    def store(
+        self,
+        request: httpx.Request,
+        response: httpx.Response,
+        stored: CachedResponse | None,
+    ) -> None:
+        """Save a response read in full, or drop a stored one the server stopped validating."""
+        if response.status_code != httpx.codes.OK:
+            return
+        key = self.key(request)
+        if not self.has_validators(response):
+            if stored is not None:
+                cache.get_backend().delete(key)
+            return
+        cache.get_backend().record(self.FUNC, "misses")
+        timestamp = cache.now()
+        stored = CachedResponse(
+            status_code=response.status_code,
+            # the body is stored decoded
+            headers=[
+                (name, value)
+                for name, value in response.headers.items()
+                if name.lower() not in ("content-length", "content-encoding")
+            ],
+            content=response.content,
+            etag=response.headers.get("etag"),
+            last_modified=response.headers.get("last-modified"),
+        )
+        cache.save(key, cache.CacheEntry(self.FUNC, stored, timestamp, timestamp))
+
+
+class CacheTransport(httpx.BaseTransport):
+    """Serves unchanged GET responses from the local cache (see ResponseCache)."""
+
+    def __init__(self, transport: httpx.BaseTransport, identity: str) -> None:
+        self.transport = transport
+        self.cache = ResponseCache(identity)
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        if not self.cache.cacheable(request):
+            return self.transport.handle_request(request)
+        stored = self.cache.prepare(request)
+        response = self.transport.handle_request(request)
+        if stored is not None and response.status_code == httpx.codes.NOT_MODIFIED:
+            response.close()
+            return self.cache.not_modified(request, response, stored)
+        response.read()
+        self.cache.store(request, response, stored)
+        return response
+
+    def close(self) -> None:
+        self.transport.close()
+
+
+class AsyncCacheTransport(httpx.AsyncBaseTransport):
+    """Asynchronous counterpart of CacheTransport."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, identity: str) -> None:
+        self.transport = transport
+        self.cache = ResponseCache(identity)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if not self.cache.cacheable(request):
+            return await self.transport.handle_async_request(request)
+        stored = self.cache.prepare(request)
+        response = await self.transport.handle_async_request(request)
+        if stored is not None and response.status_code == httpx.codes.NOT_MODIFIED:
+            await response.aclose()
+            return self.cache.not_modified(request, response, stored)
+        await response.aread()
+        self.cache.store(request, response, stored)
+        return response
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
@@ -1,24 +1,21 @@
+from mkcli.utils.profiling import PROFILER  # first, to time the imports below
+
+import sys
+from pathlib import Path
 from typing import Annotated, Optional
 import typer
-from mkcli.core.exceptions import AuthorizationError, ResourceNotFound, StorageBaseError
-
-from mkcli.cli import (
-    auth,
-    cluster,
-    node_pool,
-    kubernetes_version,
-    flavors,
-    backup,
-    resource,
-    dashboard,
+from mkcli.core.exceptions import (
+    APICallError,
+    AuthorizationError,
+    ResourceNotFound,
+    StorageBaseError,
 )
-from keycloak import KeycloakPostError
-from loguru import logger
+
 import logging
 
-from mkcli.core.mk8s import APICallError
+from mkcli.cli.lazy import LazyGroup, LazySubcommand
 from mkcli.core import exceptions as exc
-from mkcli.utils.console import display
+from mkcli.core.enums import ProfileFormat
 from mkcli._version import __version__
 from mkcli.settings import APP_SETTINGS
 
@@ -27,7 +24,49 @@ state = {"verbose": False}
 
 MAIN_HELP: str = "mkcli - A CLI for managing your Kubernetes clusters"
 
+
+class MainGroup(LazyGroup):
+    """Command modules (and keycloak, httpx, rich...) are imported only when run"""
+
+    lazy_subcommands = {
+        "auth": LazySubcommand("mkcli.cli.auth", "Manage authentication sessions"),
+        "cluster": LazySubcommand("mkcli.cli.cluster", "Manage Kubernetes clusters"),
+        "node-pool": LazySubcommand(
+            "mkcli.cli.node_pool", "Manage Kubernetes cluster's node pools"
+        ),
+        "kubernetes-version": LazySubcommand(
+            "mkcli.cli.kubernetes_version", "Manage Kubernetes versions"
+        ),
+        "flavors": LazySubcommand(
+            "mkcli.cli.flavors", "Manage Kubernetes machine specs (flavors)"
+        ),
+        "cache": LazySubcommand(
+            "mkcli.cli.cache",
+            "Manage the cache of regions, flavors and Kubernetes versions",
+        ),
+    }
+
+
+if (
+    APP_SETTINGS.beta_feature_flag
+):  # export MKCLI_BETA_FEATURE_FLAG=True if you want to check it
+    MainGroup.lazy_subcommands |= {
+        "backup": LazySubcommand(
+            "mkcli.cli.backup", "Cluster backup management [BETA]"
+        ),
+        "resource-usage": LazySubcommand(
+            "mkcli.cli.resource", "Resource usage monitoring [BETA]"
+        ),
+        "dashboard": LazySubcommand(
+            "mkcli.cli.dashboard",
+            "Live cluster dashboard [BETA]",
+            no_args_is_help=False,
+        ),
+    }
+
+
 cli = typer.Typer(
+    cls=MainGroup,
     pretty_exceptions_show_locals=False,
     no_args_is_help=True,
     help=MAIN_HELP,
@@ -46,40 +85,36 @@ def verbosity_callback(
     """
     Manage verbosity.
     """
+    from loguru import logger
+
     if value:
         state["verbose"] = True
+        APP_SETTINGS.verbose = True
         logging.getLogger("mkcli").setLevel(logging.INFO)
     logger.remove()
     logging.getLogger("mkcli").setLevel(logging.ERROR)
 
 
-cli.add_typer(auth.app, name="auth", no_args_is_help=True)
-cli.add_typer(cluster.app, name="cluster", no_args_is_help=True)
-cli.add_typer(node_pool.app, name="node-pool", no_args_is_help=True)
-cli.add_typer(kubernetes_version.app, name="kubernetes-version", no_args_is_help=True)
-cli.add_typer(flavors.app, name="flavors", no_args_is_help=True)
+def profile_callback(ctx: typer.Context, value: ProfileFormat | None):
+    """
+    Start recording spans, reported once the command finished.
+    """
+    if value is None:
+        return
+    PROFILER.start()
+    ctx.call_on_close(lambda: PROFILER.report(value, ctx.params.get("profile_output")))
 
-if (
-    APP_SETTINGS.beta_feature_flag
-):  # export MKCLI_BETA_FEATURE_FLAG=True if you want to check it
-    cli.add_typer(
-        backup.app,
-        name="backup",
-        no_args_is_help=True,
-        help="Cluster backup management [BETA]",
-    )
-    cli.add_typer(
-        resource.app,
-        name="resource-usage",
-        no_args_is_help=True,
-        help="Resource usage monitoring [BETA]",
-    )
-    cli.add_typer(
-        dashboard.app,
-        name="dashboard",
-        no_args_is_help=False,
-        help="Live cluster dashboard [BETA]",
-    )
+
+def display(message: str) -> None:
+    from mkcli.utils.console import display as _display  # rich is slow to import
+
+    _display(message)
+
+
+def keycloak_post_error() -> type[Exception] | tuple:
+    """KeycloakPostError, if keycloak was imported by the command at all"""
+    keycloak = sys.modules.get("keycloak")
+    return keycloak.KeycloakPostError if keycloak is not None else ()
 
 
 @cli.callback()
@@ -92,6 +127,24 @@ def main(
         Optional[bool],
         typer.Option("--version", callback=version_callback, is_eager=True),
     ] = False,
+    profile: Annotated[
+        Optional[ProfileFormat],
+        typer.Option(
+            "--profile",
+            callback=profile_callback,
+            is_eager=True,
+            help="Time the command's phases: print a breakdown table, "
+            "or write a JSON or Chrome trace-event file",
+        ),
+    ] = None,
+    profile_output: Annotated[
+        Optional[Path],
+        typer.Option(
+            "--profile-output",
+            help="File written by --profile json/chrome, "
+            "mkcli-profile.json or mkcli-trace.json by default",
+        ),
+    ] = None,
 ):
     pass
 
@@ -119,7 +172,9 @@ def run():
             "Please initialize an auth session using:\n"
             ">> [green]`mkcli auth init`[/green] or check if you have a valid auth context set."
         )
-    except KeycloakPostError:
+    except keycloak_post_error():
+        from loguru import logger
+
         logger.exception(
             "Keycloak Post Error occurred. Please check your auth configuration."
             "Ensure that you successfully logged in the browser during `mkcli auth token refresh`."
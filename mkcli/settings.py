@@ -20,10 +20,36 @@ if ENV == "dev":
 class AppSettings(BaseSettings):
     name: str = "mkcli"
     session_persistence_file: Path = Path("contexts.json")
+    context_storage: str = "json"  # "json" or "sqlite"
     default_format: str = Format.TABLE
     resource_mappings_cache: bool = False
+    cache_backend: str = "sqlite"  # "sqlite" or "shelve"
+    cache_max_entries: int = 256  # per cached function (`http` responses included)
+    regions_cache_ttl: int = 24 * 60 * 60  # seconds
+    machine_specs_cache_ttl: int = 60 * 60  # seconds
+    kubernetes_versions_cache_ttl: int = 60 * 60  # seconds
+    cache_stale_while_revalidate: int = 24 * 60 * 60  # seconds, 0 disables
+    cache_revalidate_timeout: int = 10  # seconds
+    http_cache: bool = True  # conditional GET of catalogue and cluster endpoints
+    async_max_concurrency: int = 10
+    retry_attempts: int = 3  # retries of idempotent requests, 0 disables
+    retry_backoff: float = 0.5  # seconds, doubled on every retry
+    retry_backoff_max: float = 8.0  # seconds
+    retry_budget: float = 30.0  # seconds, no retry starts after that
+    # per endpoint class: requests per second (0 = unlimited), burst, max in flight
+    rate_limits: dict[str, dict[str, float]] = {
+        "catalogue": {"rate": 20, "burst": 20, "max_in_flight": 10},
+        "read": {"rate": 10, "burst": 10, "max_in_flight": 8},
+        "mutation": {"rate": 2, "burst": 2, "max_in_flight": 2},
+    }
+    # "record:<path>" saves MK8S API traffic to a cassette, "replay:<path>" serves it;
+    # credentials are redacted, other response data (cluster names, IPs) is kept
+    transport: str = ""
+    transport_latency: float = 0.0  # seconds per replayed response, -1 = as recorded
+    max_workers: int = 8
     beta_feature_flag: bool = False
     debug: bool = False
+    verbose: bool = False
 
     @field_validator("cluster_columns", "nodepool_columns", mode="before")
     @classmethod
@@ -55,6 +81,10 @@ class AppSettings(BaseSettings):
     def cached_context_path(self) -> Path:
         return Path(typer.get_app_dir(self.name)) / self.session_persistence_file
 
+    @property
+    def context_db_path(self) -> Path:
+        return Path(typer.get_app_dir(self.name)) / "contexts.sqlite"
+
     @property
     def cache_dir(self) -> Path:
         return Path(user_cache_dir(self.name))
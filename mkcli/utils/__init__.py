@@ -1 +1 @@
-from .timing import wait_until  # noqa: F401
+from .timing import wait_until, stopwatch  # noqa: F401
@@ -1,55 +1,512 @@
+import atexit
+import hashlib
+import inspect
+import json
+import pickle
 import shelve
-from typing import Any
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Callable, Iterator, Protocol
 from functools import wraps
 from pathlib import Path
 from mkcli.settings import APP_SETTINGS
 from loguru import logger
 
+try:
+    import sqlite3
+except ImportError:  # Python built without sqlite support
+    sqlite3 = None
 
-CACHE_STORAGE_PATH = Path(f"{APP_SETTINGS.cache_dir}/shelve")
+
+CACHE_DIR: Path = APP_SETTINGS.cache_dir
+
+type seconds = int | float
+
+
+@dataclass
+class CacheEntry:
+    """Cached value with the bookkeeping needed for TTL invalidation and LRU eviction."""
+
+    func: str
+    value: Any
+    stored_at: float
+    accessed_at: float
+
+    def age(self) -> float:
+        return now() - self.stored_at
+
+    def is_fresh(self, ttl: seconds | None) -> bool:
+        return ttl is None or self.age() < ttl
+
+
+@dataclass
+class EntryInfo:
+    """Cache entry metadata, readable without deserializing the cached value."""
+
+    key: str
+    func: str
+    size: int  # bytes of the serialized value
+    stored_at: float
+    accessed_at: float
+
+
+def now() -> float:
+    return time.time()
+
+
+def normalize(value: Any) -> Any:
+    """Convert a cached function argument into a canonical JSON-serializable form.
+
+    Objects may define `__cache_key__()` to describe which of their attributes identify
+    a cached result (e.g. MK8SClient returns its API URL and context name).
+    """
+    if hasattr(value, "__cache_key__"):
+        return normalize(value.__cache_key__())
+    if isinstance(value, Enum):
+        return normalize(value.value)
+    if isinstance(value, str):
+        return value.strip()
+    if isinstance(value, (bool, int, float)) or value is None:
+        return value
+    if isinstance(value, dict):
+        return {str(k): normalize(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [normalize(v) for v in value]
+    if isinstance(value, (set, frozenset)):
+        return sorted(normalize(v) for v in value)
+    if hasattr(value, "model_dump"):  # pydantic models
+        return normalize(value.model_dump(mode="json"))
+    return str(value)
+
+
+def make_key(func: Callable, args: tuple, kwargs: dict) -> str:
+    """Derive a fixed-length cache key from the function and its normalized arguments.
+
+    Arguments are bound to the function signature first, so positional and keyword
+    calls (and omitted defaults) of the same lookup share one cache entry.
+    """
+    bound = inspect.signature(func).bind(*args, **kwargs)
+    bound.apply_defaults()
+    payload = {
+        "func": f"{func.__module__}.{func.__qualname__}",
+        "args": {name: normalize(value) for name, value in bound.arguments.items()},
+    }
+    serialized = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(serialized.encode()).hexdigest()
 
 
 def ensure_path_exists(path: Path) -> None:
     path.mkdir(parents=True, exist_ok=True)
 
 
-def save(key: str, _object: Any) -> None:
-    """Save data to a shelve file."""
+class CacheBackend(Protocol):
+    """Protocol for cache backends, defines how cache entries are stored and evicted."""
+
+    def get(self, key: str) -> CacheEntry | None: ...
+
+    def set(self, key: str, entry: CacheEntry) -> None: ...
+
+    def touch(self, key: str, accessed_at: float) -> None: ...
+
+    def delete(self, key: str) -> None: ...
+
+    def keys(self) -> list[str]: ...
+
+    def info(self) -> list[EntryInfo]: ...
+
+    def evict(self, max_entries: int, func: str) -> list[EntryInfo]: ...
+
+    def record(self, func: str, event: str, count: int = 1) -> None: ...
+
+    def stats(self) -> dict[str, dict[str, int]]: ...
+
+    def clear(self) -> None: ...
+
+    def close(self) -> None: ...
+
+
+class ShelveBackend:
+    """Fallback backend, opens the shelve file on every operation."""
+
+    def __init__(self, directory: Path):
+        self.path: Path = directory / "shelve"
+        self.stats_path: Path = directory / "shelve-stats"
+        # dbm files are not safe for concurrent writers (e.g. fan-out workers)
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def _open(self, path: Path | None = None) -> Iterator[shelve.Shelf]:
+        path = path or self.path
+        ensure_path_exists(path.parent)
+        with self._lock, shelve.open(str(path)) as _dict:
+            yield _dict
+
+    def get(self, key: str) -> CacheEntry | None:
+        with self._open() as _dict:
+            entry = _dict.get(key)
+        # missing or written by older mkcli
+        return entry if isinstance(entry, CacheEntry) else None
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        with self._open() as _dict:
+            _dict[key] = entry
+
+    def touch(self, key: str, accessed_at: float) -> None:
+        with self._open() as _dict:
+            entry = _dict.get(key)
+            if isinstance(entry, CacheEntry):
+                entry.accessed_at = accessed_at
+                _dict[key] = entry
+
+    def delete(self, key: str) -> None:
+        with self._open() as _dict:
+            _dict.pop(key, None)
+
+    def keys(self) -> list[str]:
+        with self._open() as _dict:
+            return list(_dict.keys())
+
+    @staticmethod
+    def _info(_dict: shelve.Shelf) -> list[EntryInfo]:
+        result = []
+        for key in _dict.keys():
+            entry = _dict[key]
+            if not isinstance(entry, CacheEntry):
+                continue
+            result.append(
+                EntryInfo(
+                    key=key,
+                    func=entry.func,
+                    size=len(pickle.dumps(entry.value, pickle.HIGHEST_PROTOCOL)),
+                    stored_at=entry.stored_at,
+                    accessed_at=entry.accessed_at,
+                )
+            )
+        return result
+
+    def info(self) -> list[EntryInfo]:
+        with self._open() as _dict:
+            return self._info(_dict)
+
+    def evict(self, max_entries: int, func: str) -> list[EntryInfo]:
+        with self._open() as _dict:
+            entries = [info for info in self._info(_dict) if info.func == func]
+            if len(entries) <= max_entries:
+                return []
+            by_last_access = sorted(entries, key=lambda i: i.accessed_at)
+            evicted = by_last_access[: len(entries) - max_entries]
+            for info in evicted:
+                del _dict[info.key]
+            return evicted
+
+    def record(self, func: str, event: str, count: int = 1) -> None:
+        with self._open(self.stats_path) as _dict:
+            counters = _dict.get(func, {})
+            counters[event] = counters.get(event, 0) + count
+            _dict[func] = counters
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        with self._open(self.stats_path) as _dict:
+            return dict(_dict)
+
+    def clear(self) -> None:
+        for path in (self.path, self.stats_path):
+            with self._open(path) as _dict:
+                _dict.clear()
+
+    def close(self) -> None: ...
+
+    def __repr__(self):
+        return f"ShelveBackend(path={self.path})"
+
+
+class SqliteBackend:
+    """
+    SQLite (WAL mode) backend holding a single connection for the whole process.
+    WAL lets parallel mkcli invocations read the cache while another one writes to it.
+    Values are stored as pickled blobs.
+    """
+
+    SCHEMA: list[str] = [
+        "CREATE TABLE IF NOT EXISTS entries ("
+        "key TEXT PRIMARY KEY, func TEXT NOT NULL, value BLOB NOT NULL, "
+        "stored_at REAL NOT NULL, accessed_at REAL NOT NULL)",
+        "CREATE TABLE IF NOT EXISTS stats ("
+        "func TEXT NOT NULL, event TEXT NOT NULL, count INTEGER NOT NULL, "
+        "PRIMARY KEY (func, event))",
+    ]
+
+    def __init__(self, directory: Path):
+        self.path: Path = directory / "cache.sqlite"
+        ensure_path_exists(directory)
+        # the connection is shared by threads (e.g. fan-out workers), guarded by _lock
+        self._conn = sqlite3.connect(
+            self.path, timeout=5.0, isolation_level=None, check_same_thread=False
+        )
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            for statement in self.SCHEMA:
+                self._conn.execute(statement)
+
+    def _execute(self, sql: str, params: tuple = ()) -> list[tuple]:
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    def get(self, key: str) -> CacheEntry | None:
+        rows = self._execute(
+            "SELECT func, value, stored_at, accessed_at FROM entries WHERE key = ?",
+            (key,),
+        )
+        if not rows:
+            return None
+        func, value, stored_at, accessed_at = rows[0]
+        return CacheEntry(
+            func=func,
+            value=pickle.loads(value),
+            stored_at=stored_at,
+            accessed_at=accessed_at,
+        )
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        self._execute(
+            "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?)",
+            (
+                key,
+                entry.func,
+                pickle.dumps(entry.value, protocol=pickle.HIGHEST_PROTOCOL),
+                entry.stored_at,
+                entry.accessed_at,
+            ),
+        )
+
+    def touch(self, key: str, accessed_at: float) -> None:
+        self._execute(
+            "UPDATE entries SET accessed_at = ? WHERE key = ?", (accessed_at, key)
+        )
+
+    def delete(self, key: str) -> None:
+        self._execute("DELETE FROM entries WHERE key = ?", (key,))
+
+    def keys(self) -> list[str]:
+        return [row[0] for row in self._execute("SELECT key FROM entries")]
+
+    def info(self) -> list[EntryInfo]:
+        rows = self._execute(
+            "SELECT key, func, LENGTH(value), stored_at, accessed_at FROM entries"
+        )
+        return [EntryInfo(*row) for row in rows]
+
+    def evict(self, max_entries: int, func: str) -> list[EntryInfo]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT key, func, LENGTH(value), stored_at, accessed_at FROM entries "
+                "WHERE func = ? ORDER BY accessed_at DESC LIMIT -1 OFFSET ?",
+                (func, max_entries),
+            ).fetchall()
+            self._conn.executemany(
+                "DELETE FROM entries WHERE key = ?", [(row[0],) for row in rows]
+            )
+        return [EntryInfo(*row) for row in rows]
+
+    def record(self, func: str, event: str, count: int = 1) -> None:
+        self._execute(
+            "INSERT INTO stats VALUES (?, ?, ?) "
+            "ON CONFLICT (func, event) DO UPDATE SET count = count + excluded.count",
+            (func, event, count),
+        )
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        result: dict[str, dict[str, int]] = {}
+        for func, event, count in self._execute("SELECT func, event, count FROM stats"):
+            result.setdefault(func, {})[event] = count
+        return result
+
+    def clear(self) -> None:
+        self._execute("DELETE FROM entries")
+        self._execute("DELETE FROM stats")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def __repr__(self):
+        return f"SqliteBackend(path={self.path})"
+
+
+def open_backend(name: str, directory: Path) -> CacheBackend:
+    """Create the cache backend selected by name, falling back to shelve."""
+    if name == "sqlite":
+        if sqlite3 is not None:
+            return SqliteBackend(directory)
+        logger.warning("sqlite3 is not available, falling back to shelve cache.")
+    return ShelveBackend(directory)
+
+
+_backend: CacheBackend | None = None
+_backend_lock = threading.Lock()
+
+
+def get_backend() -> CacheBackend:
+    """Return the process-wide cache backend, opening it on first use."""
+    global _backend
+    with _backend_lock:
+        if _backend is None:
+            _backend = open_backend(APP_SETTINGS.cache_backend, CACHE_DIR)
+        return _backend
+
+
+@atexit.register
+def close_backend() -> None:
+    """Close the process-wide cache backend (registered to run at interpreter exit)."""
+    global _backend
+    with _backend_lock:
+        if _backend is not None:
+            _backend.close()
+            _backend = None
+
+
+def save(key: str, entry: CacheEntry) -> None:
+    """
+    Save data to the cache backend, evicting least recently used entries.
+    Every function has its own budget, so e.g. many cached HTTP responses
+    do not push out the resource mappings.
+    """
     logger.info(f"Saving object with key '{key}' to cache.")
-    ensure_path_exists(CACHE_STORAGE_PATH.parent)
-    with shelve.open(str(CACHE_STORAGE_PATH), writeback=True) as _dict:
-        _dict[key] = _object
+    backend = get_backend()
+    backend.set(key, entry)
+    for evicted in backend.evict(APP_SETTINGS.cache_max_entries, entry.func):
+        logger.info(f"Evicted cache entry with key '{evicted.key}'.")
+        backend.record(evicted.func, "evictions")
+
+
+def load(key: str) -> CacheEntry | None:
+    """Load data from the cache backend and mark it as recently used."""
+    logger.info(f"Loading object with key '{key}' from cache.")
+    backend = get_backend()
+    entry = backend.get(key)
+    if entry is not None:
+        entry.accessed_at = now()
+        backend.touch(key, entry.accessed_at)
+    return entry
+
+
+def store(key: str, func: Callable, args: tuple, kwargs: dict) -> Any:
+    """Call the function and save its result under given key."""
+    result = func(*args, **kwargs)
+    timestamp = now()
+    save(
+        key,
+        CacheEntry(
+            func=func.__name__,
+            value=result,
+            stored_at=timestamp,
+            accessed_at=timestamp,
+        ),
+    )
+    return result
+
 
+_revalidating: dict[str, threading.Thread] = {}
+_revalidating_lock = threading.Lock()
 
-def load(key: str) -> Any:
-    """Load data from a shelve file."""
-    logger.info(f"Loading object with key '{key}' to cache.")
-    with shelve.open(str(CACHE_STORAGE_PATH)) as _dict:
-        return _dict[key] if key in _dict else None
 
+def revalidate(key: str, func: Callable, args: tuple, kwargs: dict) -> None:
+    """Refresh a stale entry in a background thread (at most one refresh per key)."""
 
-def cache(enabled: bool = APP_SETTINGS.resource_mappings_cache) -> callable:
-    """Decorator to cache the result of a function for a specified time."""
-    # TODO(EA): Implement a time-based cache invalidation mechanism
+    def _refresh() -> None:
+        try:
+            store(key, func, args, kwargs)
+            logger.info(f"Revalidated cached {func.__name__} result ('{key}').")
+        except Exception as err:  # the stale value has already been served
+            logger.warning(f"Failed to revalidate {func.__name__} ('{key}'): {err}")
+        finally:
+            with _revalidating_lock:
+                _revalidating.pop(key, None)
+
+    with _revalidating_lock:
+        if key in _revalidating:
+            return
+        thread = threading.Thread(
+            target=_refresh, name=f"mkcli-revalidate-{key[:8]}", daemon=True
+        )
+        _revalidating[key] = thread
+    thread.start()
+
+
+@atexit.register
+def wait_for_revalidation(timeout: seconds | None = None) -> None:
+    """
+    Give pending background refreshes a chance to write the cache back before exit.
+    Registered after close_backend, so it runs before the backend is closed;
+    mk8s.close_http_clients also waits, as refreshes use the pooled HTTP clients.
+    """
+    deadline = now() + (timeout or APP_SETTINGS.cache_revalidate_timeout)
+    with _revalidating_lock:
+        threads = list(_revalidating.values())
+    for thread in threads:
+        thread.join(max(0.0, deadline - now()))
+
+
+def cache(
+    ttl: seconds | None = None,
+    enabled: bool | None = None,
+    stale_while_revalidate: seconds | None = None,
+) -> callable:
+    """Decorator to cache the result of a function for a specified time.
+
+    Entries older than `ttl` but younger than `ttl + stale_while_revalidate` are
+    returned immediately and refreshed in a background thread, so callers rarely
+    wait for the wrapped lookup. Older entries are recomputed synchronously.
+    `wrapper.refresh(*args, **kwargs)` recomputes and stores the result unconditionally.
+
+    :param ttl: time in seconds after which the cached result is stale (None = never)
+    :param enabled: if False, the function is returned undecorated
+        (None = AppSettings.resource_mappings_cache, checked on every call)
+    :param stale_while_revalidate: time in seconds a stale result may still be served
+        (None = AppSettings.cache_stale_while_revalidate, 0 = disabled)
+    """
 
     def decorator(func):
-        if not enabled:
+        if enabled is False:
             return func
 
         @wraps(func)
         def wrapper(*args, **kwargs):
-            # Implement caching logic here
-            args_str = ",".join(map(str, args))
-            cache_key = f"{func.__name__}_{args_str}_{kwargs}"
+            if enabled is None and not APP_SETTINGS.resource_mappings_cache:
+                return func(*args, **kwargs)
+
+            cache_key = make_key(func, args, kwargs)
             cached = load(cache_key)
 
+            if cached is not None and cached.is_fresh(ttl):
+                logger.info(f"Using cached {func.__name__} result ('{cache_key}').")
+                get_backend().record(func.__name__, "hits")
+                return cached.value
+
             if cached is not None:
-                logger.info(f"Using cached result for key '{cache_key}'.")
-                return cached
-            result = func(*args, **kwargs)
-            save(cache_key, result)
-            return result
+                window = (
+                    APP_SETTINGS.cache_stale_while_revalidate
+                    if stale_while_revalidate is None
+                    else stale_while_revalidate
+                )
+                if window and cached.is_fresh(ttl + window):
+                    logger.info(f"Using stale {func.__name__} result ('{cache_key}').")
+                    get_backend().record(func.__name__, "stale_hits")
+                    revalidate(cache_key, func, args, kwargs)
+                    return cached.value
+
+            get_backend().record(func.__name__, "misses")
+            return store(cache_key, func, args, kwargs)
+
+        def refresh(*args, **kwargs):
+            return store(make_key(func, args, kwargs), func, args, kwargs)
 
+        wrapper.refresh = refresh
         return wrapper
 
     return decorator
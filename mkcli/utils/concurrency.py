@@ -0,0 +1,23 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, TypeVar
+
+from mkcli.settings import APP_SETTINGS
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def fan_out(
+    func: Callable[[T], R], items: Iterable[T], max_workers: int | None = None
+) -> list[R]:
+    """
+    Call `func` for every item through a bounded thread pool.
+    Results are returned in the order of `items`; the first raised exception is propagated.
+    With max_workers=1 the calls are made serially in the calling thread.
+    """
+    items = list(items)
+    workers = min(max_workers or APP_SETTINGS.max_workers, len(items))
+    if workers <= 1:
+        return [func(item) for item in items]
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="mkcli") as pool:
+        return list(pool.map(func, items))
@@ -6,6 +6,7 @@ from typing import (
 )
 
 from mkcli.core.models.backup import BaseResourceModel
+from mkcli.utils.profiling import profiled
 import rich.rule
 from rich import box, print, print_json
 from rich.console import Console
@@ -64,6 +65,7 @@ class ResourceTable:
         values = map(str, values)  # type: ignore
         self.table.add_row(*values, style=style)
 
+    @profiled("ResourceTable.display", "render")
     def display(self) -> None:
         self.console.print(self.table)
 
@@ -193,6 +195,14 @@ def display(_str: Any) -> None:
     print(_str)
 
 
+def display_diagnostic(_str: Any) -> None:
+    """
+    Print a diagnostic (e.g. --verbose timings) to stderr, so stdout stays
+    parseable with --format json.
+    """
+    Console(stderr=True).print(_str)
+
+
 def display_json(_data: str) -> None:
     """
     Print the given data as JSON.
@@ -0,0 +1,51 @@
+import os
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+from loguru import logger
+
+try:
+    import fcntl
+except ImportError:  # Windows, locking is skipped, writes are still atomic
+    fcntl = None  # type: ignore
+
+
+@contextmanager
+def file_lock(path: Path, shared: bool = False) -> Iterator[None]:
+    """
+    Hold an advisory lock on the `path` lock file, blocking until it is available.
+    Shared locks may be held by many readers, an exclusive one by a single writer.
+    Locks are per open file, so nesting file_lock on the same path in one process
+    deadlocks - take the lock once around the whole read-modify-write.
+    """
+    if fcntl is None:
+        logger.debug(f"File locking unavailable, not locking {path}")
+        yield
+        return
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a") as lock_file:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+def atomic_write(path: Path, data: str) -> None:
+    """
+    Write `data` to a temporary file next to `path` and rename it over `path`,
+    so readers see either the old or the new content, never a truncated file.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
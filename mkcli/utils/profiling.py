@@ -0,0 +1,254 @@
+"""
+Spans timing the phases of a command, reported by `mkcli --profile`.
+
+Nothing is recorded until the profiler is started, so instrumented code only
+pays for a flag check in normal runs.
+"""
+
+import functools
+import inspect
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Iterator
+
+from mkcli.core.enums import ProfileFormat
+
+# mkcli.main imports this module first, so the startup span covers its imports
+STARTED: float = time.perf_counter()
+
+DEFAULT_OUTPUT: dict[ProfileFormat, str] = {
+    ProfileFormat.JSON: "mkcli-profile.json",
+    ProfileFormat.CHROME: "mkcli-trace.json",
+}
+
+
+@dataclass(eq=False)
+class Span:
+    name: str
+    category: str
+    start: float  # time.perf_counter()
+    thread: int
+    parent: "Span | None" = None
+    duration: float = 0.0
+    nested: float = 0.0  # time spent in child spans
+
+    @property
+    def self_time(self) -> float:
+        return max(self.duration - self.nested, 0.0)
+
+
+_current: ContextVar[Span | None] = ContextVar("mkcli_span", default=None)
+
+
+class Profiler:
+    """Collects finished spans of all threads (and asyncio tasks)."""
+
+    def __init__(self) -> None:
+        self.enabled: bool = False
+        self.spans: list[Span] = []
+        self._lock = threading.Lock()
+
+    def start(self, since: float = STARTED) -> None:
+        """Record spans from now on, the time `since` is reported as startup"""
+        self.enabled = True
+        now = time.perf_counter()
+        self.record(
+            Span(
+                "startup", "import", since, threading.get_ident(), duration=now - since
+            )
+        )
+
+    def stop(self) -> None:
+        self.enabled = False
+
+    def record(self, span: Span) -> None:
+        with self._lock:
+            self.spans.append(span)
+
+    @property
+    def origin(self) -> float:
+        return min((s.start for s in self.spans), default=STARTED)
+
+    @property
+    def wall_time(self) -> float:
+        end = max((s.start + s.duration for s in self.spans), default=self.origin)
+        return end - self.origin
+
+    def summary(self) -> list[dict]:
+        """
+        Spans aggregated by category and name, longest first.
+        Concurrent calls (threads, asyncio tasks) add up to more total than wall time,
+        `wall_ms` is how long at least one of them was running.
+        """
+        groups: dict[tuple[str, str], list[Span]] = {}
+        for span in self.spans:
+            groups.setdefault((span.category, span.name), []).append(span)
+
+        rows = [
+            {
+                "category": category,
+                "name": name,
+                "calls": len(spans),
+                "total_ms": sum(s.duration for s in spans) * 1000,
+                "self_ms": sum(s.self_time for s in spans) * 1000,
+                "wall_ms": _covered(spans) * 1000,
+            }
+            for (category, name), spans in groups.items()
+        ]
+        return sorted(rows, key=lambda row: row["wall_ms"], reverse=True)
+
+    def to_json(self) -> dict:
+        origin = self.origin
+        ids = {span: index for index, span in enumerate(self.spans)}
+        return {
+            "wall_ms": round(self.wall_time * 1000, 3),
+            "summary": [
+                {
+                    key: round(value, 3) if isinstance(value, float) else value
+                    for key, value in row.items()
+                }
+                for row in self.summary()
+            ],
+            "spans": [
+                {
+                    "id": ids[span],
+                    "parent": ids.get(span.parent),
+                    "name": span.name,
+                    "category": span.category,
+                    "start_ms": round((span.start - origin) * 1000, 3),
+                    "duration_ms": round(span.duration * 1000, 3),
+                    "self_ms": round(span.self_time * 1000, 3),
+                    "thread": span.thread,
+                }
+                for span in self.spans
+            ],
+        }
+
+    def to_chrome_trace(self) -> dict:
+        """Trace Event Format, see chrome://tracing or https://ui.perfetto.dev"""
+        origin, pid = self.origin, os.getpid()
+        return {
+            "displayTimeUnit": "ms",
+            "traceEvents": [
+                {
+                    "name": span.name,
+                    "cat": span.category,
+                    "ph": "X",  # complete event
+                    "ts": round((span.start - origin) * 1e6, 1),
+                    "dur": round(span.duration * 1e6, 1),
+                    "pid": pid,
+                    "tid": span.thread,
+                }
+                for span in sorted(self.spans, key=lambda s: s.start)
+            ],
+        }
+
+    def report(self, format: ProfileFormat, output: Path | None = None) -> None:
+        """Print the breakdown table (stderr) or write the profile file"""
+        from rich.console import Console
+        from rich.table import Table
+
+        console = Console(stderr=True)
+        if format is not ProfileFormat.TABLE:
+            path = Path(output or DEFAULT_OUTPUT[format])
+            data = (
+                self.to_json()
+                if format is ProfileFormat.JSON
+                else self.to_chrome_trace()
+            )
+            path.write_text(json.dumps(data, indent=2))
+            console.print(f"Profile written to {path}")
+            return
+
+        wall_ms = self.wall_time * 1000
+        table = Table(title=f"mkcli profile ({wall_ms:.1f}ms)")
+        for column in ("Category", "Span", "Calls", "Total ms", "Self ms", "Wall ms"):
+            table.add_column(
+                column, justify="left" if column in ("Category", "Span") else "right"
+            )
+        for row in self.summary():
+            table.add_row(
+                row["category"],
+                row["name"],
+                str(row["calls"]),
+                f"{row['total_ms']:.1f}",
+                f"{row['self_ms']:.1f}",
+                f"{row['wall_ms']:.1f}",
+            )
+        console.print(table)
+
+
+def _covered(spans: list[Span]) -> float:
+    """Length of the union of the spans' intervals"""
+    covered, end = 0.0, float("-inf")
+    for span in sorted(spans, key=lambda s: s.start):
+        span_end = span.start + span.duration
+        if span_end > end:
+            covered += span_end - max(span.start, end)
+            end = span_end
+    return covered
+
+
+PROFILER: Profiler = Profiler()
+
+
+@contextmanager
+def span(name: str, category: str = "mkcli") -> Iterator[None]:
+    """Time the enclosed block, nested spans are subtracted from its self time"""
+    if not PROFILER.enabled:
+        yield
+        return
+    parent = _current.get()
+    current = Span(name, category, time.perf_counter(), threading.get_ident(), parent)
+    token = _current.set(current)
+    try:
+        yield
+    finally:
+        current.duration = time.perf_counter() - current.start
+        _current.reset(token)
+        if parent is not None:
+            parent.nested += current.duration
+        PROFILER.record(current)
+
+
+def profiled(name: str | None = None, category: str = "mkcli") -> Callable:
+    """Decorator running the function (or coroutine function) in a span"""
+
+    def decorator(func: Callable) -> Callable:
+        label = name or func.__qualname__
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with span(label, category):
+                    return await func(*args, **kwargs)
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(label, category):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def profile_methods(category: str) -> Callable[[type], type]:
+    """Class decorator running every public method in a span"""
+
+    def decorator(cls: type) -> type:
+        for attr, value in list(vars(cls).items()):
+            if not attr.startswith("_") and inspect.isfunction(value):
+                setattr(cls, attr, profiled(f"{cls.__name__}.{attr}", category)(value))
+        return cls
+
+    return decorator
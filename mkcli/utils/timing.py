@@ -1,4 +1,7 @@
 import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Iterator
 
 
 def wait_until(predicate, timeout, period=0.25, *args, **kwargs) -> bool:
@@ -17,3 +20,22 @@ def wait_until(predicate, timeout, period=0.25, *args, **kwargs) -> bool:
             return True
         time.sleep(period)
     return False
+
+
+@dataclass
+class Stopwatch:
+    started: float = 0.0
+    elapsed: float = 0.0
+
+
+@contextmanager
+def stopwatch() -> Iterator[Stopwatch]:
+    """
+    Measure wall-clock time of the enclosed block.
+    :return: Stopwatch whose `elapsed` (seconds) is set when the block exits
+    """
+    watch = Stopwatch(started=time.perf_counter())
+    try:
+        yield watch
+    finally:
+        watch.elapsed = time.perf_counter() - watch.started
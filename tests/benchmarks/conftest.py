@@ -0,0 +1,63 @@
+from contextlib import contextmanager
+from unittest.mock import patch
+
+import pytest
+
+from mkcli.core import mk8s
+from mkcli.core.enums import SupportedAuthTypes
+from mkcli.core.models.context import Context, ContextCatalogue
+from mkcli.utils import cache
+from tests.conftest import MemoryStorage
+from tests.src.fake_api import FakeMK8SServer
+
+CLI_MODULES: list[str] = [
+    "mkcli.cli.cluster",
+    "mkcli.cli.node_pool",
+    "mkcli.cli.flavors",
+    "mkcli.cli.kubernetes_version",
+]
+
+
+@pytest.fixture
+def fake_api(tmp_path):
+    """Start a local stand-in MK8S API for the duration of a test"""
+    mk8s.close_http_clients()
+    cache.close_backend()
+    with patch.object(cache, "CACHE_DIR", tmp_path / "cache"):
+        with FakeMK8SServer() as server:
+            yield server
+        mk8s.close_http_clients()
+        cache.close_backend()
+
+
+@pytest.fixture
+def fake_api_catalogue(fake_api):
+    """Point every CLI command at the stand-in API through an in-memory catalogue"""
+    catalogue = ContextCatalogue(storage=MemoryStorage())
+    catalogue.add(
+        Context(
+            name="bench",
+            client_id="bench_client_id",
+            realm="bench_realm",
+            scope="bench_scope",
+            region="WAW4-1",
+            identity_server_url="https://bench.identity.server",
+            mk8s_api_url=fake_api.api_url,
+            auth_type=SupportedAuthTypes.API_KEY,
+            api_key="bench_api_key",
+        )
+    )
+    catalogue.switch("bench")
+
+    @contextmanager
+    def _open():
+        yield catalogue
+
+    patches = [patch(f"{m}.open_context_catalogue", _open) for m in CLI_MODULES]
+    for p in patches:
+        p.start()
+    try:
+        yield catalogue
+    finally:
+        for p in patches:
+            p.stop()
@@ -0,0 +1,46 @@
+import time
+
+import pytest
+
+from mkcli.utils.cache import CacheEntry, ShelveBackend, SqliteBackend
+from tests.src.fake_api import machine_spec_payload
+
+pytestmark = pytest.mark.benchmark
+
+OPERATIONS: int = 200
+
+
+def run(backend, operations: int = OPERATIONS) -> dict[str, float]:
+    value = {f"spec-{i}": machine_spec_payload("region-0", i) for i in range(50)}
+    timings = {}
+
+    started = time.perf_counter()
+    for i in range(operations):
+        backend.set(f"key-{i % 20}", CacheEntry("bench", value, i, i))
+    timings["save"] = (time.perf_counter() - started) / operations
+
+    started = time.perf_counter()
+    for i in range(operations):
+        entry = backend.get(f"key-{i % 20}")
+        backend.touch(f"key-{i % 20}", float(i))
+    timings["load"] = (time.perf_counter() - started) / operations
+
+    assert entry.value == value
+    return timings
+
+
+def test_cache_backends_micro_benchmark(tmp_path):
+    results = {}
+    for backend_cls in (ShelveBackend, SqliteBackend):
+        backend = backend_cls(tmp_path / backend_cls.__name__)
+        try:
+            results[backend_cls.__name__] = run(backend)
+        finally:
+            backend.close()
+
+    for name, timings in results.items():
+        print(
+            f"\n{name}: save {timings['save'] * 1e6:.0f}us/op, "
+            f"load {timings['load'] * 1e6:.0f}us/op"
+        )
+    assert results["SqliteBackend"]["load"] < results["ShelveBackend"]["load"]
@@ -0,0 +1,78 @@
+import time
+
+import pytest
+
+from mkcli.core.models import Token
+from mkcli.core.models.context import (
+    Context,
+    ContextCatalogue,
+    JsonStorage,
+    SqliteStorage,
+)
+
+pytestmark = pytest.mark.benchmark
+
+CONTEXTS: int = 1000
+ROUNDS: int = 5
+
+
+class EagerCatalogue(ContextCatalogue):
+    """Catalogue validating every context on load, as before lazy loading"""
+
+    def load(self):
+        super().load()
+        self.list_all()
+
+
+def make_catalogue_data() -> dict:
+    contexts = {
+        f"ctx-{i}": Context(
+            name=f"ctx-{i}",
+            client_id="mkcli",
+            realm=f"tenant-{i}",
+            scope="openid",
+            region="WAW4-1",
+            identity_server_url="https://identity.example.com",
+            mk8s_api_url="https://mk8s.example.com/api/v1",
+            auth_type="openid",
+            token=Token(access_token="x" * 1024, refresh_token="y" * 1024),
+        ).model_dump()
+        for i in range(CONTEXTS)
+    }
+    return {"current": "ctx-0", "cat": contexts}
+
+
+def startup(catalogue_cls, make_storage) -> float:
+    """Best time of opening the catalogue and reading the current context"""
+    timings = []
+    for _ in range(ROUNDS):
+        started = time.perf_counter()
+        cat = catalogue_cls(storage=make_storage())
+        assert cat.current_context.name == "ctx-0"
+        cat.save()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def test_catalogue_startup_with_1000_contexts(tmp_path):
+    data = make_catalogue_data()
+    JsonStorage(tmp_path / "contexts.json").save(data)
+    SqliteStorage(tmp_path / "contexts.sqlite").save(data)
+
+    results = {
+        "json, eager": startup(
+            EagerCatalogue, lambda: JsonStorage(tmp_path / "contexts.json")
+        ),
+        "json, lazy": startup(
+            ContextCatalogue, lambda: JsonStorage(tmp_path / "contexts.json")
+        ),
+        "sqlite, lazy": startup(
+            ContextCatalogue, lambda: SqliteStorage(tmp_path / "contexts.sqlite")
+        ),
+    }
+
+    print()
+    for name, elapsed in results.items():
+        print(f"{CONTEXTS} contexts, {name}: {elapsed * 1000:.1f}ms")
+    assert results["json, lazy"] < results["json, eager"]
+    assert results["sqlite, lazy"] < results["json, eager"]
@@ -0,0 +1,200 @@
+"""
+Cold-start time, command latency and requests issued by every CLI command,
+each run in a fresh interpreter against the local stand-in MK8S API.
+
+Results are written as JSON (MKCLI_BENCH_RESULTS, default .benchmarks/commands.json).
+Point MKCLI_BENCH_BASELINE at an earlier results file to fail on regressions.
+The stand-in API can be made slower or its payloads larger with
+MKCLI_BENCH_LATENCY (seconds per response), MKCLI_BENCH_CLUSTERS and
+MKCLI_BENCH_PADDING (bytes added to every resource).
+"""
+
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from mkcli.core.enums import SupportedAuthTypes
+from mkcli.core.models.context import Context, ContextCatalogue, JsonStorage
+from tests.src.fake_api import FakeMK8SAPI, FakeMK8SServer
+
+pytestmark = pytest.mark.benchmark
+
+ROOT: Path = Path(__file__).parents[2]
+
+LATENCY: float = float(os.getenv("MKCLI_BENCH_LATENCY", "0"))
+CLUSTERS: int = int(os.getenv("MKCLI_BENCH_CLUSTERS", "20"))
+PADDING: int = int(os.getenv("MKCLI_BENCH_PADDING", "0"))
+ROUNDS: int = int(os.getenv("MKCLI_BENCH_ROUNDS", "3"))
+RESULTS_PATH: Path = Path(os.getenv("MKCLI_BENCH_RESULTS", ".benchmarks/commands.json"))
+BASELINE_PATH: str | None = os.getenv("MKCLI_BENCH_BASELINE")
+# a command regresses when slower than baseline * SLOWDOWN + NOISE_MS
+SLOWDOWN: float = 1.5
+NOISE_MS: float = 50.0
+# messages of mkcli.main.run, which reports most failures without an exit code
+FAILURE_MARKERS: tuple[str, ...] = ("Error:", "error occurred", "No Active Session")
+
+COMMANDS: dict[str, list[str]] = {
+    "version": ["--version"],
+    "help": ["--help"],
+    "auth context list": ["auth", "context", "list"],
+    "cluster list": ["cluster", "list"],
+    "cluster list --with-node-pools": ["cluster", "list", "--with-node-pools"],
+    "cluster show": ["cluster", "show", "cluster-0"],
+    "cluster create": ["cluster", "create", "--name", "bench"],
+    "cluster upgrade": ["cluster", "upgrade", "cluster-0", "1.30.10"],
+    "cluster get-kubeconfig": ["cluster", "get-kubeconfig", "cluster-0"],
+    "cluster delete": ["cluster", "delete", "cluster-0", "--confirm"],
+    "node-pool list": ["node-pool", "list", "cluster-0"],
+    "node-pool show": ["node-pool", "show", "cluster-0", "cluster-0-pool-0"],
+    "node-pool create": ["node-pool", "create", "cluster-0", "--flavor", "hma.medium"],
+    "node-pool update": [
+        *("node-pool", "update", "cluster-0", "cluster-0-pool-0"),
+        *("--node-count", "2"),
+    ],
+    "node-pool delete": [
+        *("node-pool", "delete", "cluster-0", "cluster-0-pool-0", "--confirm"),
+    ],
+    "flavors list": ["flavors", "list"],
+    "kubernetes-version list": ["kubernetes-version", "list"],
+    "backup list": ["backup", "list", "cluster-0", "--format", "json"],
+    "backup create": ["backup", "create", "cluster-0"],
+    "resource-usage show": ["resource-usage", "show", "cluster-0"],
+}
+
+RUN_MKCLI: str = """
+import json, sys, time
+started = time.perf_counter()
+sys.argv = ["mkcli", *{args!r}]
+from mkcli.main import run
+imported = time.perf_counter()
+code = 0
+try:
+    run()
+except SystemExit as err:
+    code = err.code or 0
+timings = {{"import_ms": (imported - started) * 1000,
+           "command_ms": (time.perf_counter() - imported) * 1000}}
+print("BENCH", json.dumps(timings), file=sys.stderr)
+sys.exit(code)
+"""
+
+
+@pytest.fixture(scope="module")
+def bench_api():
+    api = FakeMK8SAPI(clusters=CLUSTERS, latency=LATENCY, padding=PADDING)
+    with FakeMK8SServer(api) as server:
+        yield server
+
+
+@pytest.fixture(scope="module")
+def bench_env(bench_api, tmp_path_factory) -> dict:
+    """Environment of a mkcli process using a fresh config and cache directory"""
+    home = tmp_path_factory.mktemp("mkcli")
+    catalogue = ContextCatalogue(
+        storage=JsonStorage(home / "config" / "mkcli" / "contexts.json")
+    )
+    catalogue.add(
+        Context(
+            name="bench",
+            client_id="bench_client_id",
+            realm="bench_realm",
+            scope="bench_scope",
+            region="WAW4-1",
+            identity_server_url="https://bench.identity.server",
+            mk8s_api_url=bench_api.api_url,
+            auth_type=SupportedAuthTypes.API_KEY,
+            api_key="bench_api_key",
+        )
+    )
+    catalogue.switch("bench")
+    return {
+        **os.environ,
+        "XDG_CONFIG_HOME": str(home / "config"),
+        "XDG_CACHE_HOME": str(home / "cache"),
+        "PYTHONPATH": os.pathsep.join(
+            filter(None, [str(ROOT), os.getenv("PYTHONPATH")])
+        ),
+        "MKCLI_BETA_FEATURE_FLAG": "True",
+        "COLUMNS": "200",
+    }
+
+
+@pytest.fixture(scope="module")
+def results():
+    """Collected measurements, written as JSON once all commands ran"""
+    _results: dict[str, dict] = {}
+    yield _results
+    RESULTS_PATH.parent.mkdir(parents=True, exist_ok=True)
+    report = {
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "latency": LATENCY,
+            "clusters": CLUSTERS,
+            "padding": PADDING,
+            "rounds": ROUNDS,
+        },
+        "commands": _results,
+    }
+    RESULTS_PATH.write_text(json.dumps(report, indent=2))
+
+
+@pytest.fixture(scope="module")
+def baseline() -> dict[str, dict]:
+    if not BASELINE_PATH:
+        return {}
+    return json.loads(Path(BASELINE_PATH).read_text())["commands"]
+
+
+def run_command(args: list[str], env: dict, cwd: Path) -> dict:
+    started = time.perf_counter()
+    process = subprocess.run(
+        [sys.executable, "-c", RUN_MKCLI.format(args=args)],
+        capture_output=True,
+        text=True,
+        env=env,
+        cwd=cwd,
+    )
+    total_ms = (time.perf_counter() - started) * 1000
+    assert process.returncode == 0, process.stdout + process.stderr
+    assert not any(marker in process.stdout for marker in FAILURE_MARKERS), (
+        process.stdout
+    )
+    timings = json.loads(process.stderr.rsplit("BENCH", 1)[1])
+    return {"total_ms": total_ms, **timings}
+
+
+@pytest.mark.parametrize("name", COMMANDS)
+def test_command(name, bench_api, bench_env, results, baseline, tmp_path):
+    rounds = []
+    for _ in range(ROUNDS):
+        bench_api.reset_counters()
+        rounds.append(run_command(COMMANDS[name], bench_env, cwd=tmp_path))
+
+    result = {
+        metric: round(statistics.median(r[metric] for r in rounds), 1)
+        for metric in ("total_ms", "import_ms", "command_ms")
+    }
+    result |= {
+        "requests": len(bench_api.requests),
+        "connections": bench_api.connections,
+    }
+    results[name] = result
+    print(
+        f"\n{name}: {result['total_ms']:.0f}ms total, "
+        f"{result['import_ms']:.0f}ms import, {result['command_ms']:.0f}ms command, "
+        f"{result['requests']} requests"
+    )
+
+    if name in baseline:
+        before = baseline[name]
+        assert result["requests"] <= before["requests"]
+        for metric in ("total_ms", "command_ms"):
+            assert result[metric] <= before[metric] * SLOWDOWN + NOISE_MS, metric
@@ -0,0 +1,44 @@
+import pytest
+
+from mkcli.core import mk8s
+from mkcli.core.adapters import APIKeyAdapter
+
+pytestmark = pytest.mark.benchmark
+
+
+@pytest.mark.parametrize(
+    "args, max_connections",
+    [
+        # versions and regions are prefetched concurrently, one connection each
+        (["cluster", "create", "--name", "bench"], 2),
+        (["node-pool", "create", "cluster-0", "--flavor", "hma.medium"], 1),
+        (["cluster", "list"], 1),
+        (["flavors", "list"], 1),
+    ],
+)
+def test_single_tcp_connection_per_command(
+    args, max_connections, fake_api, fake_api_catalogue, make_mkcli_call
+):
+    result = make_mkcli_call(args)
+
+    assert result.exit_code == 0, result.output
+    print(
+        f"\n{' '.join(args)}: {len(fake_api.requests)} requests "
+        f"over {fake_api.connections} TCP connection(s)"
+    )
+    assert len(fake_api.requests) >= 1
+    assert 1 <= fake_api.connections <= max_connections
+
+
+def test_clients_share_pool_per_identity(fake_api, fake_api_catalogue):
+    ctx = fake_api_catalogue.current_context
+    first = mk8s.MK8SClient(APIKeyAdapter(ctx), ctx.mk8s_api_url)
+    second = mk8s.MK8SClient(APIKeyAdapter(ctx), ctx.mk8s_api_url)
+    assert first.api is second.api
+
+    other_ctx = ctx.model_copy(update={"api_key": "other_api_key"})
+    other = mk8s.MK8SClient(APIKeyAdapter(other_ctx), ctx.mk8s_api_url)
+    assert other.api is not first.api
+
+    mk8s.close_http_clients()
+    assert first.api.is_closed and other.api.is_closed
@@ -0,0 +1,79 @@
+import subprocess
+import sys
+
+import pytest
+
+pytestmark = pytest.mark.benchmark
+
+ROUNDS: int = 3
+# cumulative import time of mkcli.main, dominated by pydantic-settings
+IMPORT_BUDGET_MS: float = 400.0
+# only needed by the commands using them
+HEAVY_MODULES: tuple[str, ...] = (
+    "keycloak",
+    "httpx",
+    "rich",
+    "loguru",
+    "readchar",
+    "pyperclip",
+    "mkcli.core.mk8s",
+)
+
+RUN_MKCLI: str = """
+import sys
+sys.argv = ["mkcli", *{args!r}]
+from mkcli.main import run
+try:
+    run()
+except SystemExit:
+    pass
+print("imported:", *sorted(m for m in {heavy!r} if m in sys.modules), file=sys.stderr)
+"""
+
+
+def import_time_ms() -> float:
+    """Cumulative `python -X importtime` time of mkcli.main, in milliseconds"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import mkcli.main"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    for line in result.stderr.splitlines():
+        _, cumulative, module = line.split("|")
+        if module.strip() == "mkcli.main":
+            return int(cumulative) / 1000
+    raise AssertionError("mkcli.main not found in importtime output")
+
+
+def imported_heavy_modules(*args: str) -> list[str]:
+    result = subprocess.run(
+        [sys.executable, "-c", RUN_MKCLI.format(args=args, heavy=HEAVY_MODULES)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    line = result.stderr.splitlines()[-1]
+    return line.removeprefix("imported:").split()
+
+
+def test_import_time_budget():
+    best = min(import_time_ms() for _ in range(ROUNDS))
+
+    print(f"\nimport mkcli.main: {best:.1f}ms (budget {IMPORT_BUDGET_MS:.0f}ms)")
+    assert best < IMPORT_BUDGET_MS
+
+
+@pytest.mark.parametrize(
+    "args, expected",
+    [
+        (("--version",), []),
+        (("--help",), ["rich"]),  # Typer formats the help with rich
+    ],
+)
+def test_commands_are_not_imported(args, expected):
+    assert imported_heavy_modules(*args) == expected
+
+
+def test_dispatched_command_is_imported():
+    assert "mkcli.core.mk8s" in imported_heavy_modules("cluster", "--help")
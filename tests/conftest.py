@@ -2,7 +2,7 @@ import pytest
 import os
 from unittest import mock
 from typing import Optional
-from mkcli.core.models.context import ContextCatalogue
+from mkcli.core.models.context import CatalogueChanges, ContextCatalogue
 import re
 import hashlib
 from unittest.mock import MagicMock, patch
@@ -30,6 +30,9 @@ class MemoryStorage:
     def save(self, _dict: dict) -> None:
         self.data = _dict
 
+    def update(self, changes: CatalogueChanges) -> None:
+        self.data = changes.apply(self.data)
+
     def load(self) -> dict:
         return self.data
 
@@ -47,6 +50,7 @@ def ctx_storage():
     store = MemoryStorage()
     mocked = mock.Mock(spec=MemoryStorage)
     mocked.save = mock.Mock(side_effect=store.save)
+    mocked.update = mock.Mock(side_effect=store.update)
     mocked.load = mock.Mock(side_effect=store.load)
     mocked.clear = mock.Mock(side_effect=store.clear)
     mocked.ensure_exists = mock.Mock(side_effect=store.ensure_exists)
@@ -0,0 +1,295 @@
+import hashlib
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Self
+
+API_PREFIX: str = "/api/v1"
+TIMESTAMP: str = "2025-01-01T12:00:00.000000Z"
+
+
+def region_payload(index: int = 0) -> dict:
+    return {
+        "id": f"region-{index}",
+        "name": "WAW4-1" if index == 0 else f"REGION-{index}",
+        "is_active": True,
+        "created_at": TIMESTAMP,
+        "updated_at": TIMESTAMP,
+    }
+
+
+def machine_spec_payload(region_id: str, index: int = 0) -> dict:
+    return {
+        "id": f"{region_id}-spec-{index}",
+        "region": region_id,
+        "name": "hma.medium" if index == 0 else f"hma.spec-{index}",
+        "cpu": 2,
+        "memory": 4096,
+        "local_disk_size": 50,
+        "is_active": True,
+        "tags": [],
+        "created_at": TIMESTAMP,
+        "updated_at": TIMESTAMP,
+    }
+
+
+def kubernetes_version_payload(index: int = 0) -> dict:
+    return {
+        "id": f"k8s-version-{index}",
+        "version": "1.30.10" if index == 0 else f"1.{30 - index}.0",
+        "is_active": True,
+        "created_at": TIMESTAMP,
+        "updated_at": TIMESTAMP,
+    }
+
+
+def cluster_payload(index: int = 0) -> dict:
+    return {
+        "id": f"cluster-{index}",
+        "name": f"cluster-{index}",
+        "status": "Running",
+        "phase": "Ready",
+        "health": "Healthy",
+        "control_plane": {
+            "custom": {"size": 3, "machine_spec": machine_spec_payload("region-0")}
+        },
+        "version": kubernetes_version_payload(),
+        "created_at": TIMESTAMP,
+        "updated_at": TIMESTAMP,
+    }
+
+
+def node_pool_payload(cluster_id: str, index: int = 0) -> dict:
+    return {
+        "id": f"{cluster_id}-pool-{index}",
+        "name": f"pool-{index}",
+        "size": 1,
+        "size_min": 1,
+        "size_max": 1,
+        "status": "Running",
+        "machine_spec": machine_spec_payload("region-0"),
+        "created_at": TIMESTAMP,
+        "updated_at": TIMESTAMP,
+    }
+
+
+def backup_payload() -> dict:
+    return {
+        "enabled": True,
+        "schedule": "0 1 * * * *",
+        "ttl": "720h",
+        "storage_endpoint": "https://s3.waw4-1.cloudferro.com",
+        "should_backup_volumes": False,
+        "created_at": TIMESTAMP,
+        "updated_at": TIMESTAMP,
+    }
+
+
+type Route = tuple[str, re.Pattern, Callable[..., tuple[int, dict | None]]]
+
+
+class FakeMK8SAPI:
+    """In-memory stand-in for the MK8S API serving canned catalogue and cluster data."""
+
+    def __init__(
+        self,
+        clusters: int = 2,
+        node_pools: int = 1,
+        tokens: set[str] | None = None,
+        etags: bool = False,
+        latency: float = 0.0,
+        padding: int = 0,
+    ) -> None:
+        # accepted Authorization header values, None accepts any
+        self.tokens: set[str] | None = tokens
+        # send ETags and answer matching If-None-Match with 304 Not Modified
+        self.etags = etags
+        # seconds every response is delayed by, like a remote API
+        self.latency = latency
+        # bytes of filler added to every resource, to emulate larger payloads
+        self.padding = padding
+        self.clusters = [cluster_payload(i) for i in range(clusters)]
+        self.node_pools = {
+            c["id"]: [node_pool_payload(c["id"], i) for i in range(node_pools)]
+            for c in self.clusters
+        }
+        cluster = r"/cluster/(?P<cid>[^/]+)"
+        pool = cluster + r"/node-pool/(?P<pid>[^/]+)"
+        self.routes: list[Route] = [
+            ("GET", re.compile(r"/cluster"), self.list_clusters),
+            ("POST", re.compile(r"/cluster"), self.create_cluster),
+            ("GET", re.compile(cluster), self.get_cluster),
+            ("PUT", re.compile(cluster), self.get_cluster),
+            ("DELETE", re.compile(cluster), self.delete),
+            ("GET", re.compile(cluster + r"/files"), self.files),
+            ("GET", re.compile(cluster + r"/node-pool"), self.list_pools),
+            ("POST", re.compile(cluster + r"/node-pool"), self.create_pool),
+            ("GET", re.compile(pool), self.get_pool),
+            ("PUT", re.compile(pool), self.get_pool),
+            ("DELETE", re.compile(pool), self.delete),
+            ("GET", re.compile(cluster + r"/backup"), self.list_backups),
+            ("PUT", re.compile(cluster + r"/backup"), self.create_backup),
+            ("GET", re.compile(cluster + r"/resource-counts"), self.resources),
+            ("GET", re.compile(r"/region"), self.list_regions),
+            ("GET", re.compile(r"/region/(?P<rid>[^/]+)/machine-spec"), self.specs),
+            ("GET", re.compile(r"/kubernetes-version"), self.list_versions),
+        ]
+
+    def dispatch(self, method: str, path: str) -> tuple[int, dict | None]:
+        for route_method, pattern, handler in self.routes:
+            match = pattern.fullmatch(path)
+            if route_method == method and match:
+                status, body = handler(**match.groupdict())
+                return status, self.pad(body)
+        return 404, {"detail": "Not Found"}
+
+    def pad(self, body: dict | None) -> dict | None:
+        """Add the filler to every resource of the response body"""
+        if not self.padding or body is None:
+            return body
+        filler = "x" * self.padding
+        if "items" in body:
+            items = [{**item, "description": filler} for item in body["items"]]
+            return {**body, "items": items}
+        if "created_at" in body:
+            return {**body, "description": filler}
+        return body
+
+    def list_clusters(self):
+        return 200, {"items": self.clusters}
+
+    def create_cluster(self):
+        return 201, cluster_payload(len(self.clusters))
+
+    def get_cluster(self, cid: str):
+        for cluster in self.clusters:
+            if cluster["id"] == cid:
+                return 200, cluster
+        return 404, {"detail": "Not Found"}
+
+    def delete(self, **ids: str):
+        return 204, None
+
+    def files(self, cid: str):
+        return 200, {"kubeconfig": f"apiVersion: v1\nkind: Config\n# {cid}\n"}
+
+    def list_pools(self, cid: str):
+        return 200, {"items": self.node_pools.get(cid, [])}
+
+    def create_pool(self, cid: str):
+        return 201, node_pool_payload(cid, len(self.node_pools.get(cid, [])))
+
+    def get_pool(self, cid: str, pid: str):
+        for node_pool in self.node_pools.get(cid, []):
+            if node_pool["id"] == pid:
+                return 200, node_pool
+        return 404, {"detail": "Not Found"}
+
+    def list_backups(self, cid: str):
+        return 200, {"items": [backup_payload()]}
+
+    def create_backup(self, cid: str):
+        return 200, backup_payload()
+
+    def resources(self, cid: str):
+        return 200, {"counts": {"machines": 4, "volumes": 2, "load_balancers": 1}}
+
+    def list_regions(self):
+        return 200, {"items": [region_payload()]}
+
+    def specs(self, rid: str):
+        return 200, {"items": [machine_spec_payload(rid)]}
+
+    def list_versions(self):
+        return 200, {"items": [kubernetes_version_payload()]}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, so connection reuse is observable
+    server: "FakeMK8SServer"
+
+    def setup(self) -> None:
+        super().setup()
+        self.server.record_connection()
+
+    def _handle(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            self.rfile.read(length)
+        path = self.path.split("?", 1)[0].removeprefix(API_PREFIX).rstrip("/")
+        self.server.record_request(self.command, path)
+        tokens = self.server.api.tokens
+        if tokens is not None and self.headers.get("Authorization") not in tokens:
+            status, body = 401, {"detail": "Invalid token"}
+        else:
+            status, body = self.server.api.dispatch(self.command, path)
+        payload = json.dumps(body).encode() if body is not None else b""
+        if self.server.api.latency:
+            time.sleep(self.server.api.latency)
+        etag = None
+        if self.server.api.etags and self.command == "GET" and status == 200:
+            etag = f'"{hashlib.sha256(payload).hexdigest()[:16]}"'
+            if self.headers.get("If-None-Match") == etag:
+                status, payload = 304, b""
+        self.server.record_status(status)
+        self.send_response(status)
+        if etag:
+            self.send_header("ETag", etag)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    do_GET = do_POST = do_PUT = do_DELETE = _handle
+
+    def log_message(self, format, *args):
+        """Supress logging of requests to the console"""
+        pass
+
+
+class FakeMK8SServer(ThreadingHTTPServer):
+    """Threaded local HTTP server exposing FakeMK8SAPI, counting connections and requests."""
+
+    daemon_threads = True
+
+    def __init__(self, api: FakeMK8SAPI | None = None) -> None:
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.api = api or FakeMK8SAPI()
+        self.connections: int = 0
+        self.requests: list[tuple[str, str]] = []
+        self.statuses: list[int] = []
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+
+    def record_connection(self) -> None:
+        with self._lock:
+            self.connections += 1
+
+    def record_request(self, method: str, path: str) -> None:
+        with self._lock:
+            self.requests.append((method, path))
+
+    def record_status(self, status: int) -> None:
+        with self._lock:
+            self.statuses.append(status)
+
+    def reset_counters(self) -> None:
+        with self._lock:
+            self.connections = 0
+            self.requests.clear()
+            self.statuses.clear()
+
+    @property
+    def api_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}{API_PREFIX}"
+
+    def __enter__(self) -> Self:
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.shutdown()
+        self.server_close()
@@ -1,5 +1,7 @@
 import pytest
 from unittest.mock import patch
+from mkcli.core import token_cache
+from mkcli.utils import cache
 from tests.conftest import MemoryStorage
 
 
@@ -14,6 +16,21 @@ def patch_json_storage():
         yield
 
 
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path):
+    """
+    Point the mapping and token caches at a per-test temporary directory,
+    so unit tests never read or write the user's cache.
+    """
+    cache.close_backend()
+    with (
+        patch.object(cache, "CACHE_DIR", tmp_path / "cache"),
+        patch.object(token_cache, "TOKEN_CACHE_DIR", tmp_path / "cache" / "tokens"),
+    ):
+        yield tmp_path / "cache"
+        cache.close_backend()
+
+
 @pytest.fixture(scope="session", autouse=True)
 def setup_unit_test_settings():
     """
@@ -0,0 +1,220 @@
+import threading
+from unittest import mock
+
+import pytest
+
+from mkcli.utils import cache as cache_module
+from mkcli.utils.cache import cache
+
+
+class Clock:
+    def __init__(self):
+        self.time = 1_000_000.0
+
+    def __call__(self) -> float:
+        return self.time
+
+    def advance(self, seconds: float) -> None:
+        self.time += seconds
+
+
+@pytest.fixture(autouse=True, params=["sqlite", "shelve"])
+def backend(request):
+    # TTL tests expect synchronous recomputation, stale-while-revalidate tests opt in
+    with (
+        mock.patch.object(cache_module.APP_SETTINGS, "cache_backend", request.param),
+        mock.patch.object(cache_module.APP_SETTINGS, "cache_stale_while_revalidate", 0),
+    ):
+        yield request.param
+
+
+@pytest.fixture
+def clock():
+    _clock = Clock()
+    with mock.patch.object(cache_module, "now", _clock):
+        yield _clock
+
+
+def make_cached(ttl=None):
+    calls = mock.Mock(side_effect=lambda x: {"value": x})
+
+    def lookup(x):
+        return calls(x)
+
+    return cache(ttl=ttl, enabled=True)(lookup), calls
+
+
+def key_of(func, *args):
+    return cache_module.make_key(func.__wrapped__, args, {})
+
+
+def test_cache_hit_within_ttl(clock):
+    func, calls = make_cached(ttl=60)
+
+    assert func("a") == {"value": "a"}
+    clock.advance(59)
+    assert func("a") == {"value": "a"}
+    assert calls.call_count == 1
+
+
+def test_cache_recomputes_after_ttl(clock):
+    func, calls = make_cached(ttl=60)
+
+    func("a")
+    clock.advance(61)
+    func("a")
+    assert calls.call_count == 2
+
+    entry = cache_module.load(key_of(func, "a"))
+    assert entry.stored_at == clock.time
+
+
+def test_cache_without_ttl_never_expires(clock):
+    func, calls = make_cached(ttl=None)
+
+    func("a")
+    clock.advance(10 * 365 * 24 * 3600)
+    func("a")
+    assert calls.call_count == 1
+
+
+def test_cache_disabled_returns_function_untouched():
+    func = mock.Mock()
+    assert cache(ttl=60, enabled=False)(func) is func
+
+
+def test_lru_eviction(clock):
+    func, calls = make_cached(ttl=None)
+
+    with mock.patch.object(cache_module.APP_SETTINGS, "cache_max_entries", 2):
+        func("a")
+        clock.advance(1)
+        func("b")
+        clock.advance(1)
+        func("a")  # touch "a", so "b" becomes least recently used
+        clock.advance(1)
+        func("c")  # evicts "b"
+
+        assert calls.call_count == 3
+        assert cache_module.load(key_of(func, "a")) is not None
+        assert cache_module.load(key_of(func, "b")) is None
+        assert cache_module.load(key_of(func, "c")) is not None
+
+
+def test_eviction_is_per_function(clock):
+    func, calls = make_cached(ttl=None)
+
+    with mock.patch.object(cache_module.APP_SETTINGS, "cache_max_entries", 2):
+        func("a")
+        for i in range(3):  # e.g. HTTP responses
+            clock.advance(1)
+            entry = cache_module.CacheEntry("other", i, clock.time, clock.time)
+            cache_module.save(f"other-{i}", entry)
+
+        assert cache_module.load(key_of(func, "a")) is not None
+        assert cache_module.load("other-0") is None
+        assert cache_module.get_backend().stats()["other"]["evictions"] == 1
+
+
+def test_backend_selection(backend):
+    assert type(cache_module.get_backend()).__name__.lower().startswith(backend)
+
+
+def test_sqlite_falls_back_to_shelve(tmp_path):
+    with mock.patch.object(cache_module, "sqlite3", None):
+        backend = cache_module.open_backend("sqlite", tmp_path)
+    assert isinstance(backend, cache_module.ShelveBackend)
+
+
+def test_backend_is_thread_safe(backend):
+    store = cache_module.get_backend()
+    entry = cache_module.CacheEntry(value=1, func="f", stored_at=0, accessed_at=0)
+
+    def write(worker: int) -> None:
+        for i in range(25):
+            store.set(f"{worker}-{i}", entry)
+            store.record("f", "misses")
+
+    threads = [threading.Thread(target=write, args=(w,)) for w in range(16)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(store.keys()) == 400
+    assert store.stats()["f"]["misses"] == 400
+
+
+def test_sqlite_entries_visible_to_other_connections(backend, clock, isolated_cache):
+    if backend != "sqlite":
+        pytest.skip("sqlite only")
+    func, calls = make_cached(ttl=60)
+    func("a")
+
+    other_process = cache_module.SqliteBackend(isolated_cache)
+    try:
+        assert other_process.get(key_of(func, "a")).value == {"value": "a"}
+    finally:
+        other_process.close()
+
+
+def test_stale_entry_served_while_revalidating(clock):
+    func, calls = make_cached(ttl=60)
+    func("a")
+    calls.side_effect = lambda x: {"value": x, "refreshed": True}
+
+    with mock.patch.object(
+        cache_module.APP_SETTINGS, "cache_stale_while_revalidate", 600
+    ):
+        clock.advance(120)  # past soft TTL, within the stale window
+        assert func("a") == {"value": "a"}
+        cache_module.wait_for_revalidation(timeout=5)
+
+        assert calls.call_count == 2
+        assert func("a") == {"value": "a", "refreshed": True}
+        assert calls.call_count == 2
+
+
+def test_entry_past_hard_ttl_is_recomputed(clock):
+    func, calls = make_cached(ttl=60)
+    func("a")
+    calls.side_effect = lambda x: {"value": x, "refreshed": True}
+
+    with mock.patch.object(
+        cache_module.APP_SETTINGS, "cache_stale_while_revalidate", 600
+    ):
+        clock.advance(60 + 601)
+        assert func("a") == {"value": "a", "refreshed": True}
+    assert calls.call_count == 2
+
+
+def test_single_background_refresh_per_key(clock):
+    release = threading.Event()
+    func, calls = make_cached(ttl=60)
+    func("a")
+    calls.side_effect = lambda x: release.wait(5) and {"value": x}
+
+    with mock.patch.object(
+        cache_module.APP_SETTINGS, "cache_stale_while_revalidate", 600
+    ):
+        clock.advance(120)
+        for _ in range(5):
+            assert func("a") == {"value": "a"}
+        release.set()
+        cache_module.wait_for_revalidation(timeout=5)
+
+    assert calls.call_count == 2
+
+
+def test_failed_revalidation_keeps_stale_entry(clock):
+    func, calls = make_cached(ttl=60)
+    func("a")
+    calls.side_effect = RuntimeError("catalogue unavailable")
+
+    with mock.patch.object(
+        cache_module.APP_SETTINGS, "cache_stale_while_revalidate", 600
+    ):
+        clock.advance(120)
+        assert func("a") == {"value": "a"}
+        cache_module.wait_for_revalidation(timeout=5)
+        assert func("a") == {"value": "a"}
@@ -0,0 +1,98 @@
+from unittest import mock
+
+
+from mkcli.core.adapters import APIKeyAdapter
+from mkcli.core.enums import SupportedAuthTypes
+from mkcli.core.mk8s import MK8SClient
+from mkcli.core.models.context import Context
+from mkcli.utils.cache import cache, make_key
+
+API_URL: str = "https://test.mk8s.api/api/v1"
+
+
+def get_client(name: str = "test_ctx", api_url: str = API_URL, api_key="key"):
+    ctx = Context(
+        name=name,
+        client_id="test_client_id",
+        realm="test_realm",
+        scope="test_scope",
+        region="test_region",
+        mk8s_api_url=api_url,
+        identity_server_url="https://test.identity.server",
+        auth_type=SupportedAuthTypes.API_KEY,
+        api_key=api_key,
+    )
+    return MK8SClient(APIKeyAdapter(ctx), api_url)
+
+
+def get_machine_specs(client, region_id: str, active_only: bool = False):
+    return client.list_machine_specs(region_id)
+
+
+def get_regions(client):
+    return client.list_regions()
+
+
+def test_key_is_fixed_length_digest():
+    key = make_key(get_machine_specs, (get_client(), "region-id"), {})
+    assert len(key) == 64
+    assert int(key, 16) >= 0
+    assert "region-id" not in key
+
+
+def test_key_is_stable_across_client_instances():
+    first = make_key(get_regions, (get_client(),), {})
+    second = make_key(get_regions, (get_client(),), {})
+    assert first == second
+
+
+def test_key_ignores_call_style_and_formatting():
+    client = get_client()
+    expected = make_key(get_machine_specs, (client, "region-id"), {})
+
+    assert (
+        make_key(get_machine_specs, (client,), {"region_id": "region-id"}) == expected
+    )
+    assert make_key(get_machine_specs, (client, "region-id", False), {}) == expected
+    assert make_key(get_machine_specs, (client, " region-id "), {}) == expected
+    assert (
+        make_key(
+            get_machine_specs, (get_client(api_url=API_URL + "/"), "region-id"), {}
+        )
+        == expected
+    )
+
+
+def test_key_differs_per_function_argument_and_context():
+    client = get_client()
+    base = make_key(get_machine_specs, (client, "region-id"), {})
+
+    assert make_key(get_regions, (client,), {}) != make_key(
+        get_regions, (get_client(name="other_ctx"),), {}
+    )
+    assert make_key(get_machine_specs, (client, "other-region"), {}) != base
+    assert make_key(get_machine_specs, (client, "region-id", True), {}) != base
+    assert (
+        make_key(
+            get_machine_specs,
+            (get_client(api_url="https://other.api"), "region-id"),
+            {},
+        )
+        != base
+    )
+
+
+def test_cached_lookup_is_isolated_across_contexts():
+    lookup = mock.Mock(side_effect=lambda ctx_name: {"from": ctx_name})
+
+    @cache(ttl=60, enabled=True)
+    def get_regions_mapping(client):
+        return lookup(client._auth.context_name)
+
+    prod, dev = get_client(name="prod"), get_client(name="dev")
+
+    assert get_regions_mapping(prod) == {"from": "prod"}
+    assert get_regions_mapping(dev) == {"from": "dev"}
+    assert get_regions_mapping(get_client(name="prod")) == {"from": "prod"}
+    assert get_regions_mapping(get_client(name="dev")) == {"from": "dev"}
+    assert lookup.call_count == 2
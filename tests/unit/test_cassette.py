@@ -0,0 +1,162 @@
+import asyncio
+import gzip
+import json
+import time
+from unittest import mock
+
+import httpx
+import pytest
+
+from mkcli.core import mk8s
+from mkcli.core.adapters import APIKeyAdapter
+from mkcli.core.cassette import Cassette, CassetteMiss, Interaction, ReplayTransport
+from mkcli.core.mk8s import AsyncMK8SClient, MK8SClient
+from mkcli.core.models import Context
+from mkcli.settings import APP_SETTINGS
+from mkcli.utils import cache
+from tests.src.fake_api import FakeMK8SAPI, FakeMK8SServer
+
+URL: str = "https://test.mk8s.api/api/v1"
+
+
+def get_auth(api_url: str) -> APIKeyAdapter:
+    return APIKeyAdapter(
+        Context(
+            name="test_ctx",
+            client_id="test_client_id",
+            realm="test_realm",
+            scope="test_scope",
+            region="test_region",
+            mk8s_api_url=api_url,
+            identity_server_url="https://test.identity.server",
+            auth_type="api_key",
+            api_key="secret_api_key",
+        )
+    )
+
+
+def interaction(path: str, status: int = 200, body: str = "{}") -> Interaction:
+    return Interaction("GET", path, status, [], body, base64=False, elapsed=0.05)
+
+
+@pytest.fixture
+def transport_setting():
+    def _set(value: str):
+        mk8s.close_http_clients()  # clients are built with the transport
+        patcher = mock.patch.object(APP_SETTINGS, "transport", value)
+        patcher.start()
+        patches.append(patcher)
+
+    patches = []
+    yield _set
+    for patcher in reversed(patches):  # restores the original setting last
+        patcher.stop()
+    mk8s.close_http_clients()
+
+
+def test_recorded_traffic_is_replayed_offline(tmp_path, transport_setting):
+    path = tmp_path / "cassette.jsonl.gz"
+
+    with FakeMK8SServer(FakeMK8SAPI(clusters=3)) as server:
+        api_url = server.api_url
+        transport_setting(f"record:{path}")
+        client = MK8SClient(get_auth(api_url), api_url)
+        recorded = (client.get_clusters(), client.get_cluster("cluster-1"))
+        mk8s.close_http_clients()
+
+    transport_setting(f"replay:{path}")
+    client = MK8SClient(get_auth(api_url), api_url)  # the server is gone
+    assert (client.get_clusters(), client.get_cluster("cluster-1")) == recorded
+    assert len(Cassette(path).load()) == 2
+    assert b"secret_api_key" not in gzip.decompress(path.read_bytes())
+
+
+def test_recording_with_warm_http_cache_replays_with_cold_one(
+    tmp_path, transport_setting
+):
+    path = tmp_path / "cassette.jsonl"
+
+    with FakeMK8SServer(FakeMK8SAPI(etags=True)) as server:
+        api_url = server.api_url
+        MK8SClient(get_auth(api_url), api_url).get_clusters()  # warms the cache
+        transport_setting(f"record:{path}")
+        recorded = MK8SClient(get_auth(api_url), api_url).get_clusters()
+        mk8s.close_http_clients()
+
+    assert server.statuses == [200, 200]  # recorded unconditionally
+    cache.get_backend().clear()
+    transport_setting(f"replay:{path}")
+    assert MK8SClient(get_auth(api_url), api_url).get_clusters() == recorded
+
+
+@pytest.mark.parametrize(
+    "method, path, body",
+    [
+        ("POST", "/token", '{"id": "key-1", "api_key": "secret", "expires": 3600}'),
+        ("GET", "/cluster/c-1/files", '{"kubeconfig": "secret"}'),
+        ("GET", "/cluster/c-1/files", "secret"),
+    ],
+)
+def test_credentials_are_redacted(method, path, body):
+    request = httpx.Request(method, f"{URL}{path}")
+    response = httpx.Response(200, content=body.encode(), request=request)
+
+    recorded = Interaction.from_exchange(request, response, elapsed=0.1)
+
+    assert "secret" not in recorded.body
+    if body.startswith("{"):
+        assert json.loads(recorded.body).keys() == json.loads(body).keys()
+
+
+def test_replay_in_recorded_order_then_repeat_last(tmp_path):
+    cassette = Cassette(tmp_path / "cassette.jsonl")
+    for status in ("Running", "Deleting"):
+        cassette.record(
+            interaction("/api/v1/cluster/c-1", body=f'{{"status":"{status}"}}')
+        )
+
+    with httpx.Client(transport=ReplayTransport(cassette)) as client:
+        statuses = [client.get(f"{URL}/cluster/c-1").json()["status"] for _ in range(3)]
+
+    assert statuses == ["Running", "Deleting", "Deleting"]
+
+
+def test_unrecorded_request_fails(tmp_path):
+    cassette = Cassette(tmp_path / "cassette.jsonl")
+    cassette.record(interaction("/api/v1/region"))
+
+    with httpx.Client(transport=ReplayTransport(cassette)) as client:
+        assert client.get(f"{URL}/region").status_code == 200
+        with pytest.raises(CassetteMiss):
+            client.get(f"{URL}/cluster")
+
+
+def test_latency_injection(tmp_path):
+    cassette = Cassette(tmp_path / "cassette.jsonl")
+    cassette.record(interaction("/api/v1/region"))
+
+    for latency, expected in ((0.1, 0.1), (None, 0.05)):  # None = as recorded
+        with httpx.Client(transport=ReplayTransport(cassette, latency)) as client:
+            started = time.monotonic()
+            client.get(f"{URL}/region")
+            assert time.monotonic() - started == pytest.approx(expected, abs=0.04)
+
+
+def test_async_client_replays(tmp_path, transport_setting):
+    path = tmp_path / "cassette.jsonl"
+    cassette = Cassette(path)
+    cassette.record(interaction("/api/v1/kubernetes-version", body='{"items":[1,2]}'))
+    transport_setting(f"replay:{path}")
+
+    async def run() -> list:
+        async with AsyncMK8SClient(get_auth(URL), URL) as client:
+            return await client.list_kubernetes_versions()
+
+    assert asyncio.run(run()) == [1, 2]
+
+
+def test_invalid_transport_setting(transport_setting):
+    transport_setting("tape:/tmp/x")
+
+    with pytest.raises(ValueError, match="record:<path>"):
+        MK8SClient(get_auth(URL), URL)
@@ -0,0 +1,134 @@
+import json
+from unittest import mock
+
+import pytest
+
+from mkcli.core.enums import SupportedAuthTypes
+from mkcli.core.models.context import Context
+from mkcli.utils import cache as cache_module
+from mkcli.utils.cache import cache
+
+
+@pytest.fixture
+def mock_cache_catalogue(catalogue):
+    """Catalogue with two API key contexts, served to the cache commands"""
+    for name in ("ctx_a", "ctx_b"):
+        if name not in [ctx.name for ctx in catalogue.list_all()]:
+            catalogue.add(
+                Context(
+                    name=name,
+                    client_id="test_client_id",
+                    realm="test_realm",
+                    scope="test_scope",
+                    region="test_region",
+                    identity_server_url="https://test.identity.server",
+                    auth_type=SupportedAuthTypes.API_KEY,
+                    mk8s_api_url=f"https://{name}.api.url",
+                    api_key="test_api_key",
+                )
+            )
+    catalogue.switch("ctx_a")
+    cm_mock = mock.MagicMock()
+    cm_mock.__enter__.return_value = catalogue
+    with mock.patch("mkcli.cli.cache.open_context_catalogue", return_value=cm_mock):
+        yield catalogue
+
+
+@pytest.fixture
+def populated_cache():
+    def lookup(name):
+        return {"name": name}
+
+    cached = cache(ttl=60, enabled=True)(lookup)
+    cached("a")
+    cached("a")
+    cached("b")
+    return cached
+
+
+def test_cache_warm_current_context(make_mkcli_call, mock_cache_catalogue):
+    counts = {"regions": 1, "kubernetes_versions": 2, "machine_specs": 3}
+    with (
+        mock.patch("mkcli.cli.cache.MK8SClient") as mock_client,
+        mock.patch("mkcli.cli.cache.mappings.warm_mappings", return_value=counts),
+        mock.patch.object(cache_module.APP_SETTINGS, "resource_mappings_cache", False),
+    ):
+        result = make_mkcli_call(["cache", "warm", "--format", "json"])
+
+    assert result.exit_code == 0, result.output
+    payload = json.loads(result.stdout)  # the disabled cache warning goes to stderr
+    assert payload == {"contexts": [{"context": "ctx_a", **counts}]}
+    assert "The cache is disabled" in result.stderr
+    mock_client.assert_called_once()
+
+
+def test_cache_warm_all_contexts_reports_failures(
+    make_mkcli_call, mock_cache_catalogue
+):
+    def warm(client):
+        if client.api_url == "https://ctx_b.api.url":
+            raise RuntimeError("boom")
+        return {"regions": 1, "kubernetes_versions": 1, "machine_specs": 1}
+
+    def make_client(auth, api_url):
+        return mock.Mock(api_url=api_url)
+
+    with (
+        mock.patch("mkcli.cli.cache.MK8SClient", side_effect=make_client),
+        mock.patch("mkcli.cli.cache.mappings.warm_mappings", side_effect=warm),
+    ):
+        result = make_mkcli_call(
+            ["cache", "warm", "--all-contexts", "--format", "json"]
+        )
+
+    assert result.exit_code == 0, result.output
+    payload = json.loads(result.stdout)
+    by_name = {r["context"]: r for r in payload["contexts"]}
+    assert by_name["ctx_a"]["regions"] == 1
+    assert by_name["ctx_b"] == {"context": "ctx_b", "error": "boom"}
+
+
+def test_cache_stats(make_mkcli_call, populated_cache):
+    result = make_mkcli_call(["cache", "stats", "--format", "json"])
+
+    assert result.exit_code == 0, result.output
+    stats = json.loads(result.output)["functions"]
+    (func_stats,) = [s for f, s in stats.items() if f.endswith("lookup")]
+    assert func_stats["entries"] == 2
+    assert func_stats["hits"] == 1
+    assert func_stats["misses"] == 2
+    assert func_stats["size"] > 0
+
+
+def test_cache_inspect_by_prefix(make_mkcli_call, populated_cache):
+    key = cache_module.make_key(populated_cache.__wrapped__, ("a",), {})
+
+    result = make_mkcli_call(["cache", "inspect", key[:12]])
+
+    assert result.exit_code == 0, result.output
+    assert key in result.output
+    assert '"name": "a"' in result.output
+
+
+def test_cache_inspect_unknown_key(make_mkcli_call, populated_cache):
+    result = make_mkcli_call(["cache", "inspect", "not-a-key"])
+
+    assert result.exit_code == 1
+    assert "not found" in result.output
+
+
+def test_cache_purge_function(make_mkcli_call, populated_cache):
+    func_name = cache_module.get_backend().info()[0].func
+
+    result = make_mkcli_call(["cache", "purge", "--function", func_name, "-y"])
+
+    assert result.exit_code == 0, result.output
+    assert cache_module.get_backend().info() == []
+
+
+def test_cache_purge_aborted(make_mkcli_call, populated_cache):
+    result = make_mkcli_call(["cache", "purge"], "n\n")
+
+    assert result.exit_code == 0, result.output
+    assert "Aborted" in result.output
+    assert len(cache_module.get_backend().info()) == 2
@@ -0,0 +1,88 @@
+import json
+import threading
+from unittest import mock
+
+import pytest
+
+from mkcli.core.enums import SupportedAuthTypes
+from mkcli.core.models import Cluster
+from mkcli.core.models.context import Context
+from mkcli.core.models.node_pool import NodePool
+from mkcli.settings import APP_SETTINGS
+from tests.src.fake_api import cluster_payload, node_pool_payload
+
+
+@pytest.fixture(scope="module", autouse=True)
+def mock_catalogue(catalogue):
+    """Mock the context catalogue that would be returned by open_context_catalogue"""
+    catalogue.add(
+        Context(
+            name="test_ctx",
+            client_id="test_client_id",
+            realm="test_realm",
+            scope="test_scope",
+            region="test_region",
+            identity_server_url="https://test.identity.server",
+            auth_type=SupportedAuthTypes.API_KEY,
+            mk8s_api_url="https://test.api.url",
+            api_key="test_api_key",
+        )
+    )
+    catalogue.switch("test_ctx")
+
+
+@pytest.fixture
+def mock_cluster_client(mock_open_context):
+    """Mock the MK8SClient used by the cluster commands"""
+    cm_mock = mock.MagicMock()
+    cm_mock.__enter__.return_value = mock_open_context
+    with (
+        mock.patch("mkcli.cli.cluster.open_context_catalogue", return_value=cm_mock),
+        mock.patch("mkcli.cli.cluster.MK8SClient") as mock_client,
+    ):
+        instance = mock_client.return_value
+        instance.get_clusters.return_value = [
+            Cluster.model_validate(cluster_payload(i)) for i in range(5)
+        ]
+        threads = set()
+
+        def list_node_pools(cluster_id):
+            threads.add(threading.get_ident())
+            return [NodePool.model_validate(node_pool_payload(cluster_id))]
+
+        instance.list_node_pools.side_effect = list_node_pools
+        instance.threads = threads
+        yield instance
+
+
+@pytest.mark.parametrize("options", [[], ["--verbose"]])
+def test_cluster_list_with_node_pools_json(
+    options, make_mkcli_call, mock_cluster_client
+):
+    with mock.patch.object(APP_SETTINGS, "verbose", False):  # set by --verbose
+        result = make_mkcli_call(
+            [*options, "cluster", "list", "--with-node-pools", "--format", "json"]
+        )
+
+    assert result.exit_code == 0, result.output
+    data = json.loads(result.stdout)  # verbose diagnostics go to stderr
+    assert [c["id"] for c in data["clusters"]] == [f"cluster-{i}" for i in range(5)]
+    for cluster in data["clusters"]:
+        assert cluster["node_pools"][0]["id"] == f"{cluster['id']}-pool-0"
+    assert mock_cluster_client.list_node_pools.call_count == 5
+
+
+def test_cluster_list_with_node_pools_serial(make_mkcli_call, mock_cluster_client):
+    result = make_mkcli_call(["cluster", "list", "--with-node-pools", "--workers", "1"])
+
+    assert result.exit_code == 0, result.output
+    assert "pool-0" in result.stdout
+    assert mock_cluster_client.threads == {threading.get_ident()}
+
+
+def test_cluster_list_without_node_pools(make_mkcli_call, mock_cluster_client):
+    result = make_mkcli_call(["cluster", "list", "--format", "json"])
+
+    assert result.exit_code == 0, result.output
+    assert "node_pools" not in json.loads(result.stdout)["clusters"][0]
+    mock_cluster_client.list_node_pools.assert_not_called()
@@ -1 +1,111 @@
 # moved from tests/core/test_context.py
+from unittest import mock
+
+import pytest
+
+from mkcli.core.models import Token
+from mkcli.core.models.context import Context, ContextCatalogue
+from mkcli.core.session import open_context_catalogue
+from tests.conftest import MemoryStorage
+
+
+def make_context(name: str) -> Context:
+    return Context(
+        name=name,
+        client_id="test_client_id",
+        realm="test_realm",
+        scope="test_scope",
+        region="test_region",
+        identity_server_url="https://test.identity.server",
+        auth_type="openid",
+    )
+
+
+@pytest.fixture
+def storage():
+    store = MemoryStorage()
+    store.save(
+        {
+            "current": "first",
+            "cat": {
+                name: make_context(name).model_dump() for name in ("first", "second")
+            },
+        }
+    )
+    with mock.patch.object(store, "update", wraps=store.update):
+        yield store
+
+
+@pytest.fixture
+def catalogue(storage):
+    return ContextCatalogue(storage=storage)
+
+
+def test_read_only_catalogue_is_not_saved(catalogue, storage):
+    _ = catalogue.current_context.region
+    catalogue.list_all()
+    catalogue.save()
+
+    assert not catalogue.is_dirty
+    storage.update.assert_not_called()
+
+
+def test_switch_to_current_context_is_not_saved(catalogue, storage):
+    catalogue.switch("first")
+    storage.update.assert_not_called()
+
+    catalogue.switch("second")
+    storage.update.assert_called_once()
+    assert storage.data["current"] == "second"
+
+
+def test_refreshed_token_is_saved(catalogue, storage):
+    catalogue.current_context.token = Token(access_token="new_access_token")
+    assert catalogue.is_dirty
+
+    catalogue.save()
+    assert not catalogue.is_dirty
+    assert storage.data["cat"]["first"]["token"]["access_token"] == "new_access_token"
+
+
+def test_nested_token_change_is_tracked(catalogue, storage):
+    catalogue.current_context.token = Token(access_token="token")
+    catalogue.save()
+
+    catalogue.current_context.token.access_token = "token"
+    assert not catalogue.is_dirty
+
+    catalogue.current_context.token.clear()
+    assert catalogue.is_dirty
+    catalogue.save()
+    assert storage.update.call_count == 2
+
+
+def test_open_context_catalogue_skips_unchanged_save(storage):
+    with mock.patch("mkcli.core.session.JsonStorage", return_value=storage):
+        with open_context_catalogue() as cat:
+            _ = cat.current_context
+        storage.update.assert_not_called()
+
+        with open_context_catalogue() as cat:
+            cat.current_context.api_key = "new_api_key"
+        storage.update.assert_called_once()
+
+
+def test_contexts_are_validated_on_first_access(catalogue):
+    assert catalogue.cat == {}
+
+    _ = catalogue.current_context
+    assert list(catalogue.cat) == ["first"]
+
+    catalogue.get("second")
+    assert list(catalogue.cat) == ["first", "second"]
+
+
+def test_only_touched_contexts_are_serialized(catalogue, storage):
+    untouched = catalogue.raw["second"]
+    catalogue.current_context.region = "other_region"
+    catalogue.save()
+
+    assert storage.data["cat"]["first"]["region"] == "other_region"
+    assert storage.data["cat"]["second"] is untouched
@@ -0,0 +1,205 @@
+import asyncio
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+from unittest import mock
+
+import httpx
+import pytest
+
+from mkcli.core import mappings, mk8s
+from mkcli.core.adapters import APIKeyAdapter
+from mkcli.core.enums import SupportedAuthTypes
+from mkcli.core.mk8s import AsyncMK8SClient, MK8SClient
+from mkcli.core.models import Context
+from mkcli.core.models.context import ContextCatalogue, JsonStorage
+from mkcli.core.transport import CacheTransport, ResponseCache
+from mkcli.settings import APP_SETTINGS
+from mkcli.utils import cache
+from tests.src.fake_api import FakeMK8SAPI, FakeMK8SServer
+
+URL: str = "https://test.mk8s.api/api/v1"
+ROOT: str = str(Path(__file__).parents[2])
+
+
+def get_auth(api_url: str, api_key: str = "test_api_key") -> APIKeyAdapter:
+    return APIKeyAdapter(
+        Context(
+            name="test_ctx",
+            client_id="test_client_id",
+            realm="test_realm",
+            scope="test_scope",
+            region="test_region",
+            mk8s_api_url=api_url,
+            identity_server_url="https://test.identity.server",
+            auth_type="api_key",
+            api_key=api_key,
+        )
+    )
+
+
+@pytest.fixture
+def server():
+    with FakeMK8SServer(FakeMK8SAPI(etags=True)) as _server:
+        yield _server
+        mk8s.close_http_clients()
+
+
+def test_unchanged_response_is_served_from_cache(server):
+    client = MK8SClient(get_auth(server.api_url), server.api_url)
+
+    first = client.list_regions()
+    second = client.list_regions()
+
+    assert first == second
+    assert server.statuses == [200, 304]
+    assert cache.get_backend().stats()["http"] == {"misses": 1, "hits": 1}
+
+
+def test_changed_response_replaces_cached_body(server):
+    client = MK8SClient(get_auth(server.api_url), server.api_url)
+
+    assert client.get_cluster("cluster-0").status == "Running"
+    assert client.get_cluster("cluster-0").status == "Running"
+    server.api.clusters[0]["status"] = "Deleting"
+    assert client.get_cluster("cluster-0").status == "Deleting"
+    assert client.get_cluster("cluster-0").status == "Deleting"
+
+    assert server.statuses == [200, 304, 200, 304]
+
+
+def test_cache_is_separate_per_identity(server):
+    MK8SClient(get_auth(server.api_url, "first_key"), server.api_url).list_regions()
+    MK8SClient(get_auth(server.api_url, "second_key"), server.api_url).list_regions()
+
+    assert server.statuses == [200, 200]
+
+
+def test_responses_do_not_evict_warmed_mappings():
+    with (
+        FakeMK8SServer(FakeMK8SAPI(clusters=4, etags=True)) as server,
+        mock.patch.object(APP_SETTINGS, "resource_mappings_cache", True),
+        mock.patch.object(APP_SETTINGS, "cache_max_entries", 2),
+    ):
+        client = MK8SClient(get_auth(server.api_url), server.api_url)
+        mappings.get_regions_mapping(client)
+        for i in range(4):
+            client.get_cluster(f"cluster-{i}")
+    mk8s.close_http_clients()
+
+    funcs = [info.func for info in cache.get_backend().info()]
+    assert sorted(funcs) == ["get_regions_mapping", "http", "http"]
+
+
+def test_response_without_validators_is_not_stored():
+    with FakeMK8SServer() as server:
+        client = MK8SClient(get_auth(server.api_url), server.api_url)
+        client.list_regions()
+        client.list_regions()
+        mk8s.close_http_clients()
+
+    assert server.statuses == [200, 200]
+    assert cache.get_backend().keys() == []
+
+
+def test_async_client_uses_cache(server):
+    async def run() -> list:
+        async with AsyncMK8SClient(get_auth(server.api_url), server.api_url) as client:
+            return [await client.list_kubernetes_versions() for _ in range(2)]
+
+    first, second = asyncio.run(run())
+
+    assert first == second
+    assert server.statuses == [200, 304]
+
+
+def test_last_modified_is_sent_back():
+    last_modified = "Wed, 01 Jan 2025 12:00:00 GMT"
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.headers.get("If-Modified-Since"))
+        if request.headers.get("If-Modified-Since") == last_modified:
+            return httpx.Response(304)
+        return httpx.Response(
+            200, json={"items": []}, headers={"Last-Modified": last_modified}
+        )
+
+    transport = CacheTransport(httpx.MockTransport(handler), identity="test")
+    with httpx.Client(transport=transport) as client:
+        responses = [client.get(f"{URL}/kubernetes-version") for _ in range(2)]
+
+    assert seen == [None, last_modified]
+    assert [r.status_code for r in responses] == [200, 200]
+    assert responses[1].json() == {"items": []}
+
+
+@pytest.mark.parametrize(
+    "method, path, expected",
+    [
+        ("GET", "/region", True),
+        ("GET", "/region/r-1/machine-spec", True),
+        ("GET", "/cluster", True),
+        ("GET", "/cluster/c-1", True),
+        ("GET", "/cluster/c-1/node-pool/p-1", True),
+        ("GET", "/cluster/c-1/files", False),  # kubeconfig
+        ("GET", "/cluster/c-1/backup", False),
+        ("PUT", "/cluster/c-1", False),
+    ],
+)
+def test_cacheable_endpoints(method, path, expected):
+    assert ResponseCache.cacheable(httpx.Request(method, URL + path)) is expected
+
+
+def test_stale_mapping_is_revalidated_before_clients_close(tmp_path):
+    """The background refresh of a stale lookup outlives the command's own requests"""
+    env = {
+        **os.environ,
+        "XDG_CONFIG_HOME": str(tmp_path / "config"),
+        "XDG_CACHE_HOME": str(tmp_path / "cache"),
+        "PYTHONPATH": ROOT,
+        "MKCLI_RESOURCE_MAPPINGS_CACHE": "True",
+        "MKCLI_KUBERNETES_VERSIONS_CACHE_TTL": "1",
+        "MKCLI_RETRY_ATTEMPTS": "0",
+    }
+    command = [sys.executable, "-m", "mkcli", "kubernetes-version", "list"]
+
+    with FakeMK8SServer(FakeMK8SAPI(etags=True, latency=0.3)) as server:
+        catalogue = ContextCatalogue(
+            storage=JsonStorage(tmp_path / "config" / "mkcli" / "contexts.json")
+        )
+        catalogue.add(
+            Context(
+                name="api_key_ctx",
+                client_id="test_client_id",
+                realm="test_realm",
+                scope="test_scope",
+                region="WAW4-1",
+                identity_server_url="https://test.identity.server",
+                mk8s_api_url=server.api_url,
+                auth_type=SupportedAuthTypes.API_KEY,
+                api_key="test_api_key",
+            )
+        )
+        catalogue.switch("api_key_ctx")
+
+        subprocess.run(command, env=env, check=True, capture_output=True)
+        stored_at = lookup_stored_at(tmp_path / "cache" / "mkcli")
+        time.sleep(1.1)  # stale, refreshed in the background on next use
+        subprocess.run(command, env=env, check=True, capture_output=True)
+
+    assert server.requests.count(("GET", "/kubernetes-version")) == 2
+    assert lookup_stored_at(tmp_path / "cache" / "mkcli") > stored_at
+
+
+def lookup_stored_at(cache_dir: Path) -> float:
+    backend = cache.open_backend("sqlite", cache_dir)
+    try:
+        (info,) = [
+            i for i in backend.info() if i.func == "get_kubernetes_versions_mapping"
+        ]
+        return info.stored_at
+    finally:
+        backend.close()
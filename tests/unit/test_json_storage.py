@@ -0,0 +1,119 @@
+import json
+import multiprocessing
+from unittest import mock
+
+import pytest
+
+from mkcli.core.models import Token
+from mkcli.core.models.context import Context, ContextCatalogue, JsonStorage
+from mkcli.utils import filelock
+
+WRITERS: int = 8
+READERS: int = 4
+ITERATIONS: int = 25
+
+pytestmark = pytest.mark.skipif(
+    filelock.fcntl is None, reason="advisory file locks not available"
+)
+
+
+def make_context(name: str) -> Context:
+    return Context(
+        name=name,
+        client_id="test_client_id",
+        realm="test_realm",
+        scope="test_scope",
+        region="test_region",
+        identity_server_url="https://test.identity.server",
+        auth_type="openid",
+    )
+
+
+def _write(path, writer: int) -> None:
+    for i in range(ITERATIONS):  # a catalogue per command, as mkcli does
+        catalogue = ContextCatalogue(storage=JsonStorage(path))
+        catalogue.add(make_context(f"writer-{writer}-{i}"))
+
+
+def _read(path, stop) -> None:
+    storage = JsonStorage(path)
+    while not stop.is_set():
+        data = storage.load()  # raises InvalidFileLayout on a torn write
+        assert set(data) == {"current", "cat"}
+
+
+@pytest.fixture
+def storage(tmp_path):
+    _storage = JsonStorage(tmp_path / "contexts.json")
+    _storage.init_storage({"current": None, "cat": {}})
+    return _storage
+
+
+def test_save_replaces_file_atomically(storage):
+    storage.save({"current": "a", "cat": {}})
+
+    assert json.loads(storage.path.read_text()) == {"current": "a", "cat": {}}
+    assert sorted(p.name for p in storage.path.parent.iterdir()) == [
+        "contexts.json",
+        "contexts.json.lock",
+    ]
+
+
+def test_init_storage_keeps_existing_file(storage):
+    storage.save({"current": "a", "cat": {}})
+    storage.init_storage({"current": None, "cat": {}})
+
+    assert storage.load()["current"] == "a"
+
+
+def test_save_keeps_contexts_added_by_another_process(storage):
+    refreshing = ContextCatalogue(storage=JsonStorage(storage.path))
+    refreshing.add(make_context("first"))
+    adding = ContextCatalogue(storage=JsonStorage(storage.path))
+
+    adding.add(make_context("second"))
+    refreshing.cat["first"].token = Token(access_token="refreshed")
+    refreshing.save()
+
+    reloaded = ContextCatalogue(storage=JsonStorage(storage.path))
+    assert reloaded.list_available() == ["first", "second"]
+    assert reloaded.get("first").token.access_token == "refreshed"
+
+
+def test_renaming_active_context_keeps_it_active(storage, make_mkcli_call):
+    catalogue = ContextCatalogue(storage=JsonStorage(storage.path))
+    catalogue.add(make_context("old"))
+    catalogue.switch("old")
+
+    with mock.patch(
+        "mkcli.core.session.get_context_storage",
+        lambda: JsonStorage(storage.path),
+    ):
+        result = make_mkcli_call(["auth", "context", "edit", "old", "--name", "new"])
+
+    assert result.exit_code == 0, result.output
+    reloaded = ContextCatalogue(storage=JsonStorage(storage.path))
+    assert reloaded.list_available() == ["new"]
+    assert reloaded.current_context.name == "new"
+
+
+def test_concurrent_processes_do_not_lose_or_corrupt_data(storage):
+    mp = multiprocessing.get_context("fork")
+    stop = mp.Event()
+    readers = [
+        mp.Process(target=_read, args=(storage.path, stop)) for _ in range(READERS)
+    ]
+    writers = [
+        mp.Process(target=_write, args=(storage.path, w)) for w in range(WRITERS)
+    ]
+
+    for process in readers + writers:
+        process.start()
+    for process in writers:
+        process.join(timeout=60)
+    stop.set()
+    for process in readers:
+        process.join(timeout=10)
+
+    assert [p.exitcode for p in readers + writers] == [0] * (READERS + WRITERS)
+    assert len(storage.load()["cat"]) == WRITERS * ITERATIONS
@@ -0,0 +1,57 @@
+import os
+import subprocess
+import sys
+
+from mkcli.core.enums import SupportedAuthTypes
+from mkcli.core.models.context import Context, ContextCatalogue, JsonStorage
+from tests.src.fake_api import FakeMK8SServer
+
+OPENID_MODULES: tuple[str, ...] = ("keycloak", "requests", "mkcli.core.callback")
+
+RUN_MKCLI: str = """
+import sys
+sys.argv = ["mkcli", "cluster", "list"]
+from mkcli.main import run
+try:
+    run()
+except SystemExit:
+    print("imported:", *sorted(m for m in {modules!r} if m in sys.modules), file=sys.stderr)
+    raise
+"""
+
+
+def test_api_key_cluster_list_skips_openid_machinery(tmp_path):
+    with FakeMK8SServer() as server:
+        catalogue = ContextCatalogue(
+            storage=JsonStorage(tmp_path / "config" / "mkcli" / "contexts.json")
+        )
+        catalogue.add(
+            Context(
+                name="api_key_ctx",
+                client_id="test_client_id",
+                realm="test_realm",
+                scope="test_scope",
+                region="WAW4-1",
+                identity_server_url="https://test.identity.server",
+                mk8s_api_url=server.api_url,
+                auth_type=SupportedAuthTypes.API_KEY,
+                api_key="test_api_key",
+            )
+        )
+        catalogue.switch("api_key_ctx")
+
+        result = subprocess.run(
+            [sys.executable, "-c", RUN_MKCLI.format(modules=OPENID_MODULES)],
+            capture_output=True,
+            text=True,
+            env={
+                **os.environ,
+                "XDG_CONFIG_HOME": str(tmp_path / "config"),
+                "XDG_CACHE_HOME": str(tmp_path / "cache"),
+            },
+        )
+
+    assert result.returncode == 0, result.stderr
+    assert "cluster-0" in result.stdout
+    assert ("GET", "/cluster") in server.requests
+    assert result.stderr.splitlines()[-1] == "imported:"
@@ -0,0 +1,55 @@
+import threading
+from unittest import mock
+
+import pytest
+
+from mkcli.core import mappings
+from mkcli.core.models import Region
+from tests.src.fake_api import (
+    kubernetes_version_payload,
+    machine_spec_payload,
+    region_payload,
+)
+
+
+@pytest.fixture
+def client():
+    """Client whose version and region lookups only return when made concurrently"""
+    both_in_flight = threading.Barrier(2, timeout=5)
+    calls = []
+
+    def list_kubernetes_versions():
+        both_in_flight.wait()
+        return [kubernetes_version_payload()]
+
+    def list_regions():
+        both_in_flight.wait()
+        calls.append("regions")
+        return [Region.model_validate(region_payload())]
+
+    def list_machine_specs(region_id):
+        calls.append(f"specs:{region_id}")
+        return [machine_spec_payload(region_id)]
+
+    _client = mock.Mock()
+    _client.list_kubernetes_versions.side_effect = list_kubernetes_versions
+    _client.list_regions.side_effect = list_regions
+    _client.list_machine_specs.side_effect = list_machine_specs
+    _client.calls = calls
+    return _client
+
+
+def test_prefetch_mappings_resolves_bundle_concurrently(client):
+    bundle = mappings.prefetch_mappings(client, "WAW4-1")
+
+    assert bundle.region.id == "region-0"
+    assert list(bundle.regions) == ["WAW4-1"]
+    assert list(bundle.kubernetes_versions) == ["1.30.10"]
+    assert list(bundle.machine_specs) == ["hma.medium"]
+    assert client.calls == ["regions", "specs:region-0"]
+
+
+def test_prefetch_mappings_unknown_region(client):
+    with pytest.raises(KeyError):
+        mappings.prefetch_mappings(client, "NOWHERE")
+    client.list_machine_specs.assert_not_called()
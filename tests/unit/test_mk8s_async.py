@@ -0,0 +1,107 @@
+import asyncio
+
+import httpx
+import pytest
+
+from mkcli.core.adapters import APIKeyAdapter
+from mkcli.core.enums import SupportedAuthTypes
+from mkcli.core.mk8s import APICallError, AsyncMK8SClient, WAF_ERROR_MSG, WAFException
+from mkcli.core.models.context import Context
+from tests.src.fake_api import FakeMK8SAPI
+
+API_URL: str = "https://test.mk8s.api/api/v1"
+
+
+def get_context() -> Context:
+    return Context(
+        name="test_ctx",
+        client_id="test_client_id",
+        realm="test_realm",
+        scope="test_scope",
+        region="test_region",
+        mk8s_api_url=API_URL,
+        identity_server_url="https://test.identity.server",
+        auth_type=SupportedAuthTypes.API_KEY,
+        api_key="test_api_key",
+    )
+
+
+def make_client(handler, max_concurrency: int | None = None) -> AsyncMK8SClient:
+    client = AsyncMK8SClient(
+        APIKeyAdapter(get_context()), API_URL, max_concurrency=max_concurrency
+    )
+    client.api = httpx.AsyncClient(
+        base_url=API_URL,
+        headers=client.headers,
+        transport=httpx.MockTransport(handler),
+    )
+    return client
+
+
+def fake_api_handler(api: FakeMK8SAPI):
+    def handler(request: httpx.Request) -> httpx.Response:
+        path = request.url.path.removeprefix("/api/v1").rstrip("/")
+        status, body = api.dispatch(request.method, path)
+        return httpx.Response(status, json=body)
+
+    return handler
+
+
+def test_async_client_mirrors_sync_api():
+    api = FakeMK8SAPI(clusters=3, node_pools=2)
+
+    async def scenario():
+        async with make_client(fake_api_handler(api)) as client:
+            clusters = await client.get_clusters()
+            pools = await asyncio.gather(
+                *(client.list_node_pools(c.id) for c in clusters)
+            )
+            cluster = await client.get_cluster("cluster-1")
+            regions = await client.list_regions()
+        return clusters, pools, cluster, regions
+
+    clusters, pools, cluster, regions = asyncio.run(scenario())
+    assert [c.id for c in clusters] == ["cluster-0", "cluster-1", "cluster-2"]
+    assert [len(p) for p in pools] == [2, 2, 2]
+    assert pools[1][0].id == "cluster-1-pool-0"
+    assert cluster.name == "cluster-1"
+    assert regions[0].name == "WAW4-1"
+
+
+def test_async_client_respects_concurrency_limit():
+    in_flight = 0
+    peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, json={"items": []})
+
+    async def scenario():
+        async with make_client(handler, max_concurrency=3) as client:
+            await asyncio.gather(*(client.list_node_pools(str(i)) for i in range(20)))
+
+    asyncio.run(scenario())
+    assert peak == 3
+
+
+def test_async_client_verifies_responses():
+    async def failing(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(404, text="cluster not found")
+
+    async def blocked(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, text=f"<html>{WAF_ERROR_MSG}[Go Back]</html>")
+
+    async def call(handler):
+        async with make_client(handler) as client:
+            return await client.get_cluster("missing")
+
+    with pytest.raises(APICallError) as err:
+        asyncio.run(call(failing))
+    assert err.value.code == 404
+
+    with pytest.raises(WAFException):
+        asyncio.run(call(blocked))
@@ -0,0 +1,99 @@
+import asyncio
+import json
+import time
+
+import pytest
+from typer.testing import CliRunner
+
+from mkcli.core.enums import ProfileFormat
+from mkcli.main import cli
+from mkcli.utils.profiling import PROFILER, profiled, span
+
+
+@pytest.fixture
+def profiler():
+    PROFILER.spans.clear()
+    PROFILER.start(time.perf_counter())
+    yield PROFILER
+    PROFILER.stop()
+    PROFILER.spans.clear()
+
+
+def summary(profiler) -> dict[str, dict]:
+    return {row["name"]: row for row in profiler.summary()}
+
+
+def test_nested_span_is_subtracted_from_self_time(profiler):
+    with span("outer"):
+        time.sleep(0.05)
+        with span("inner"):
+            time.sleep(0.1)
+
+    rows = summary(profiler)
+    assert rows["outer"]["total_ms"] == pytest.approx(150, abs=40)
+    assert rows["outer"]["self_ms"] == pytest.approx(50, abs=40)
+    assert rows["inner"]["self_ms"] == pytest.approx(100, abs=40)
+
+
+def test_nothing_is_recorded_unless_started():
+    with span("ignored"):
+        pass
+
+    assert PROFILER.spans == []
+
+
+def test_concurrent_calls_wall_time(profiler):
+    @profiled(category="api")
+    async def call():
+        await asyncio.sleep(0.1)
+
+    async def run():
+        await asyncio.gather(*(call() for _ in range(3)))
+
+    asyncio.run(run())
+
+    (row,) = [row for row in profiler.summary() if row["category"] == "api"]
+    assert row["calls"] == 3
+    assert row["total_ms"] == pytest.approx(300, abs=60)
+    assert row["wall_ms"] == pytest.approx(100, abs=40)
+
+
+def test_chrome_trace(profiler, tmp_path):
+    with span("outer", "test"):
+        with span("inner", "test"):
+            pass
+
+    profiler.report(ProfileFormat.CHROME, tmp_path / "trace.json")
+
+    events = json.loads((tmp_path / "trace.json").read_text())["traceEvents"]
+    assert [e["name"] for e in events] == ["startup", "outer", "inner"]
+    outer, inner = events[1:]
+    assert {e["ph"] for e in events} == {"X"}
+    assert outer["ts"] <= inner["ts"]
+    assert inner["ts"] + inner["dur"] <= outer["ts"] + outer["dur"] + 1  # rounding
+
+
+def test_cli_profile_option(tmp_path):
+    output = tmp_path / "profile.json"
+    try:
+        result = CliRunner().invoke(
+            cli,
+            [
+                "--profile",
+                "json",
+                "--profile-output",
+                str(output),
+                "auth",
+                "context",
+                "list",
+            ],
+        )
+    finally:
+        PROFILER.stop()
+        PROFILER.spans.clear()
+
+    assert result.exit_code == 0, result.output
+    profile = json.loads(output.read_text())
+    names = {s["name"] for s in profile["spans"]}
+    assert {"startup", "import mkcli.cli.auth", "open_context_catalogue"} <= names
+    assert profile["wall_ms"] >= max(s["duration_ms"] for s in profile["spans"])
@@ -0,0 +1,143 @@
+import threading
+import time
+from unittest import mock
+
+import httpx
+import pytest
+
+from mkcli.core import mk8s, ratelimit
+from mkcli.core.adapters import APIKeyAdapter
+from mkcli.core.models import Context
+from mkcli.core.ratelimit import (
+    Limit,
+    RateLimiter,
+    TokenBucket,
+    endpoint_class,
+    report_throttling,
+    resolve_limits,
+)
+from mkcli.core.transport import RateLimitTransport
+from mkcli.settings import APP_SETTINGS
+
+API_URL: str = "https://test.mk8s.api/api/v1"
+
+
+@pytest.mark.parametrize(
+    "method, path, expected",
+    [
+        ("GET", "/region", "catalogue"),
+        ("GET", "/region/r-1/machine-spec", "catalogue"),
+        ("GET", "/kubernetes-version", "catalogue"),
+        ("GET", "/cluster", "read"),
+        ("GET", "/cluster/c-1/node-pool", "read"),
+        ("POST", "/cluster", "mutation"),
+        ("DELETE", "/cluster/c-1", "mutation"),
+    ],
+)
+def test_endpoint_class(method, path, expected):
+    assert endpoint_class(httpx.Request(method, API_URL + path)) == expected
+
+
+def test_token_bucket_allows_burst_then_rate():
+    bucket = TokenBucket(rate=10, burst=2)
+
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == pytest.approx(0.1, abs=0.01)
+    assert bucket.reserve() == pytest.approx(0.2, abs=0.01)
+
+
+def test_unlimited_bucket():
+    bucket = TokenBucket(rate=0, burst=1)
+    assert [bucket.reserve() for _ in range(100)] == [0] * 100
+
+
+def test_context_overrides_settings():
+    limits = resolve_limits({"mutation": {"rate": 0.5, "max_in_flight": 1}})
+
+    assert limits["mutation"] == Limit(rate=0.5, burst=2, max_in_flight=1)
+    assert limits["catalogue"].rate == 20
+    assert resolve_limits(None) == resolve_limits({})
+
+
+def test_max_in_flight_and_throttle_counters():
+    in_flight, peak = 0, 0
+    lock = threading.Lock()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.02)
+        with lock:
+            in_flight -= 1
+        return httpx.Response(200)
+
+    limiter = RateLimiter(
+        {
+            "catalogue": Limit(rate=0, burst=1, max_in_flight=10),
+            "read": Limit(rate=0, burst=1, max_in_flight=2),
+            "mutation": Limit(rate=10, burst=1, max_in_flight=1),
+        }
+    )
+    client = httpx.Client(
+        transport=RateLimitTransport(httpx.MockTransport(handler), limiter)
+    )
+    threads = [
+        threading.Thread(target=client.get, args=(f"{API_URL}/cluster",))
+        for _ in range(6)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    for _ in range(3):
+        client.post(f"{API_URL}/cluster")
+
+    stats = limiter.stats()
+    assert peak == 2
+    assert stats["read"].requests == 6
+    assert stats["read"].throttled > 0
+    assert stats["mutation"].requests == 3
+    assert stats["mutation"].throttled == 2  # burst of 1
+    assert stats["mutation"].throttled_seconds > 0.1
+    assert stats["catalogue"].requests == 0
+
+
+def test_throttling_report_goes_to_stderr(capsys):
+    limiter = RateLimiter({"read": Limit(rate=1, burst=1, max_in_flight=1)}, "test")
+    limiter.governors["read"].record(0.5)
+
+    with (
+        mock.patch.object(ratelimit, "_limiters", [limiter]),
+        mock.patch.object(APP_SETTINGS, "verbose", True),
+    ):
+        report_throttling()
+
+    output = capsys.readouterr()
+    assert "Rate limit test read: 1/1 requests throttled for 0.50s" in output.err
+    assert output.out == ""  # keeps --format json output parseable
+
+
+def test_mk8s_client_uses_context_limits():
+    ctx = Context(
+        name="limited_ctx",
+        client_id="test_client_id",
+        realm="test_realm",
+        scope="test_scope",
+        region="test_region",
+        identity_server_url="https://test.identity.server",
+        auth_type="api_key",
+        api_key="rate_limited_key",
+        rate_limits={"mutation": {"max_in_flight": 1}},
+    )
+
+    client = mk8s.MK8SClient(APIKeyAdapter(ctx), "https://limited.mk8s.api/api/v1")
+
+    transport = client.api._transport
+    while not hasattr(transport, "limiter"):
+        transport = transport.transport
+    limiter = transport.limiter
+    assert limiter.governors["mutation"].limit.max_in_flight == 1
+    assert limiter.governors["read"].limit.max_in_flight == 8
@@ -0,0 +1,89 @@
+import datetime
+from unittest import mock
+
+import pytest
+
+from mkcli.core import mk8s
+from mkcli.core.adapters import APIKeyAdapter, OpenIDAdapter
+from mkcli.core.mk8s import APICallError, MK8SClient
+from mkcli.core.models import Context, Token
+from tests.src.fake_api import FakeMK8SAPI, FakeMK8SServer
+
+
+def make_token(access_token: str) -> Token:
+    now = datetime.datetime.now(tz=datetime.timezone.utc)
+    return Token(
+        access_token=access_token,
+        refresh_token=f"{access_token}_refresh",
+        expires_in=now + datetime.timedelta(seconds=300),
+        renew_after=now + datetime.timedelta(seconds=150),
+        refresh_expires_in=now + datetime.timedelta(seconds=1800),
+    )
+
+
+def get_context(api_url: str, **kwargs) -> Context:
+    return Context(
+        name="test_ctx",
+        client_id="test_client_id",
+        realm="test_realm",
+        scope="test_scope",
+        region="test_region",
+        mk8s_api_url=api_url,
+        identity_server_url="https://test.identity.server",
+        **kwargs,
+    )
+
+
+@pytest.fixture
+def server():
+    with FakeMK8SServer(FakeMK8SAPI(tokens=set())) as _server:
+        yield _server
+        mk8s.close_http_clients()  # end keep-alive connections and their handlers
+
+
+def test_openid_token_expired_mid_run_is_refreshed_once(server):
+    server.api.tokens.add("Bearer first")
+    ctx = get_context(server.api_url, auth_type="openid", token=make_token("first"))
+    refreshes = []
+
+    def renew(self):  # stands in for Keycloak issuing a new token
+        refreshes.append(self._ctx.token.access_token)
+        self._ctx.token = make_token("second")
+        server.api.tokens.add("Bearer second")
+
+    client = MK8SClient(OpenIDAdapter(ctx), server.api_url)
+    with mock.patch.object(OpenIDAdapter, "_renew_token_with_refresh_token", renew):
+        assert client.list_regions()
+        server.api.tokens.discard("Bearer first")  # revoked by the identity server
+        assert client.list_regions()
+        assert client.list_regions()
+
+    assert refreshes == ["first"]
+    assert len(server.requests) == 4  # 3 calls + 1 retry
+    assert ctx.token.access_token == "second"
+
+
+def test_openid_retries_only_once(server):
+    ctx = get_context(server.api_url, auth_type="openid", token=make_token("first"))
+
+    def renew(self):  # new token, still rejected by the API
+        self._ctx.token = make_token("second")
+
+    client = MK8SClient(OpenIDAdapter(ctx), server.api_url)
+    with mock.patch.object(OpenIDAdapter, "_renew_token_with_refresh_token", renew):
+        with pytest.raises(APICallError) as err:
+            client.list_regions()
+
+    assert err.value.code == 401
+    assert len(server.requests) == 2
+
+
+def test_api_key_fails_fast(server):
+    ctx = get_context(server.api_url, auth_type="api_key", api_key="revoked_key")
+
+    client = MK8SClient(APIKeyAdapter(ctx), server.api_url)
+    with pytest.raises(APICallError) as err:
+        client.list_regions()
+
+    assert err.value.code == 401
+    assert len(server.requests) == 1
@@ -0,0 +1,139 @@
+import json
+from unittest import mock
+
+import pytest
+
+from mkcli.core import session
+from mkcli.core.models import Token
+from mkcli.core.models.context import (
+    Context,
+    ContextCatalogue,
+    JsonStorage,
+    SqliteStorage,
+)
+
+
+def make_context(name: str, token: Token | None = None) -> Context:
+    return Context(
+        name=name,
+        client_id="test_client_id",
+        realm="test_realm",
+        scope="test_scope",
+        region="test_region",
+        identity_server_url="https://test.identity.server",
+        auth_type="openid",
+        token=token,
+    )
+
+
+@pytest.fixture
+def storage(tmp_path):
+    _storage = SqliteStorage(tmp_path / "contexts.sqlite")
+    cat = ContextCatalogue(storage=_storage)
+    for name in ("first", "second", "third"):
+        cat.add(make_context(name, token=Token(access_token=f"{name}_token")))
+    cat.switch("second")
+    return SqliteStorage(_storage.path)
+
+
+def test_catalogue_roundtrip(storage):
+    cat = ContextCatalogue(storage=storage)
+
+    assert cat.current == "second"
+    assert cat.list_available() == ["first", "second", "third"]
+    assert cat.current_context.token.access_token == "second_token"
+
+
+def test_load_reads_rows_on_access(storage):
+    data = storage.load()
+
+    assert data["current"] == "second"
+    assert storage._rows == {}
+    assert data["cat"]["third"]["token"]["access_token"] == "third_token"
+    assert list(storage._rows) == ["third"]
+
+
+def test_save_updates_only_changed_rows(storage):
+    cat = ContextCatalogue(storage=storage)
+    statements = []
+    storage.conn.set_trace_callback(statements.append)
+
+    cat.current_context.token = Token(access_token="refreshed")
+    cat.save()
+
+    writes = [s for s in statements if s.split()[0] in ("INSERT", "DELETE")]
+    assert len(writes) == 1
+    assert writes[0].startswith("INSERT OR REPLACE INTO tokens")
+    assert "'second'" in writes[0]
+
+    reloaded = ContextCatalogue(storage=SqliteStorage(storage.path))
+    assert reloaded.current_context.token.access_token == "refreshed"
+
+
+def test_save_reads_only_changed_contexts(storage):
+    cat = ContextCatalogue(storage=storage)
+    for i in range(50):
+        cat.add(make_context(f"extra-{i}"))
+    cat = ContextCatalogue(storage=SqliteStorage(storage.path))
+    loaded = []
+    cat.storage.conn.set_trace_callback(loaded.append)
+
+    cat.current_context.token = Token(access_token="refreshed")
+    cat.save()
+
+    reads = [s for s in loaded if s.startswith("SELECT c.data")]
+    assert len(reads) == 1 and "'second'" in reads[0]
+
+
+def test_save_keeps_contexts_added_by_another_process(storage):
+    cat = ContextCatalogue(storage=storage)
+    _ = cat.current_context
+    ContextCatalogue(storage=SqliteStorage(storage.path)).add(make_context("fourth"))
+
+    cat.delete("first")
+    cat.current_context.token = Token(access_token="refreshed")
+    cat.save()
+
+    reloaded = ContextCatalogue(storage=SqliteStorage(storage.path))
+    assert sorted(reloaded.list_available()) == ["fourth", "second", "third"]
+    assert reloaded.current_context.token.access_token == "refreshed"
+
+
+def test_delete_and_clear_token(storage):
+    cat = ContextCatalogue(storage=storage)
+    cat.delete("first")
+    cat.current_context.token = None
+    cat.save()
+
+    reloaded = ContextCatalogue(storage=SqliteStorage(storage.path))
+    assert reloaded.list_available() == ["second", "third"]
+    assert reloaded.current_context.token is None
+    assert storage.conn.execute("SELECT context FROM tokens").fetchall() == [("third",)]
+
+
+def test_clear_removes_database(storage):
+    storage.clear()
+    assert not storage.path.exists()
+
+
+def test_sqlite_storage_imports_json_catalogue(tmp_path):
+    json_path = tmp_path / "contexts.json"
+    json_path.write_text(
+        json.dumps(
+            {"current": "first", "cat": {"first": make_context("first").model_dump()}}
+        )
+    )
+
+    with (
+        mock.patch.object(session.APP_SETTINGS, "context_storage", "sqlite"),
+        mock.patch.object(JsonStorage, "PATH_PATTERN", json_path),
+        mock.patch("mkcli.core.session.JsonStorage", JsonStorage),
+        mock.patch(
+            "mkcli.core.session.SqliteStorage",
+            lambda: SqliteStorage(tmp_path / "contexts.sqlite"),
+        ),
+    ):
+        with session.open_context_catalogue() as cat:
+            assert cat.current_context.name == "first"
+
+    assert (tmp_path / "contexts.sqlite").is_file()
@@ -0,0 +1,105 @@
+import datetime
+import multiprocessing
+import time
+import uuid
+
+import pytest
+
+from mkcli.core.adapters import OpenIDAdapter
+from mkcli.core.models import Context, Token
+from mkcli.core.token_cache import TokenCache
+from mkcli.utils import filelock
+
+PROCESSES: int = 6
+
+
+def fresh_token(access_token: str) -> Token:
+    return Token.load_from_response(
+        {
+            "access_token": access_token,
+            "refresh_token": f"{access_token}_refresh",
+            "expires_in": 300,
+            "refresh_expires_in": 1800,
+        }
+    )
+
+
+def stale_token() -> Token:
+    now = datetime.datetime.now(tz=datetime.timezone.utc)
+    return Token(
+        access_token="stale_access_token",
+        refresh_token="stale_refresh_token",
+        expires_in=now + datetime.timedelta(seconds=10),
+        renew_after=now - datetime.timedelta(seconds=10),
+        refresh_expires_in=now + datetime.timedelta(seconds=600),
+    )
+
+
+def _refresh(directory, calls_path, results) -> None:
+    def renew() -> Token:
+        with open(calls_path, "a") as f:
+            f.write("refresh\n")
+        time.sleep(0.2)  # keep the others waiting on the lock
+        return fresh_token(uuid.uuid4().hex)
+
+    token = TokenCache("openid:test", directory).refresh(renew)
+    results.put(token.access_token)
+
+
+def test_token_cache_roundtrip(tmp_path):
+    cache = TokenCache("openid:test", tmp_path)
+    assert cache.load() is None
+
+    cache.store(fresh_token("access"))
+
+    assert cache.fresh().access_token == "access"
+    assert cache.path.stat().st_mode & 0o077 == 0  # readable by the owner only
+
+
+def test_stale_or_corrupted_token_is_not_fresh(tmp_path):
+    cache = TokenCache("openid:test", tmp_path)
+    cache.store(stale_token())
+    assert cache.fresh() is None
+
+    cache.path.write_text("{not json")
+    assert cache.load() is None
+
+
+@pytest.mark.skipif(filelock.fcntl is None, reason="advisory file locks not available")
+def test_concurrent_processes_refresh_once(tmp_path):
+    mp = multiprocessing.get_context("fork")
+    results = mp.Queue()
+    calls_path = tmp_path / "calls"
+    processes = [
+        mp.Process(target=_refresh, args=(tmp_path / "tokens", calls_path, results))
+        for _ in range(PROCESSES)
+    ]
+    for process in processes:
+        process.start()
+    tokens = {results.get(timeout=30) for _ in processes}
+    for process in processes:
+        process.join(timeout=10)
+
+    assert calls_path.read_text().count("refresh") == 1
+    assert len(tokens) == 1
+
+
+def test_openid_adapter_reuses_token_refreshed_elsewhere():
+    ctx = Context(
+        name="test_ctx",
+        client_id="test_client_id",
+        realm="test_realm",
+        scope="test_scope",
+        region="test_region",
+        identity_server_url="https://test.identity.server",
+        auth_type="openid",
+        token=stale_token(),
+    )
+    adapter = OpenIDAdapter(ctx)
+    adapter.token_cache.store(fresh_token("shared_access_token"))
+
+    assert adapter.get_auth_header() == {"authorization": "Bearer shared_access_token"}
+    assert ctx.token.access_token == "shared_access_token"
+
+    adapter.clear()
+    assert adapter.token_cache.load() is None
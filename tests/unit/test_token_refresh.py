@@ -0,0 +1,91 @@
+import datetime
+from unittest import mock
+
+import httpx
+
+from mkcli.core.adapters import OpenIDAdapter
+from mkcli.core.mk8s import MK8SClient
+from mkcli.core.models import Context, Token
+from mkcli.utils import wait_until
+
+API_URL: str = "https://test.mk8s.api/api/v1"
+
+
+def make_token(access_token: str, renew_in: float = 150) -> Token:
+    now = datetime.datetime.now(tz=datetime.timezone.utc)
+    return Token(
+        access_token=access_token,
+        refresh_token=f"{access_token}_refresh",
+        expires_in=now + datetime.timedelta(seconds=300),
+        renew_after=now + datetime.timedelta(seconds=renew_in),
+        refresh_expires_in=now + datetime.timedelta(seconds=1800),
+    )
+
+
+def get_context(token: Token) -> Context:
+    return Context(
+        name="test_ctx",
+        client_id="test_client_id",
+        realm="test_realm",
+        scope="test_scope",
+        region="test_region",
+        mk8s_api_url=API_URL,
+        identity_server_url="https://test.identity.server",
+        auth_type="openid",
+        token=token,
+    )
+
+
+def test_background_refresh_swaps_token():
+    ctx = get_context(make_token("first", renew_in=0.05))
+    adapter = OpenIDAdapter(ctx)
+    refreshed = []
+
+    def renew(self):
+        refreshed.append(self._ctx.token.access_token)
+        self._ctx.token = make_token(f"refreshed-{len(refreshed)}")
+
+    with mock.patch.object(OpenIDAdapter, "_renew_token_with_refresh_token", renew):
+        adapter.start_background_refresh()
+        try:
+            assert wait_until(lambda: refreshed, 5, 0.01)
+            assert adapter.get_auth_header() == {"authorization": "Bearer refreshed-1"}
+        finally:
+            adapter.stop_background_refresh()
+
+    assert refreshed == ["first"]  # next refresh is scheduled at renew_after
+    assert adapter._refresher is None
+
+
+def test_background_refresh_stops_without_refresh_token():
+    token = make_token("first", renew_in=0)
+    token.refresh_expires_in = token.expires_in - datetime.timedelta(seconds=600)
+    adapter = OpenIDAdapter(get_context(token))
+
+    with mock.patch.object(
+        OpenIDAdapter, "_renew_token_with_refresh_token"
+    ) as mock_renew:
+        adapter.start_background_refresh()
+        assert wait_until(lambda: not adapter._refresh_in_background, 5, 0.01)
+
+    mock_renew.assert_not_called()
+
+
+def test_client_sends_current_token_without_rebuild():
+    ctx = get_context(make_token("first"))
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.headers["authorization"])
+        return httpx.Response(200, json={"items": []})
+
+    client = MK8SClient(OpenIDAdapter(ctx), API_URL)
+    client.api = httpx.Client(
+        base_url=API_URL, auth=client.api.auth, transport=httpx.MockTransport(handler)
+    )
+
+    client.list_regions()
+    ctx.token = make_token("second")
+    client.list_regions()
+
+    assert seen == ["Bearer first", "Bearer second"]
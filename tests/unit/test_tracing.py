@@ -0,0 +1,105 @@
+import asyncio
+from unittest import mock
+
+import pytest
+from loguru import logger
+
+from mkcli.core import mk8s
+from mkcli.core.adapters import APIKeyAdapter
+from mkcli.core.cassette import Cassette, Interaction
+from mkcli.core.mk8s import AsyncMK8SClient, MK8SClient
+from mkcli.core.models import Context
+from mkcli.core.tracing import RequestTiming
+from mkcli.settings import APP_SETTINGS
+from tests.src.fake_api import FakeMK8SAPI, FakeMK8SServer
+
+
+def get_auth(api_url: str) -> APIKeyAdapter:
+    return APIKeyAdapter(
+        Context(
+            name="test_ctx",
+            client_id="test_client_id",
+            realm="test_realm",
+            scope="test_scope",
+            region="test_region",
+            mk8s_api_url=api_url,
+            identity_server_url="https://test.identity.server",
+            auth_type="api_key",
+            api_key="secret_api_key",
+        )
+    )
+
+
+@pytest.fixture
+def timings():
+    """RequestTiming of every request, from the structured loguru records"""
+    records: list[RequestTiming] = []
+    sink = logger.add(
+        lambda message: records.append(
+            RequestTiming(**message.record["extra"]["http"])
+        ),
+        level="DEBUG",
+        filter=lambda record: "http" in record["extra"],
+    )
+    mk8s.close_http_clients()
+    yield records
+    logger.remove(sink)
+    mk8s.close_http_clients()
+
+
+def test_requests_are_timed(timings):
+    with FakeMK8SServer(FakeMK8SAPI(clusters=2, latency=0.05)) as server:
+        client = MK8SClient(get_auth(server.api_url), server.api_url)
+        client.get_clusters()
+        client.get_cluster("cluster-1")
+
+    first, second = timings
+    assert (first.method, first.status) == ("GET", 200)
+    assert first.url.endswith("/cluster?organisationId=&orderBy=&region=")
+    assert first.reused is False and first.connect_ms is not None
+    assert second.reused is True and second.connect_ms is None
+    assert second.ttfb_ms >= 50
+    assert second.total_ms >= second.ttfb_ms
+    assert second.size == second.transferred > 0
+
+
+def test_verbose_output(timings, capsys):
+    with (
+        FakeMK8SServer() as server,
+        mock.patch.object(APP_SETTINGS, "verbose", True),
+    ):
+        MK8SClient(get_auth(server.api_url), server.api_url).get_cluster("cluster-0")
+
+    output = capsys.readouterr()
+    assert f"GET {server.api_url}/cluster/cluster-0 200 in " in output.err
+    assert "connection: new" in output.err
+    assert output.out == ""  # keeps --format json output parseable
+
+
+def test_async_requests_are_timed(timings):
+    async def run():
+        async with AsyncMK8SClient(get_auth(server.api_url), server.api_url) as client:
+            await asyncio.gather(
+                *(client.get_cluster(f"cluster-{i}") for i in range(3))
+            )
+
+    with FakeMK8SServer(FakeMK8SAPI(clusters=3)) as server:
+        asyncio.run(run())
+
+    assert len(timings) == 3
+    assert all(t.status == 200 and t.ttfb_ms is not None for t in timings)
+
+
+def test_replayed_requests_have_no_connection(timings, tmp_path):
+    cassette = Cassette(tmp_path / "cassette.jsonl")
+    cassette.record(
+        Interaction("GET", "/api/v1/region", 200, [], '{"items":[]}', False, 0.0)
+    )
+    url = "https://test.mk8s.api/api/v1"
+
+    with mock.patch.object(APP_SETTINGS, "transport", f"replay:{cassette.path}"):
+        MK8SClient(get_auth(url), url).list_regions()
+
+    (timing,) = timings
+    assert timing.reused is None
+    assert timing.connect_ms is timing.ttfb_ms is None
@@ -0,0 +1,205 @@
+import asyncio
+import email.utils
+import time
+
+import httpx
+import pytest
+
+from mkcli.core.adapters import APIKeyAdapter
+from mkcli.core.mk8s import APICallError, AsyncMK8SClient, MK8SClient
+from mkcli.core.models import Context
+from mkcli.core.transport import (
+    NO_RETRY_EXTENSION,
+    AsyncRetryTransport,
+    RetryPolicy,
+    RetryTransport,
+    retry_after_seconds,
+)
+
+URL: str = "https://test.mk8s.api/api/v1/cluster"
+
+
+class Responder:
+    """Mock transport handler returning given outcomes in order, then 200"""
+
+    def __init__(self, *outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = 0
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.calls += 1
+        outcome = self.outcomes.pop(0) if self.outcomes else 200
+        if isinstance(outcome, Exception):
+            raise outcome
+        if isinstance(outcome, httpx.Response):
+            return outcome
+        return httpx.Response(outcome, json={})
+
+
+def make_client(responder, **policy) -> tuple[httpx.Client, list[float]]:
+    sleeps = []
+    transport = RetryTransport(
+        httpx.MockTransport(responder),
+        policy=RetryPolicy(**{"attempts": 3, "backoff": 0.5, "budget": 30} | policy),
+        sleep=sleeps.append,
+    )
+    return httpx.Client(transport=transport), sleeps
+
+
+@pytest.mark.parametrize("status", [502, 503, 504])
+def test_gateway_errors_are_retried(status):
+    responder = Responder(status, status)
+    client, sleeps = make_client(responder)
+
+    assert client.get(URL).status_code == 200
+    assert responder.calls == 3
+    assert len(sleeps) == 2
+    assert 0 <= sleeps[0] <= 0.5 and 0 <= sleeps[1] <= 1.0  # full jitter
+
+
+def test_connection_errors_are_retried():
+    responder = Responder(httpx.ConnectError("reset"), httpx.ReadError("reset"))
+    client, _ = make_client(responder)
+
+    assert client.delete(URL).status_code == 200
+    assert responder.calls == 3
+
+
+def test_attempts_are_limited():
+    responder = Responder(503, 503, 503, 503, 503)
+    client, sleeps = make_client(responder, attempts=2)
+
+    assert client.get(URL).status_code == 503
+    assert responder.calls == 3
+
+
+def test_non_idempotent_requests_are_not_retried():
+    responder = Responder(503, httpx.ConnectError("reset"))
+    client, _ = make_client(responder)
+
+    assert client.post(URL, json={}).status_code == 503
+    with pytest.raises(httpx.ConnectError):
+        client.post(URL, json={})
+    assert responder.calls == 2
+
+
+def test_requests_can_opt_out_of_retries():
+    responder = Responder(504)
+    client, _ = make_client(responder)
+
+    response = client.put(URL, json={}, extensions={NO_RETRY_EXTENSION: True})
+    assert response.status_code == 504
+    assert responder.calls == 1
+
+
+def get_auth() -> APIKeyAdapter:
+    return APIKeyAdapter(
+        Context(
+            name="test_ctx",
+            client_id="test_client_id",
+            realm="test_realm",
+            scope="test_scope",
+            region="test_region",
+            identity_server_url="https://test.identity.server",
+            auth_type="api_key",
+            api_key="test_api_key",
+        )
+    )
+
+
+def test_backup_creation_is_not_retried():
+    """A gateway timeout may come after the backend created the backup"""
+    responder = Responder(504)
+    client = MK8SClient(get_auth(), URL)
+    client.api = httpx.Client(
+        base_url=URL,
+        transport=RetryTransport(
+            httpx.MockTransport(responder),
+            policy=RetryPolicy(attempts=3),
+            sleep=lambda delay: None,
+        ),
+    )
+
+    with pytest.raises(APICallError):
+        client.create_backup("cluster-0", {})
+    assert responder.calls == 1
+
+
+def test_async_backup_creation_is_not_retried():
+    responder = Responder(504)
+
+    async def sleep(delay: float) -> None: ...
+
+    async def run() -> None:
+        client = AsyncMK8SClient(get_auth(), URL)
+        client.api = httpx.AsyncClient(
+            base_url=URL,
+            transport=AsyncRetryTransport(
+                httpx.MockTransport(responder),
+                policy=RetryPolicy(attempts=3),
+                sleep=sleep,
+            ),
+        )
+        async with client:
+            await client.create_backup("cluster-0", {})
+
+    with pytest.raises(APICallError):
+        asyncio.run(run())
+    assert responder.calls == 1
+
+
+def test_other_errors_are_not_retried():
+    responder = Responder(500, 404)
+    client, sleeps = make_client(responder)
+
+    assert client.get(URL).status_code == 500
+    assert client.get(URL).status_code == 404
+    assert sleeps == []
+
+
+def test_retry_after_is_respected():
+    responder = Responder(httpx.Response(503, headers={"Retry-After": "2"}))
+    client, sleeps = make_client(responder)
+
+    assert client.put(URL, json={}).status_code == 200
+    assert sleeps == [2.0]
+
+
+def test_retry_budget_is_respected():
+    responder = Responder(
+        httpx.Response(503, headers={"Retry-After": "60"}), httpx.ConnectError("reset")
+    )
+    client, sleeps = make_client(responder, budget=10)
+
+    assert client.get(URL).status_code == 503
+    assert sleeps == []
+
+
+def test_retry_after_http_date():
+    retry_at = email.utils.formatdate(time.time() + 120, usegmt=True)
+    response = httpx.Response(503, headers={"Retry-After": retry_at})
+
+    assert 100 < retry_after_seconds(response) <= 120
+    assert retry_after_seconds(httpx.Response(503)) is None
+    assert (
+        retry_after_seconds(httpx.Response(503, headers={"Retry-After": "x"})) is None
+    )
+
+
+def test_async_transport_retries():
+    responder = Responder(504, httpx.ConnectError("reset"))
+    sleeps = []
+
+    async def sleep(delay: float) -> None:
+        sleeps.append(delay)
+
+    async def run() -> int:
+        transport = AsyncRetryTransport(
+            httpx.MockTransport(responder), policy=RetryPolicy(attempts=3), sleep=sleep
+        )
+        async with httpx.AsyncClient(transport=transport) as client:
+            return (await client.get(URL)).status_code
+
+    assert asyncio.run(run()) == 200
+    assert responder.calls == 3
+    assert len(sleeps) == 2